@@ -0,0 +1,239 @@
+import itertools
+
+import numpy as np
+
+from analytics.indicators import INDICATORS
+from analytics.risk import TRADING_DAYS, max_drawdown
+
+
+def indicator_values(series, name, params, cache=None):
+    """
+    One indicator's output columns over a series, vectorized.
+
+    Args:
+        cache: Optional dict reused across calls on the same series, so a
+            parameter sweep computes each distinct indicator only once
+    """
+    key = (name, tuple(sorted(params.items())))
+    if cache is not None and key in cache:
+        return cache[key]
+    values = list(INDICATORS[name](**params).compute(series).values())
+    if cache is not None:
+        cache[key] = values
+    return values
+
+
+def hold_between(entries, exits):
+    """
+    Exposure (0 or 1) of a rule that enters on `entries` and exits on `exits`.
+
+    The most recent event wins, carried forward without a Python loop; an
+    exit on the same bar as an entry takes precedence.
+    """
+    state = np.full(len(entries), np.nan)
+    state[entries] = 1.0
+    state[exits] = 0.0
+    index = np.where(~np.isnan(state), np.arange(len(state)), 0)
+    np.maximum.accumulate(index, out=index)
+    held = state[index]
+    return np.nan_to_num(held, nan=0.0)
+
+
+class Strategy:
+    """
+    A long-only signal rule over daily bars.
+
+    `positions` returns the exposure wanted at the close of every bar (0 for
+    flat, 1 for fully invested), computed from vectorized indicator columns.
+    """
+
+    name = ""
+    label = ""
+    defaults = {}
+    grid = {}  # Parameter values swept by default
+
+    def __init__(self, **params):
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown {self.name} parameters: {sorted(unknown)}")
+        self.params = {**self.defaults, **params}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.params})"
+
+    @classmethod
+    def valid(cls, params):
+        """Whether a parameter combination makes sense (e.g. fast period below slow)"""
+        return True
+
+    def positions(self, series, cache=None):
+        raise NotImplementedError
+
+
+class MovingAverageCrossover(Strategy):
+    """Invested while the fast moving average is above the slow one"""
+
+    name = "ma_crossover"
+    label = "MA Crossover"
+    defaults = {"fast": 20, "slow": 50, "kind": "sma"}
+    grid = {"fast": [5, 10, 15, 20, 30, 40, 50], "slow": [50, 75, 100, 150, 200], "kind": ["sma", "ema"]}
+
+    @classmethod
+    def valid(cls, params):
+        return params["fast"] < params["slow"]
+
+    def positions(self, series, cache=None):
+        kind = self.params["kind"]
+        fast, = indicator_values(series, kind, {"period": self.params["fast"]}, cache)
+        slow, = indicator_values(series, kind, {"period": self.params["slow"]}, cache)
+        with np.errstate(invalid="ignore"):
+            return (fast > slow).astype(np.float64)
+
+
+class RSIReversion(Strategy):
+    """Buys when RSI falls below `lower` and sells once it rises above `upper`"""
+
+    name = "rsi_reversion"
+    label = "RSI Reversion"
+    defaults = {"period": 14, "lower": 30, "upper": 70}
+    grid = {"period": [7, 14, 21], "lower": [20, 25, 30, 35], "upper": [60, 65, 70, 75, 80]}
+
+    @classmethod
+    def valid(cls, params):
+        return params["lower"] < params["upper"]
+
+    def positions(self, series, cache=None):
+        rsi, = indicator_values(series, "rsi", {"period": self.params["period"]}, cache)
+        with np.errstate(invalid="ignore"):
+            return hold_between(rsi < self.params["lower"], rsi > self.params["upper"])
+
+
+class MACDCrossover(Strategy):
+    """Invested while the MACD line is above its signal line"""
+
+    name = "macd_crossover"
+    label = "MACD Crossover"
+    defaults = {"fast": 12, "slow": 26, "signal": 9}
+    grid = {"fast": [8, 12, 16], "slow": [21, 26, 34], "signal": [5, 9, 13]}
+
+    @classmethod
+    def valid(cls, params):
+        return params["fast"] < params["slow"]
+
+    def positions(self, series, cache=None):
+        macd, signal, _ = indicator_values(series, "macd", self.params, cache)
+        with np.errstate(invalid="ignore"):
+            return (macd > signal).astype(np.float64)
+
+
+STRATEGIES = {cls.name: cls for cls in (MovingAverageCrossover, RSIReversion, MACDCrossover)}
+
+
+def param_grid(strategy_name, grid=None):
+    """Every valid combination of a strategy's parameter grid, as a list of dicts"""
+    strategy = STRATEGIES[strategy_name]
+    grid = grid or strategy.grid
+    names = list(grid)
+    combos = (dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names)))
+    return [{**strategy.defaults, **c} for c in combos if strategy.valid({**strategy.defaults, **c})]
+
+
+def backtest_positions(series, positions, cost_bps=5.0):
+    """
+    Simulate one or many exposure columns over the same bars at once.
+
+    The exposure decided at a bar's close is held over the next bar. Changing
+    exposure costs `cost_bps` basis points of the traded fraction. Position,
+    P&L, cost and every statistic are matrix operations over (bars x runs).
+
+    Args:
+        series: OHLCVSeries the positions were computed on
+        positions: (bars,) or (bars x runs) exposure wanted at each close
+        cost_bps: Commission and slippage per unit of turnover, in basis points
+
+    Returns:
+        dict with "equity" (bars x runs, growth of 1), "returns" (net per bar) and
+        "stats": {name: array per run} with total_return, cagr, volatility,
+        sharpe, max_drawdown, trades, win_rate and exposure
+    """
+    close = np.asarray(series.close, dtype=np.float64)
+    targets = np.asarray(positions, dtype=np.float64).reshape(len(close), -1)
+    bars, runs = targets.shape
+    previous = np.vstack([np.zeros((1, runs)), targets[:-1]])
+
+    market = np.zeros(bars)
+    if bars > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            market[1:] = np.nan_to_num(close[1:] / close[:-1] - 1.0)
+    turnover = np.abs(targets - previous)
+    net = previous * market[:, None] - turnover * cost_bps / 1e4
+    equity = np.cumprod(1.0 + net, axis=0)
+
+    # Round trips: number each entry, then sum log returns per (run, trip) while invested
+    entries = (targets > 0) & (previous <= 0)
+    trip = np.cumsum(entries, axis=0) * (previous > 0)
+    trip_count = int(trip.max()) + 1 if trip.size else 1
+    keys = (np.arange(runs) * trip_count + trip).ravel()
+    trip_returns = np.bincount(keys, weights=np.log1p(net).ravel(), minlength=runs * trip_count)
+    trip_returns = trip_returns.reshape(runs, trip_count)[:, 1:]
+    trades = entries.sum(axis=0)
+    wins = (trip_returns > 0).sum(axis=1)
+
+    years = max(bars - 1, 1) / TRADING_DAYS
+    std = net.std(axis=0, ddof=1) if bars > 2 else np.zeros(runs)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats = {
+            "total_return": equity[-1] - 1.0 if bars else np.zeros(runs),
+            "cagr": (equity[-1] ** (1.0 / years) - 1.0) if bars else np.zeros(runs),
+            "volatility": std * np.sqrt(TRADING_DAYS),
+            "sharpe": np.where(std > 0, net.mean(axis=0) / std * np.sqrt(TRADING_DAYS), np.nan),
+            "max_drawdown": max_drawdown(net) if bars else np.zeros(runs),
+            "trades": trades.astype(np.float64),
+            "win_rate": np.where(trades > 0, wins / trades, np.nan),
+            "exposure": (previous > 0).mean(axis=0) if bars else np.zeros(runs),
+        }
+    return {"equity": equity, "returns": net, "stats": stats}
+
+
+def run_backtest(series, strategy_name, params=None, cost_bps=5.0):
+    """
+    Backtest one parameter set, with the trades it made.
+
+    Returns:
+        dict with "strategy", "params", "stats" (floats), "equity" (growth of 1 per bar)
+        and "trades": list of {"time" (epoch ms), "side" ("buy"/"sell"), "price"}
+    """
+    strategy = STRATEGIES[strategy_name](**(params or {}))
+    targets = strategy.positions(series)
+    result = backtest_positions(series, targets, cost_bps)
+    previous = np.concatenate(([0.0], targets[:-1]))
+    changes = np.flatnonzero(targets != previous)
+    trades = [{"time": int(series.time[i]), "side": "buy" if targets[i] > previous[i] else "sell",
+               "price": float(series.close[i])} for i in changes]
+    return {
+        "strategy": strategy_name,
+        "params": strategy.params,
+        "stats": {name: float(values[0]) for name, values in result["stats"].items()},
+        "equity": result["equity"][:, 0],
+        "trades": trades,
+    }
+
+
+def sweep_chunk(ticker, series, strategy_name, param_list, cost_bps=5.0):
+    """
+    Backtest many parameter sets of one strategy on one ticker; runs in a worker process.
+
+    Indicators shared between parameter sets are computed once, and all sets
+    are simulated together as columns of one matrix.
+
+    Returns:
+        list of {"ticker", "params", **stats} dicts, one per parameter set
+    """
+    if not param_list or len(series) < 2:
+        return []
+    cache = {}
+    strategy = STRATEGIES[strategy_name]
+    targets = np.column_stack([strategy(**p).positions(series, cache) for p in param_list])
+    stats = backtest_positions(series, targets, cost_bps)["stats"]
+    return [{"ticker": ticker, "params": params, **{name: float(values[i]) for name, values in stats.items()}}
+            for i, params in enumerate(param_list)]
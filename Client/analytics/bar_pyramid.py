@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+MINUTE_MS = 60 * 1000
+DAY_MS = 24 * 60 * MINUTE_MS
+
+# Bar sizes from finest to coarsest, with the nominal length of one bar
+LEVELS = (
+    ("minute", MINUTE_MS),
+    ("5min", 5 * MINUTE_MS),
+    ("hour", 60 * MINUTE_MS),
+    ("day", DAY_MS),
+    ("week", 7 * DAY_MS),
+    ("month", 30 * DAY_MS),
+)
+
+# Each level is resampled from the finest coarser-or-equal level whose periods nest inside it
+# (weeks do not nest in months, so both are built from days)
+SOURCE_LEVEL = {"5min": "minute", "hour": "5min", "day": "hour", "week": "day", "month": "day"}
+
+
+def period_keys(time, level):
+    """Integer period number of every timestamp (epoch ms, UTC) at the given level"""
+    if level == "month":
+        return time.astype("datetime64[ms]").astype("datetime64[M]").astype(np.int64)
+    if level == "week":
+        # Day 0 (1970-01-01) was a Thursday; shift so weeks start on Monday
+        return (time // DAY_MS + 3) // 7
+    return time // dict(LEVELS)[level]
+
+
+def resample(series, level):
+    """Aggregate a series into bars of the given level, one per period that has data"""
+    if not len(series):
+        return series.aggregate(np.empty(0, dtype=np.int64), level)
+    keys = period_keys(series.time, level)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return series.aggregate(starts, level)
+
+
+def detect_level(series):
+    """The level of a series: its declared interval, else the one closest to its median bar spacing"""
+    if series.interval in dict(LEVELS):
+        return series.interval
+    if len(series) < 2:
+        return "day"
+    spacing = float(np.median(np.diff(series.time)))
+    finer = [name for name, length in LEVELS if length <= spacing * 1.5]
+    return finer[-1] if finer else LEVELS[0][0]
+
+
+class BarPyramid:
+    """
+    The same bars at every coarser resolution.
+
+    Built once from the base series: daily bars give day, week and month
+    levels; intraday bars also get 5-minute and hourly levels (and then the
+    daily ones). Each level is an OHLCVSeries produced with vectorized
+    reduceat aggregation.
+    """
+
+    def __init__(self, series):
+        base = detect_level(series)
+        names = [name for name, _ in LEVELS]
+        self.levels = OrderedDict([(base, series)])
+        for name in names[names.index(base) + 1:]:
+            source = SOURCE_LEVEL[name]
+            if source not in self.levels:
+                source = next(reversed(self.levels))
+            self.levels[name] = resample(self.levels[source], name)
+
+    @property
+    def base(self):
+        return next(iter(self.levels))
+
+    def __getitem__(self, level):
+        return self.levels[level]
+
+    def select(self, start=None, end=None, max_bars=1000):
+        """
+        Pick the level to draw for a visible time range.
+
+        Returns the finest level that shows at most `max_bars` bars between start
+        and end (epoch ms; None for open-ended), i.e. the coarsest level that still
+        fills the viewport with detail. Falls back to the coarsest level.
+
+        Returns:
+            (level name, OHLCVSeries)
+        """
+        for name, series in self.levels.items():
+            lo, hi = series.index_range(start, end)
+            if hi - lo <= max_bars:
+                return name, series
+        name = next(reversed(self.levels))
+        return name, self.levels[name]
+
+
+class PyramidCache:
+    """Process-wide LRU of pyramids, keyed by the identity of the base bars"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._pyramids = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get(self, series):
+        """Pyramid for a series, built on first use"""
+        key = (series.ticker, series.interval, len(series), series.first_time, series.last_time,
+               float(series.close[-1]) if len(series) else None)
+        with self._lock:
+            pyramid = self._pyramids.get(key)
+            if pyramid is not None:
+                self._pyramids.move_to_end(key)
+                return pyramid
+
+        pyramid = BarPyramid(series)
+        with self._lock:
+            self._pyramids[key] = pyramid
+            while len(self._pyramids) > self.max_entries:
+                self._pyramids.popitem(last=False)
+        return pyramid
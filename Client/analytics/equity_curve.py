@@ -0,0 +1,249 @@
+import datetime
+
+import numpy as np
+
+DAY_MS = 24 * 60 * 60 * 1000
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def trade_day(trade):
+    """Epoch day number of a trade's date ("yyyy-MM-dd..." string)"""
+    return (datetime.date.fromisoformat(trade["date"][:10]) - EPOCH.date()).days
+
+
+def trade_key(trade):
+    """Identity of a trade; the server's log Id keeps otherwise identical trades apart"""
+    return (trade.get("id"), trade["date"], trade["symbol"], int(trade["type"]), float(trade["quantity"]),
+            float(trade["price"]))
+
+
+def signed_quantity(trade):
+    """Shares added to the position: buys (type 0) add, sells (type 1) remove"""
+    return float(trade["quantity"]) * (1.0 if int(trade["type"]) == 0 else -1.0)
+
+
+def weekdays(first_day, last_day):
+    """Epoch day numbers of the weekdays in [first_day, last_day]"""
+    days = np.arange(first_day, last_day + 1, dtype=np.int64)
+    # Day 0 (1970-01-01) was a Thursday, so (day + 3) % 7 is 0 on Mondays
+    return days[(days + 3) % 7 < 5]
+
+
+def forward_fill(grid, days, values):
+    """Value of the latest entry on or before each grid day, NaN before the first entry"""
+    if not len(days):
+        return np.full(len(grid), np.nan)
+    index = np.searchsorted(days, grid, side="right") - 1
+    return np.where(index >= 0, values[np.maximum(index, 0)], np.nan)
+
+
+class EquityCurve:
+    """
+    Daily portfolio value reconstructed by replaying the trade log.
+
+    For each weekday from the first trade on, the value is the sum of every
+    position times that symbol's close (carried forward over missing days),
+    plus cash. Positions and cash are matrices built with cumulative sums,
+    one row per symbol and one column per day.
+
+    Cash is anchored at the current balance and walked back through the trade
+    cash flows. Deposits and withdrawals are not in the trade log, so they
+    show up only from the day a balance change is applied.
+
+    After the first build the curve is updated in place. A new trade adjusts
+    only the days from its date on. New or revised closes adjust only the
+    days whose price changed.
+    """
+
+    def __init__(self):
+        self.days = np.empty(0, dtype=np.int64)  # Epoch day numbers (weekdays, plus any trade day)
+        self.symbols = {}  # Symbol -> row
+        self.positions = np.zeros((0, 0))  # Shares held per symbol per day
+        self.prices = np.zeros((0, 0))  # Close per symbol per day, carried forward
+        self.cash = np.empty(0)
+        self.equity = np.empty(0)
+        self.cash_balance = 0.0  # Current balance the cash column is anchored to
+        self.trade_keys = []  # Trades replayed so far, in order
+        self._closes = {}  # Symbol -> (close days, closes) last supplied
+        self._trade_prices = {}  # Symbol -> (trade days, trade prices), fallback before closes exist
+
+    def __len__(self):
+        return len(self.days)
+
+    # ------------------------------------------------------------------ building
+
+    def rebuild(self, trades, closes, cash_balance, end_day=None):
+        """
+        Replay the whole trade log.
+
+        Args:
+            trades: Trades in the API's dict format (symbol, date, type, quantity, price)
+            closes: Symbol -> OHLCVSeries of daily bars
+            cash_balance: Current cash balance
+            end_day: Last epoch day of the curve, defaults to today
+        """
+        trades = sorted(trades, key=lambda t: t["date"])
+        self.trade_keys = [trade_key(t) for t in trades]
+        self.cash_balance = float(cash_balance)
+        self._closes = {s: self._close_columns(c) for s, c in closes.items()}
+        self._trade_prices = {}
+        if not trades:
+            self.__init__()
+            self.cash_balance = float(cash_balance)
+            return
+
+        trade_days = np.fromiter((trade_day(t) for t in trades), dtype=np.int64, count=len(trades))
+        end_day = max(end_day if end_day is not None else self._today(), int(trade_days.max()))
+        self.days = np.union1d(weekdays(int(trade_days.min()), end_day), trade_days)
+
+        symbols = sorted({t["symbol"] for t in trades})
+        self.symbols = {s: i for i, s in enumerate(symbols)}
+        rows = np.fromiter((self.symbols[t["symbol"]] for t in trades), dtype=np.int64, count=len(trades))
+        columns = np.searchsorted(self.days, trade_days)
+        quantities = np.fromiter((signed_quantity(t) for t in trades), dtype=np.float64, count=len(trades))
+        prices = np.fromiter((float(t["price"]) for t in trades), dtype=np.float64, count=len(trades))
+
+        # Position changes per (symbol, day), accumulated over days
+        deltas = np.zeros((len(symbols), len(self.days)))
+        np.add.at(deltas, (rows, columns), quantities)
+        self.positions = np.cumsum(deltas, axis=1)
+
+        # Buying spends cash, selling brings it in; walk back from the current balance
+        flows = np.zeros(len(self.days))
+        np.add.at(flows, columns, -quantities * prices)
+        self.cash = self.cash_balance - (flows.sum() - np.cumsum(flows))
+
+        for symbol, row in self.symbols.items():
+            mask = rows == row
+            self._trade_prices[symbol] = (trade_days[mask], prices[mask])
+        self.prices = np.vstack([self._price_row(s) for s in symbols])
+        self.equity = (self.positions * self.prices).sum(axis=0) + self.cash
+
+    def sync(self, trades, closes, cash_balance):
+        """
+        Bring the curve up to date, incrementally when possible.
+
+        If the trades replayed so far are a prefix of `trades`, only the new
+        trades are applied; otherwise the log is replayed from scratch. Then
+        closes and the cash balance are applied where they changed.
+        """
+        keys = [trade_key(t) for t in sorted(trades, key=lambda t: t["date"])]
+        replayed = len(self.trade_keys)
+        if not len(self) or keys[:replayed] != self.trade_keys:
+            self.rebuild(trades, closes, cash_balance)
+            return
+
+        self.extend_to(self._today())
+        by_key = {trade_key(t): t for t in trades}
+        for key in keys[replayed:]:
+            self.add_trade(by_key[key])
+        for symbol, series in closes.items():
+            self.update_closes(symbol, series)
+        self.set_cash_balance(cash_balance)
+
+    # ------------------------------------------------------------------ incremental updates
+
+    def add_trade(self, trade):
+        """Apply one trade to the days from its date on"""
+        day = trade_day(trade)
+        self.extend_to(day, include_day=True)
+        symbol, quantity, price = trade["symbol"], signed_quantity(trade), float(trade["price"])
+        if symbol not in self.symbols:
+            self._add_symbol(symbol)
+        row = self.symbols[symbol]
+
+        trade_days, trade_prices = self._trade_prices.get(symbol, (np.empty(0, np.int64), np.empty(0)))
+        self._trade_prices[symbol] = (np.append(trade_days, day), np.append(trade_prices, price))
+        self._refresh_prices(row, symbol)
+
+        start = int(np.searchsorted(self.days, day))
+        flow = -quantity * price
+        self.positions[row, start:] += quantity
+        self.cash[start:] += flow
+        self.equity[start:] += quantity * self.prices[row, start:] + flow
+        self.cash_balance += flow
+        self.trade_keys.append(trade_key(trade))
+
+    def update_closes(self, symbol, series):
+        """Apply new or revised closes for a symbol, touching only the days whose price changed"""
+        if not len(series):
+            return
+        columns = self._close_columns(series)
+        previous = self._closes.get(symbol)
+        if previous is not None and np.array_equal(previous[0], columns[0]) and np.array_equal(
+                previous[1], columns[1]):
+            return
+        self._closes[symbol] = columns
+        self.extend_to(int(columns[0][-1]))
+        if symbol in self.symbols:
+            self._refresh_prices(self.symbols[symbol], symbol)
+
+    def set_cash_balance(self, cash_balance, day=None):
+        """Apply a change in the cash balance not explained by trades (deposit/withdrawal) from `day` on"""
+        delta = float(cash_balance) - self.cash_balance
+        self.cash_balance = float(cash_balance)
+        if not delta or not len(self):
+            return
+        day = self._today() if day is None else day
+        start = min(int(np.searchsorted(self.days, day)), len(self) - 1)
+        self.cash[start:] += delta
+        self.equity[start:] += delta
+
+    def extend_to(self, day, include_day=False):
+        """Append weekdays up to `day` (and `day` itself if asked), carrying positions, prices and cash forward"""
+        if not len(self) or day <= self.days[-1]:
+            return
+        new_days = weekdays(int(self.days[-1]) + 1, day)
+        if include_day and day not in new_days:
+            new_days = np.append(new_days, day)
+        count = len(new_days)
+        if not count:
+            return
+        self.days = np.concatenate([self.days, new_days])
+        self.positions = np.hstack([self.positions, np.repeat(self.positions[:, -1:], count, axis=1)])
+        self.prices = np.hstack([self.prices, np.repeat(self.prices[:, -1:], count, axis=1)])
+        self.cash = np.concatenate([self.cash, np.repeat(self.cash[-1:], count)])
+        self.equity = np.concatenate([self.equity, np.repeat(self.equity[-1:], count)])
+        for symbol, row in self.symbols.items():
+            if symbol in self._closes:
+                self._refresh_prices(row, symbol, start=len(self.days) - count)
+
+    def _add_symbol(self, symbol):
+        self.symbols[symbol] = len(self.symbols)
+        self.positions = np.vstack([self.positions, np.zeros((1, len(self.days)))])
+        self.prices = np.vstack([self.prices, np.zeros((1, len(self.days)))])
+
+    def _refresh_prices(self, row, symbol, start=0):
+        """Recompute one symbol's price row from `start` and adjust equity by the change"""
+        new = self._price_row(symbol)[start:]
+        old = self.prices[row, start:]
+        changed = np.flatnonzero(new != old) + start
+        if len(changed):
+            self.equity[changed] += self.positions[row, changed] * (new[changed - start] - old[changed - start])
+            self.prices[row, changed] = new[changed - start]
+
+    # ------------------------------------------------------------------ helpers
+
+    @staticmethod
+    def _close_columns(series):
+        return series.time // DAY_MS, series.close
+
+    @staticmethod
+    def _today():
+        return (datetime.date.today() - EPOCH.date()).days
+
+    def _price_row(self, symbol):
+        """Closes carried forward over the grid; trade prices fill in where no close is known yet"""
+        row = forward_fill(self.days, *self._closes.get(symbol, (np.empty(0), np.empty(0))))
+        missing = np.isnan(row)
+        if missing.any() and symbol in self._trade_prices:
+            row[missing] = forward_fill(self.days, *self._trade_prices[symbol])[missing]
+        return np.nan_to_num(row)
+
+    def points(self, since=None):
+        """(datetime, portfolio value) pairs, optionally only from a datetime on"""
+        start = 0
+        if since is not None:
+            start = int(np.searchsorted(self.days, (since.date() - EPOCH.date()).days))
+        return [(EPOCH + datetime.timedelta(days=int(d)), float(v))
+                for d, v in zip(self.days[start:], self.equity[start:])]
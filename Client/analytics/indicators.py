@@ -0,0 +1,494 @@
+import copy
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+import pandas as pd
+
+
+def _ewm(values, alpha):
+    """Exponentially weighted mean seeded with the first value (pandas adjust=False)"""
+    if not len(values):
+        return np.empty(0)
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy(copy=True)
+
+
+def _rolling_sum(values, period):
+    """Trailing sums over `period` values, aligned to the last value of each window (NaN before)"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        sums = np.cumsum(values)
+        out[period - 1:] = sums[period - 1:] - np.concatenate(([0.0], sums[:-period]))
+    return out
+
+
+class Indicator:
+    """
+    A technical indicator over OHLCV bars.
+
+    `compute` evaluates the whole series at once with NumPy and leaves the
+    indicator primed at the last bar; `update` then advances it by a single
+    appended bar in O(1). Both paths produce the same values, NaN during the
+    warm-up period.
+    """
+
+    name = ""
+    outputs = ()  # Output column names, formatted with the parameters
+    defaults = {}
+
+    def __init__(self, **params):
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown {self.name} parameters: {sorted(unknown)}")
+        self.params = {**self.defaults, **params}
+        self.reset()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.params})"
+
+    @property
+    def columns(self):
+        return tuple(column.format(**self.params) for column in self.outputs)
+
+    def reset(self):
+        """Forget all bars seen so far"""
+        raise NotImplementedError
+
+    def compute(self, series):
+        """Return {column: array aligned with series.time} and prime the incremental state"""
+        raise NotImplementedError
+
+    def update(self, time, open, high, low, close, volume):
+        """Advance by one bar and return its output values as a tuple"""
+        raise NotImplementedError
+
+
+class SMA(Indicator):
+    name = "sma"
+    outputs = ("SMA {period}",)
+    defaults = {"period": 50}
+
+    def reset(self):
+        self._window = deque(maxlen=self.params["period"])
+        self._total = 0.0
+
+    def compute(self, series):
+        period = self.params["period"]
+        self.reset()
+        self._window.extend(series.close[-period:])
+        self._total = float(sum(self._window))
+        return {self.columns[0]: _rolling_sum(series.close, period) / period}
+
+    def update(self, time, open, high, low, close, volume):
+        period = self.params["period"]
+        if len(self._window) == period:
+            self._total -= self._window[0]
+        self._window.append(close)
+        self._total += close
+        return (self._total / period if len(self._window) == period else np.nan,)
+
+
+class EMA(Indicator):
+    name = "ema"
+    outputs = ("EMA {period}",)
+    defaults = {"period": 20}
+
+    def reset(self):
+        self._value = np.nan
+        self._count = 0
+
+    @property
+    def _alpha(self):
+        return 2.0 / (self.params["period"] + 1)
+
+    def compute(self, series):
+        values = _ewm(series.close, self._alpha)
+        self._value = float(values[-1]) if len(values) else np.nan
+        self._count = len(values)
+        values[:self.params["period"] - 1] = np.nan
+        return {self.columns[0]: values}
+
+    def update(self, time, open, high, low, close, volume):
+        self._value = close if self._count == 0 else self._value + self._alpha * (close - self._value)
+        self._count += 1
+        return (self._value if self._count >= self.params["period"] else np.nan,)
+
+
+class RSI(Indicator):
+    """Relative Strength Index with Wilder smoothing"""
+
+    name = "rsi"
+    outputs = ("RSI {period}",)
+    defaults = {"period": 14}
+
+    def reset(self):
+        self._prev_close = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0  # Price changes seen
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        avg_gain, avg_loss = np.asarray(avg_gain, dtype=np.float64), np.asarray(avg_loss, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+    def compute(self, series):
+        period = self.params["period"]
+        self.reset()
+        out = np.full(len(series), np.nan)
+        if not len(series):
+            return {self.columns[0]: out}
+
+        change = np.diff(series.close)
+        avg_gain = _ewm(np.clip(change, 0, None), 1.0 / period)
+        avg_loss = _ewm(np.clip(-change, 0, None), 1.0 / period)
+        out[1:] = self._rsi(avg_gain, avg_loss)
+        out[:period] = np.nan
+
+        self._prev_close = float(series.close[-1])
+        self._count = len(change)
+        if self._count:
+            self._avg_gain, self._avg_loss = float(avg_gain[-1]), float(avg_loss[-1])
+        return {self.columns[0]: out}
+
+    def update(self, time, open, high, low, close, volume):
+        period = self.params["period"]
+        if self._prev_close is None:
+            self._prev_close = close
+            return (np.nan,)
+        change = close - self._prev_close
+        self._prev_close = close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self._count == 0:
+            self._avg_gain, self._avg_loss = gain, loss
+        else:
+            self._avg_gain += (gain - self._avg_gain) / period
+            self._avg_loss += (loss - self._avg_loss) / period
+        self._count += 1
+        if self._count < period:
+            return (np.nan,)
+        return (float(self._rsi(self._avg_gain, self._avg_loss)),)
+
+
+class MACD(Indicator):
+    name = "macd"
+    outputs = ("MACD", "MACD Signal", "MACD Hist")
+    defaults = {"fast": 12, "slow": 26, "signal": 9}
+
+    def reset(self):
+        self._fast = self._slow = self._signal = np.nan
+        self._count = 0
+        self._signal_count = 0
+
+    def _alpha(self, key):
+        return 2.0 / (self.params[key] + 1)
+
+    def compute(self, series):
+        slow, signal = self.params["slow"], self.params["signal"]
+        self.reset()
+        count = len(series)
+        line = np.full(count, np.nan)
+        signal_line = np.full(count, np.nan)
+        if count:
+            fast_ema = _ewm(series.close, self._alpha("fast"))
+            slow_ema = _ewm(series.close, self._alpha("slow"))
+            self._fast, self._slow, self._count = float(fast_ema[-1]), float(slow_ema[-1]), count
+            line[slow - 1:] = (fast_ema - slow_ema)[slow - 1:]
+            if count >= slow:
+                # The signal line starts once the MACD line itself is defined
+                smoothed = _ewm(line[slow - 1:], self._alpha("signal"))
+                self._signal, self._signal_count = float(smoothed[-1]), len(smoothed)
+                smoothed[:signal - 1] = np.nan
+                signal_line[slow - 1:] = smoothed
+        return dict(zip(self.columns, (line, signal_line, line - signal_line)))
+
+    def update(self, time, open, high, low, close, volume):
+        if self._count == 0:
+            self._fast = self._slow = close
+        else:
+            self._fast += self._alpha("fast") * (close - self._fast)
+            self._slow += self._alpha("slow") * (close - self._slow)
+        self._count += 1
+        if self._count < self.params["slow"]:
+            return np.nan, np.nan, np.nan
+
+        line = self._fast - self._slow
+        if self._signal_count == 0:
+            self._signal = line
+        else:
+            self._signal += self._alpha("signal") * (line - self._signal)
+        self._signal_count += 1
+        if self._signal_count < self.params["signal"]:
+            return line, np.nan, np.nan
+        return line, self._signal, line - self._signal
+
+
+class BollingerBands(Indicator):
+    name = "bollinger"
+    outputs = ("BB Mid {period}", "BB Upper {period}", "BB Lower {period}")
+    defaults = {"period": 20, "width": 2.0}
+
+    def reset(self):
+        self._window = deque(maxlen=self.params["period"])
+        self._total = 0.0
+        self._total_sq = 0.0
+
+    def _bands(self, mean, mean_sq):
+        std = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+        return mean, mean + self.params["width"] * std, mean - self.params["width"] * std
+
+    def compute(self, series):
+        period = self.params["period"]
+        self.reset()
+        self._window.extend(series.close[-period:])
+        self._total = float(sum(self._window))
+        self._total_sq = float(sum(x * x for x in self._window))
+        mean = _rolling_sum(series.close, period) / period
+        mean_sq = _rolling_sum(series.close * series.close, period) / period
+        return dict(zip(self.columns, self._bands(mean, mean_sq)))
+
+    def update(self, time, open, high, low, close, volume):
+        period = self.params["period"]
+        if len(self._window) == period:
+            oldest = self._window[0]
+            self._total -= oldest
+            self._total_sq -= oldest * oldest
+        self._window.append(close)
+        self._total += close
+        self._total_sq += close * close
+        if len(self._window) < period:
+            return np.nan, np.nan, np.nan
+        return tuple(float(v) for v in self._bands(self._total / period, self._total_sq / period))
+
+
+class ATR(Indicator):
+    """Average True Range with Wilder smoothing"""
+
+    name = "atr"
+    outputs = ("ATR {period}",)
+    defaults = {"period": 14}
+
+    def reset(self):
+        self._prev_close = None
+        self._value = np.nan
+        self._count = 0
+
+    def compute(self, series):
+        period = self.params["period"]
+        self.reset()
+        if not len(series):
+            return {self.columns[0]: np.empty(0)}
+        prev_close = np.concatenate(([series.close[0]], series.close[:-1]))
+        true_range = np.maximum(series.high, prev_close) - np.minimum(series.low, prev_close)
+        true_range[0] = series.high[0] - series.low[0]
+        values = _ewm(true_range, 1.0 / period)
+        self._prev_close, self._value, self._count = float(series.close[-1]), float(values[-1]), len(values)
+        values[:period - 1] = np.nan
+        return {self.columns[0]: values}
+
+    def update(self, time, open, high, low, close, volume):
+        period = self.params["period"]
+        if self._prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high, self._prev_close) - min(low, self._prev_close)
+        self._prev_close = close
+        self._value = true_range if self._count == 0 else self._value + (true_range - self._value) / period
+        self._count += 1
+        return (self._value if self._count >= period else np.nan,)
+
+
+class VWAP(Indicator):
+    """Volume-weighted average of the typical price, cumulative from the first bar"""
+
+    name = "vwap"
+    outputs = ("VWAP",)
+    defaults = {}
+
+    def reset(self):
+        self._price_volume = 0.0
+        self._volume = 0.0
+
+    def compute(self, series):
+        typical = (series.high + series.low + series.close) / 3.0
+        price_volume = np.cumsum(typical * series.volume)
+        volume = np.cumsum(series.volume)
+        self._price_volume = float(price_volume[-1]) if len(series) else 0.0
+        self._volume = float(volume[-1]) if len(series) else 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {self.columns[0]: np.where(volume > 0, price_volume / volume, np.nan)}
+
+    def update(self, time, open, high, low, close, volume):
+        self._price_volume += (high + low + close) / 3.0 * volume
+        self._volume += volume
+        return (self._price_volume / self._volume if self._volume > 0 else np.nan,)
+
+
+INDICATORS = {cls.name: cls for cls in (SMA, EMA, RSI, MACD, BollingerBands, ATR, VWAP)}
+
+
+class _Column:
+    """Append-only float64 buffer with amortized O(1) appends"""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self._data = np.empty(max(16, 2 * len(values)))
+        self._data[:len(values)] = values
+        self._length = len(values)
+
+    def __len__(self):
+        return self._length
+
+    def append(self, value):
+        if self._length == len(self._data):
+            grown = np.empty(2 * len(self._data))
+            grown[:self._length] = self._data[:self._length]
+            self._data = grown
+        self._data[self._length] = value
+        self._length += 1
+
+    def truncate(self, length):
+        self._length = min(self._length, length)
+
+    def view(self, length=None):
+        return self._data[:self._length if length is None else length]
+
+
+class _Run:
+    """Cached outputs of one indicator over one ticker's bars"""
+
+    def __init__(self, indicator, time, columns, last_bar, checkpoint):
+        self.indicator = indicator  # Primed through the last bar
+        self.checkpoint = checkpoint  # Copy primed through the bar before the last one
+        self.time = _Column(time)
+        self.columns = {name: _Column(values) for name, values in columns.items()}
+        self.last_bar = last_bar
+
+    def __len__(self):
+        return len(self.time)
+
+    def append(self, time, values):
+        self.time.append(time)
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+
+    def truncate(self, length):
+        self.time.truncate(length)
+        for column in self.columns.values():
+            column.truncate(length)
+
+    def views(self, length=None):
+        return {name: column.view(length) for name, column in self.columns.items()}
+
+
+class IndicatorEngine:
+    """
+    Computes indicators over OHLCVSeries and caches the results.
+
+    Results are cached per (ticker, bar interval, first bar, indicator,
+    params). When the same ticker comes back with bars appended, only the new
+    bars are fed through the indicator's O(1) update; if the last bar was
+    revised (today's bar while the market is open) the indicator rolls back to
+    its checkpoint first. A request ending earlier than the cached run is served as a view.
+    Bars before the last cached one are assumed not to change.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide engine, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def create(name, **params):
+        """Instantiate an indicator by name (see INDICATORS)"""
+        try:
+            return INDICATORS[name](**params)
+        except KeyError:
+            raise ValueError(f"Unknown indicator: {name}") from None
+
+    def compute(self, series, name, **params):
+        """
+        Evaluate an indicator over a series.
+
+        Args:
+            series: OHLCVSeries to evaluate
+            name: Indicator name, a key of INDICATORS
+            **params: Indicator parameters, defaults are used for the rest
+
+        Returns:
+            dict mapping each output column name to an array aligned with series.time
+        """
+        indicator = self.create(name, **params)
+        if not len(series):
+            return {column: np.empty(0) for column in indicator.columns}
+
+        key = (series.ticker, series.interval, series.first_time, name, tuple(sorted(indicator.params.items())))
+        with self._lock:
+            run = self._runs.get(key)
+            if run is not None:
+                self._runs.move_to_end(key)
+                columns = self._extend(run, series)
+                if columns is not None:
+                    return columns
+
+            run = self._full_run(indicator, series)
+            self._runs[key] = run
+            while len(self._runs) > self.max_entries:
+                self._runs.popitem(last=False)
+            return run.views()
+
+    @staticmethod
+    def _bar(series, index):
+        return tuple(float(c[index]) for c in series.columns())
+
+    def _full_run(self, indicator, series):
+        """Vectorized pass over all but the last bar, then one incremental step for the last"""
+        head = series.iloc(0, len(series) - 1)
+        columns = indicator.compute(head)
+        checkpoint = copy.deepcopy(indicator)
+        last_bar = self._bar(series, -1)
+        run = _Run(indicator, head.time, columns, last_bar, checkpoint)
+        run.append(series.time[-1], indicator.update(series.time[-1], *last_bar))
+        return run
+
+    def _extend(self, run, series):
+        """Bring a cached run up to date with `series`, or return None if it no longer lines up"""
+        cached, count = len(run), len(series)
+        times = run.time.view()
+        if count < cached:
+            # Narrower range with the same start: a prefix of the cached run
+            return run.views(count) if series.time[-1] == times[count - 1] else None
+        if series.time[cached - 1] != times[cached - 1]:
+            return None
+
+        start = cached
+        if self._bar(series, cached - 1) != run.last_bar:
+            # The last bar was revised (e.g. today's bar): roll back and replay it
+            run.indicator = copy.deepcopy(run.checkpoint)
+            run.truncate(cached - 1)
+            start = cached - 1
+
+        for index in range(start, count):
+            bar = self._bar(series, index)
+            if index == count - 1:
+                run.checkpoint = copy.deepcopy(run.indicator)
+                run.last_bar = bar
+            run.append(series.time[index], run.indicator.update(series.time[index], *bar))
+        return run.views()
+
+    def clear(self):
+        with self._lock:
+            self._runs.clear()
@@ -0,0 +1,104 @@
+import numpy as np
+
+METHODS = ("bootstrap", "normal")
+
+
+def simulation_inputs(returns, method):
+    """
+    What a shard needs to draw daily log returns with `method`.
+
+    Args:
+        returns: (days x holdings) historical daily simple returns
+        method: "bootstrap" resamples whole historical days, keeping the
+            cross-sectional correlation as it was; "normal" draws from a
+            multivariate normal with the historical mean and covariance
+
+    Returns:
+        tuple passed on to simulate_shard
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown simulation method: {method}")
+    log_returns = np.log1p(np.asarray(returns, dtype=np.float64))
+    if method == "bootstrap":
+        return method, log_returns
+    mean = log_returns.mean(axis=0)
+    covariance = np.atleast_2d(np.cov(log_returns, rowvar=False))
+    # Small ridge so a singular covariance (e.g. duplicated series) still factorizes
+    ridge = 1e-12 * max(float(np.trace(covariance)), 1e-12)
+    cholesky = np.linalg.cholesky(covariance + ridge * np.eye(len(covariance)))
+    return method, (mean, cholesky)
+
+
+def simulate_shard(inputs, values, horizons, paths, seed, batch_paths=50_000):
+    """
+    Simulate buy-and-hold portfolio values; runs in a worker process.
+
+    Each path compounds every holding's log return day by day, so the weights
+    drift with the prices as they would for a portfolio that is not traded.
+    Paths are simulated in batches of `batch_paths` to bound memory.
+
+    Args:
+        inputs: Result of simulation_inputs
+        values: Current market value of each holding
+        horizons: Trading-day horizons to record, e.g. (1, 10)
+        paths: Number of paths in this shard
+        seed: Seed of this shard's random generator (shards must use distinct seeds)
+        batch_paths: Paths simulated at once
+
+    Returns:
+        dict: horizon -> float32 array of the portfolio value at that horizon, one per path
+    """
+    method, data = inputs
+    values = np.asarray(values, dtype=np.float64)
+    horizons = sorted(set(horizons))
+    rng = np.random.default_rng(seed)
+    results = {h: np.empty(paths, dtype=np.float32) for h in horizons}
+
+    for start in range(0, paths, batch_paths):
+        count = min(batch_paths, paths - start)
+        cumulative = np.zeros((count, len(values)))
+        for day in range(1, horizons[-1] + 1):
+            if method == "bootstrap":
+                cumulative += data[rng.integers(0, len(data), count)]
+            else:
+                mean, cholesky = data
+                cumulative += mean + rng.standard_normal((count, len(mean))) @ cholesky.T
+            if day in results:
+                results[day][start:start + count] = np.exp(cumulative) @ values
+    return results
+
+
+def summarize(initial_value, terminal_values, confidence=(0.95, 0.99), bins=50):
+    """
+    VaR, CVaR and the value distribution at each horizon.
+
+    Args:
+        initial_value: Portfolio value today
+        terminal_values: horizon -> simulated portfolio values
+        confidence: Confidence levels to report VaR and CVaR at
+        bins: Histogram bins of the value distribution
+
+    Returns:
+        dict: horizon -> {"var": {level: loss}, "cvar": {level: loss},
+        "percentiles": {p: value}, "histogram": (counts, edges), "mean": value,
+        "paths": count}. Losses are positive amounts of money.
+    """
+    summary = {}
+    for horizon, values in terminal_values.items():
+        values = np.asarray(values, dtype=np.float64)
+        losses = initial_value - values
+        var, cvar = {}, {}
+        for level in confidence:
+            var[level] = float(np.quantile(losses, level))
+            tail = losses[losses >= var[level]]
+            cvar[level] = float(tail.mean()) if len(tail) else var[level]
+        percentiles = (1, 5, 25, 50, 75, 95, 99)
+        summary[horizon] = {
+            "var": var,
+            "cvar": cvar,
+            "percentiles": dict(zip(percentiles, np.percentile(values, percentiles).tolist())),
+            "histogram": np.histogram(values, bins=bins),
+            "mean": float(values.mean()),
+            "paths": len(values),
+        }
+    return summary
@@ -0,0 +1,204 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+
+def to_epoch_ms(value):
+    """Convert a date, datetime, "yyyy-MM-dd" string or epoch-ms number to epoch milliseconds (UTC)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value[:10])
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return int(value.timestamp() * 1000)
+    if isinstance(value, datetime.date):
+        return int(datetime.datetime(value.year, value.month, value.day,
+                                     tzinfo=datetime.timezone.utc).timestamp() * 1000)
+    raise TypeError(f"Cannot convert {value!r} to epoch milliseconds")
+
+
+def _is_date_only(value):
+    """True for a date or "yyyy-MM-dd" string, i.e. a bound that names a whole day"""
+    if isinstance(value, str):
+        return len(value) <= 10
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+
+class OHLCVSeries:
+    """
+    Columnar OHLCV bars for one ticker.
+
+    Bars are stored as contiguous NumPy arrays sorted by time: `time` holds
+    int64 epoch milliseconds and open/high/low/close/volume are float64.
+    Slicing by time range returns views over the same buffers, so charts,
+    indicators and analytics can share one copy of the data. `interval`
+    names the bar size ("minute", "day", "week", ...) when it is known.
+    """
+
+    COLUMNS = ("open", "high", "low", "close", "volume")
+
+    def __init__(self, time, open, high, low, close, volume, ticker=None, interval=None):
+        self.ticker = ticker
+        self.interval = interval
+        self.time = np.asarray(time, dtype=np.int64)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+
+    @classmethod
+    def empty(cls, ticker=None, interval=None):
+        return cls(*(np.empty(0) for _ in range(6)), ticker=ticker, interval=interval)
+
+    @classmethod
+    def from_polygon(cls, results, ticker=None, interval=None):
+        """
+        Build a series from Polygon aggregate results (dicts with t, o, h, l, c, v).
+
+        Each column is filled straight into a preallocated array; bars are sorted
+        by time if the input is not already in order.
+        """
+        results = results or []
+        count = len(results)
+
+        def column(key, dtype):
+            return np.fromiter((r[key] for r in results), dtype=dtype, count=count)
+
+        series = cls(column("t", np.int64), column("o", np.float64), column("h", np.float64),
+                     column("l", np.float64), column("c", np.float64),
+                     np.fromiter((r.get("v", 0.0) for r in results), dtype=np.float64, count=count),
+                     ticker=ticker, interval=interval)
+        if count > 1 and np.any(np.diff(series.time) < 0):
+            series = series.take(np.argsort(series.time, kind="stable"))
+        return series
+
+    def __len__(self):
+        return len(self.time)
+
+    def __repr__(self):
+        if not len(self):
+            return f"OHLCVSeries({self.ticker!r}, empty)"
+        return f"OHLCVSeries({self.ticker!r}, {len(self)} bars, {self.first_time}..{self.last_time})"
+
+    @property
+    def first_time(self):
+        return int(self.time[0]) if len(self) else None
+
+    @property
+    def last_time(self):
+        return int(self.time[-1]) if len(self) else None
+
+    def columns(self):
+        """The five value columns as a tuple of arrays, in COLUMNS order"""
+        return self.open, self.high, self.low, self.close, self.volume
+
+    def _with_arrays(self, time, columns):
+        return OHLCVSeries(time, *columns, ticker=self.ticker, interval=self.interval)
+
+    def iloc(self, start=None, stop=None):
+        """Positional slice; returns views, not copies"""
+        index = slice(start, stop)
+        return self._with_arrays(self.time[index], [c[index] for c in self.columns()])
+
+    def take(self, indices):
+        """Select bars by index array (copies)"""
+        return self._with_arrays(self.time[indices], [c[indices] for c in self.columns()])
+
+    def index_range(self, start=None, end=None):
+        """
+        Positions [lo, hi) of the bars with start <= time <= end (bounds in any to_epoch_ms form).
+
+        A date-only `end` includes that whole day: daily bars are stamped at
+        midnight US/Eastern (04:00 or 05:00 UTC), after the day's UTC midnight.
+        """
+        start_ms = to_epoch_ms(start)
+        lo = 0 if start_ms is None else int(np.searchsorted(self.time, start_ms, side="left"))
+        if end is None:
+            hi = len(self)
+        elif _is_date_only(end):
+            next_day = datetime.date.fromisoformat(str(end)[:10]) + datetime.timedelta(days=1)
+            hi = int(np.searchsorted(self.time, to_epoch_ms(next_day), side="left"))
+        else:
+            hi = int(np.searchsorted(self.time, to_epoch_ms(end), side="right"))
+        return lo, hi
+
+    def between(self, start=None, end=None):
+        """Bars with start <= time <= end (a date-only end includes that whole day), as a zero-copy view"""
+        lo, hi = self.index_range(start, end)
+        return self.iloc(lo, hi)
+
+    def aggregate(self, starts, interval=None):
+        """
+        Merge consecutive bars into one bar per group.
+
+        Each group starts at an index in `starts` (ascending, beginning with 0) and
+        takes the first open, highest high, lowest low, last close and summed
+        volume; its time is the time of its first bar.
+        """
+        if not len(self):
+            return OHLCVSeries.empty(self.ticker, interval)
+        last = np.append(starts[1:], len(self)) - 1
+        return OHLCVSeries(
+            self.time[starts],
+            self.open[starts],
+            np.maximum.reduceat(self.high, starts),
+            np.minimum.reduceat(self.low, starts),
+            self.close[last],
+            np.add.reduceat(self.volume, starts),
+            ticker=self.ticker,
+            interval=interval,
+        )
+
+    def merge(self, other):
+        """Combine two series into a new sorted one; bars from `other` win on equal timestamps"""
+        if not len(self):
+            return other
+        if not len(other):
+            return self
+        time = np.concatenate([other.time, self.time])
+        columns = [np.concatenate([b, a]) for a, b in zip(self.columns(), other.columns())]
+        # np.unique keeps the first occurrence, i.e. the bar from `other`
+        time, first = np.unique(time, return_index=True)
+        return self._with_arrays(time, [c[first] for c in columns])
+
+    def with_tick(self, price, timestamp, period=86_400_000):
+        """
+        New series with a live trade price folded in.
+
+        A trade inside the last bar's period revises that bar's high, low and
+        close; a later one starts a new bar aligned to the last bar's time.
+        Trades before the last bar leave the series as it is (returns self).
+        Volume is left unchanged, as ticks carry no size.
+
+        Args:
+            price: Trade price
+            timestamp: Trade time in epoch milliseconds
+            period: Bar length in milliseconds (default one day)
+        """
+        if not len(self) or timestamp < self.time[-1]:
+            return self
+        if timestamp < self.time[-1] + period:
+            columns = [c.copy() for c in self.columns()]  # The arrays may be shared with cached views
+            _, high, low, close, _ = columns
+            high[-1], low[-1], close[-1] = max(high[-1], price), min(low[-1], price), price
+            return self._with_arrays(self.time, columns)
+        start = self.time[-1] + (timestamp - self.time[-1]) // period * period
+        return self._with_arrays(np.append(self.time, start),
+                                 [np.append(c, value) for c, value in zip(self.columns(), (price,) * 4 + (0.0,))])
+
+    def to_frame(self):
+        """DataFrame with a datetime `time` column and the value columns, built from the arrays"""
+        return pd.DataFrame({
+            "time": pd.to_datetime(self.time, unit="ms"),
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }, copy=False)
@@ -0,0 +1,215 @@
+import threading
+import weakref
+from collections import deque
+
+from analytics.equity_curve import signed_quantity, trade_key
+
+# Quantities below this are treated as zero (fractional shares are summed as floats)
+EPSILON = 1e-9
+
+
+class Position:
+    """
+    One symbol's open shares, tracked both at average cost and as FIFO lots.
+
+    Buying adds a lot and raises the average-cost basis. Selling removes
+    shares at the current average cost, and takes them from the oldest lots
+    first for the FIFO basis; each method keeps its own realized gain.
+    """
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.quantity = 0.0
+        self.cost = 0.0  # Average-cost basis of the open shares
+        self.lots = deque()  # [date, quantity, price] of the open shares, oldest first
+        self.realized = 0.0  # Realized gain at average cost
+        self.realized_fifo = 0.0  # Realized gain with FIFO lot matching
+
+    @property
+    def average_price(self):
+        return self.cost / self.quantity if self.quantity > EPSILON else 0.0
+
+    @property
+    def fifo_cost(self):
+        """Cost basis of the open shares when the oldest lots are sold first"""
+        return sum(quantity * price for _, quantity, price in self.lots)
+
+    def buy(self, date, quantity, price):
+        self.quantity += quantity
+        self.cost += quantity * price
+        self.lots.append([date, quantity, price])
+
+    def sell(self, quantity, price):
+        """Remove shares; selling more than is held closes the position"""
+        quantity = min(quantity, self.quantity)
+        average = self.average_price
+        self.realized += (price - average) * quantity
+        self.cost -= average * quantity
+        self.quantity -= quantity
+
+        remaining = quantity
+        while remaining > EPSILON and self.lots:
+            lot = self.lots[0]
+            taken = min(lot[1], remaining)
+            self.realized_fifo += (price - lot[2]) * taken
+            lot[1] -= taken
+            remaining -= taken
+            if lot[1] <= EPSILON:
+                self.lots.popleft()
+
+        if self.quantity <= EPSILON:
+            self.quantity, self.cost = 0.0, 0.0
+            self.lots.clear()
+
+
+class PositionBook:
+    """
+    Client-side holdings built from the locally cached trade log.
+
+    Replaces the server's holdings query, which rebuilds every position from
+    the full log and prices each symbol through Polygon on every call. The
+    book is replayed once, then kept current by applying each new trade as it
+    happens; only the prices have to be refreshed, which the dashboard already
+    gets from the aggregate cache.
+
+    The book is shared by the process (see instance()), so a trade placed from
+    the stock page is visible to the dashboard right away. Callbacks registered
+    with subscribe() are called after every change.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.user_id = None
+        self.positions = {}  # Symbol -> Position
+        self.prices = {}  # Symbol -> latest known price
+        self.trade_keys = []  # Trades applied so far, in order
+        self.version = 0  # Incremented on every change
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide book, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------ trades
+
+    def rebuild(self, user_id, trades):
+        """Replay a user's whole trade log"""
+        with self._lock:
+            self.user_id = user_id
+            self.positions = {}
+            self.trade_keys = []
+            for trade in sorted(trades, key=lambda t: t["date"]):
+                self._apply(trade)
+        self._changed()
+
+    def sync(self, user_id, trades):
+        """
+        Bring the book up to date with a user's trade log.
+
+        If the trades applied so far are a prefix of `trades`, only the new ones
+        are applied; otherwise (another user, or history that changed) the log
+        is replayed from scratch.
+        """
+        trades = sorted(trades, key=lambda t: t["date"])
+        keys = [trade_key(t) for t in trades]
+        with self._lock:
+            applied = len(self.trade_keys)
+            if user_id != self.user_id or keys[:applied] != self.trade_keys:
+                self.rebuild(user_id, trades)
+                return
+            if applied == len(keys):
+                return
+            for trade in trades[applied:]:
+                self._apply(trade)
+        self._changed()
+
+    def apply(self, trade):
+        """Apply one new trade (e.g. right after an order is filled) and mark its price"""
+        with self._lock:
+            if trade_key(trade) in self.trade_keys[-1:]:
+                return
+            self._apply(trade)
+            self.prices[trade["symbol"]] = float(trade["price"])
+        self._changed()
+
+    def _apply(self, trade):
+        symbol = trade["symbol"]
+        position = self.positions.get(symbol)
+        if position is None:
+            position = self.positions[symbol] = Position(symbol)
+        quantity = signed_quantity(trade)
+        if quantity > 0:
+            position.buy(trade["date"], quantity, float(trade["price"]))
+        else:
+            position.sell(-quantity, float(trade["price"]))
+        self.trade_keys.append(trade_key(trade))
+
+    # ------------------------------------------------------------------ prices
+
+    def update_prices(self, prices, notify=True):
+        """
+        Set the latest price of some symbols.
+
+        Args:
+            prices: Symbol -> price
+            notify: Whether this counts as a change of the book (bumps the version and calls
+                the listeners); live quotes are applied silently and picked up by the next change
+        """
+        with self._lock:
+            changed = {s: float(p) for s, p in prices.items() if self.prices.get(s) != float(p)}
+            self.prices.update(changed)
+        if changed and notify:
+            self._changed()
+
+    # ------------------------------------------------------------------ listeners
+
+    def subscribe(self, callback):
+        """Call `callback()` after every change; bound methods are held weakly"""
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        self._listeners.append(ref)
+
+    def _changed(self):
+        self.version += 1
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                alive.append(ref)
+                callback()
+        self._listeners = alive
+
+    # ------------------------------------------------------------------ holdings
+
+    def open_positions(self):
+        with self._lock:
+            return [p for _, p in sorted(self.positions.items()) if p.quantity > EPSILON]
+
+    def holdings(self):
+        """
+        Open positions in the API's holdings format (id, symbol, quantity,
+        currentPrice, totalValue, totalGain, totalGainPercentage), gains at
+        average cost. A symbol without a known price is valued at its average cost.
+        """
+        result = []
+        for index, position in enumerate(self.open_positions(), start=1):
+            average = position.average_price
+            price = self.prices.get(position.symbol, average)
+            gain = (price - average) * position.quantity
+            result.append({
+                "id": index,
+                "symbol": position.symbol,
+                "quantity": position.quantity,
+                "currentPrice": price,
+                "totalValue": position.quantity * price,
+                "totalGain": gain,
+                "totalGainPercentage": gain / position.cost * 100 if position.cost > 0 else 0.0,
+            })
+        return result
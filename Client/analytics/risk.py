@@ -0,0 +1,242 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from analytics.equity_curve import DAY_MS
+
+TRADING_DAYS = 252
+
+
+def align_closes(closes, symbols, days=None):
+    """
+    Closes of several symbols on one shared day grid.
+
+    Args:
+        closes: Symbol -> OHLCVSeries of daily bars
+        symbols: Column order of the result
+        days: Epoch day numbers of the grid; defaults to every day any symbol traded
+
+    Returns:
+        (days, prices): the grid and a (days x symbols) matrix of closes carried
+        forward over missing days, NaN before a symbol's first close
+    """
+    columns = [(closes[s].time // DAY_MS, closes[s].close) if s in closes else (np.empty(0, np.int64), np.empty(0))
+               for s in symbols]
+    if days is None:
+        days = np.unique(np.concatenate([d for d, _ in columns])) if columns else np.empty(0, np.int64)
+    prices = np.full((len(days), len(symbols)), np.nan)
+    for column, (close_days, values) in enumerate(columns):
+        if len(close_days):
+            index = np.searchsorted(close_days, days, side="right") - 1
+            prices[:, column] = np.where(index >= 0, values[np.maximum(index, 0)], np.nan)
+    return days, prices
+
+
+def simple_returns(prices):
+    """Day-over-day returns of each column; days without two prices count as 0"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = prices[1:] / prices[:-1] - 1.0
+    return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def max_drawdown(returns):
+    """Largest peak-to-trough loss of the compounded returns, per column (a positive fraction)"""
+    wealth = np.cumprod(1.0 + returns, axis=0)
+    peaks = np.maximum.accumulate(np.maximum(wealth, 1.0), axis=0)
+    return (1.0 - wealth / peaks).max(axis=0, initial=0.0)
+
+
+def rolling_correlation(x, y, window):
+    """
+    Correlation of every column of x with y over each trailing window.
+
+    Computed from running sums, so the cost is linear in the number of days
+    whatever the window.
+
+    Args:
+        x: (days,) or (days x columns) array
+        y: (days,) array
+        window: Days per window
+
+    Returns:
+        (days - window + 1,) or (days - window + 1 x columns) array; NaN where a
+        window has no variance
+    """
+    x = np.asarray(x, dtype=np.float64)
+    vector = x.ndim == 1
+    x = x.reshape(len(x), -1)
+    y = np.asarray(y, dtype=np.float64).reshape(-1, 1)
+    if len(x) < window or window < 2:
+        empty = np.empty((0, x.shape[1]))
+        return empty[:, 0] if vector else empty
+
+    def windowed(values):
+        sums = np.cumsum(np.vstack([np.zeros((1, values.shape[1])), values]), axis=0)
+        return sums[window:] - sums[:-window]
+
+    sx, sy = windowed(x), windowed(y)
+    sxx, syy, sxy = windowed(x * x), windowed(y * y), windowed(x * y)
+    covariance = sxy - sx * sy / window
+    variance = (sxx - sx * sx / window) * (syy - sy * sy / window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = np.where(variance > 1e-18, covariance / np.sqrt(np.abs(variance)), np.nan)
+    return correlation[:, 0] if vector else correlation
+
+
+def risk_metrics(returns, weights, benchmark=None, rolling_window=63, risk_free_rate=0.0):
+    """
+    Risk metrics of a portfolio and of each of its holdings.
+
+    Every metric is computed for all holdings at once as matrix operations; the
+    portfolio's daily returns are the holdings' returns weighted by `weights`.
+
+    Args:
+        returns: (days x holdings) daily returns
+        weights: Portfolio weight of each holding (summing to 1)
+        benchmark: (days,) daily benchmark returns, or None to skip beta and correlation
+        rolling_window: Days per window of the rolling correlation
+        risk_free_rate: Annual risk-free rate for Sharpe and Sortino
+
+    Returns:
+        dict: "portfolio" and "holdings" dicts with volatility, sharpe, sortino,
+        max_drawdown, beta and correlation (annualized where it applies; arrays
+        per holding), plus "rolling_correlation" of the portfolio with the
+        benchmark and the number of "days" used
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    # Portfolio as one more column, so it goes through the same matrix code as the holdings
+    matrix = np.column_stack([returns, returns @ weights]) if returns.size else np.zeros((len(returns), 1))
+    days = len(matrix)
+
+    excess = matrix - risk_free_rate / TRADING_DAYS
+    mean = excess.mean(axis=0) if days else np.zeros(matrix.shape[1])
+    std = matrix.std(axis=0, ddof=1) if days > 1 else np.zeros(matrix.shape[1])
+    downside = np.sqrt((np.minimum(excess, 0.0) ** 2).mean(axis=0)) if days else np.zeros(matrix.shape[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS), np.nan)
+        sortino = np.where(downside > 0, mean / downside * np.sqrt(TRADING_DAYS), np.nan)
+
+    beta = correlation = np.full(matrix.shape[1], np.nan)
+    rolling = np.empty(0)
+    if benchmark is not None and days > 1:
+        benchmark = np.asarray(benchmark, dtype=np.float64)
+        centered = matrix - matrix.mean(axis=0)
+        centered_benchmark = benchmark - benchmark.mean()
+        covariance = centered.T @ centered_benchmark / (days - 1)
+        benchmark_variance = centered_benchmark @ centered_benchmark / (days - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.where(benchmark_variance > 0, covariance / benchmark_variance, np.nan)
+            correlation = np.where(std * np.sqrt(benchmark_variance) > 0,
+                                   covariance / (std * np.sqrt(benchmark_variance)), np.nan)
+        rolling = rolling_correlation(matrix[:, -1], benchmark, rolling_window)
+
+    metrics = {
+        "volatility": std * np.sqrt(TRADING_DAYS),
+        "sharpe": sharpe,
+        "sortino": sortino,
+        "max_drawdown": max_drawdown(matrix) if days else np.zeros(matrix.shape[1]),
+        "beta": beta,
+        "correlation": correlation,
+    }
+    return {
+        "portfolio": {name: float(values[-1]) for name, values in metrics.items()},
+        "holdings": {name: values[:-1] for name, values in metrics.items()},
+        "rolling_correlation": rolling,
+        "days": days,
+    }
+
+
+class RiskEngine:
+    """
+    Cached risk metrics for the current portfolio.
+
+    The aligned daily returns are built once per portfolio version (see
+    PositionBook.version), and the metrics once per (portfolio version,
+    window), so switching the dashboard period back and forth is free.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._returns = None  # (version, symbols, weights, days, returns, benchmark returns)
+        self._metrics = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide engine, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def prepare(self, version, values, closes, benchmark=None):
+        """
+        Align the holdings' returns for a portfolio version, unless already done.
+
+        Args:
+            version: Portfolio version the inputs belong to
+            values: Symbol -> current market value of the holding
+            closes: Symbol -> OHLCVSeries of daily bars
+            benchmark: OHLCVSeries of the benchmark's daily bars, or None
+        """
+        with self._lock:
+            if self._returns is not None and self._returns[0] == version:
+                return
+        symbols = sorted(s for s, v in values.items() if v > 0)
+        total = sum(values[s] for s in symbols)
+        weights = np.array([values[s] / total for s in symbols]) if total > 0 else np.empty(0)
+        grid = benchmark.time // DAY_MS if benchmark is not None and len(benchmark) else None
+        days, prices = align_closes(closes, symbols, grid)
+        benchmark_returns = None
+        if grid is not None:
+            benchmark_returns = simple_returns(benchmark.close.reshape(-1, 1))[:, 0]
+        with self._lock:
+            self._returns = (version, symbols, weights, days, simple_returns(prices), benchmark_returns)
+            self._metrics.clear()
+
+    def aligned(self, version):
+        """
+        The prepared daily returns of a portfolio version.
+
+        Returns:
+            (symbols, returns) with returns a (days x symbols) array, or None if
+            `version` was not prepared
+        """
+        with self._lock:
+            if self._returns is None or self._returns[0] != version:
+                return None
+            return self._returns[1], self._returns[4]
+
+    def metrics(self, version, window=None, rolling_window=63, risk_free_rate=0.0):
+        """
+        Metrics of the prepared portfolio over its last `window` days (None for all).
+
+        Returns:
+            dict from risk_metrics plus "symbols", or None if `version` was not prepared
+        """
+        key = (version, window)
+        with self._lock:
+            if self._returns is None or self._returns[0] != version:
+                return None
+            cached = self._metrics.get(key)
+            if cached is not None:
+                self._metrics.move_to_end(key)
+                return cached
+            _, symbols, weights, days, returns, benchmark = self._returns
+
+        if window is not None:
+            returns = returns[-window:]
+            benchmark = benchmark[-window:] if benchmark is not None else None
+        result = risk_metrics(returns, weights, benchmark, rolling_window, risk_free_rate)
+        result["symbols"] = symbols
+        with self._lock:
+            self._metrics[key] = result
+            while len(self._metrics) > self.max_entries:
+                self._metrics.popitem(last=False)
+        return result
@@ -0,0 +1,147 @@
+from collections.abc import Sequence
+from operator import itemgetter
+
+import numpy as np
+
+# Transaction type filter -> the API's type code (0 buy, 1 sell)
+TYPE_CODES = {"buy": 0, "sell": 1}
+
+
+def epoch_days(dates):
+    """Epoch day numbers of ISO date or datetime strings (only the date part is used)"""
+    # Fixed-width strings truncate to the yyyy-MM-dd part without a Python loop
+    return np.array(dates, dtype="U10").astype("datetime64[D]").astype(np.int64)
+
+
+class TransactionIndex:
+    """
+    Columnar, indexed copy of a transaction list for fast filtering.
+
+    Built once per load. Rows are kept in date order with the epoch day of
+    each as a sorted array, so a date range is two binary searches. Each
+    type and each symbol has a posting list of its sorted row positions, and
+    symbols are dictionary encoded, so a search only scans the distinct
+    symbols. A filter is answered by intersecting those without touching
+    the rows outside them.
+    """
+
+    def __init__(self, transactions):
+        """
+        Args:
+            transactions: Trades in the API's dict format (symbol, date, type, quantity, price)
+        """
+        self.transactions = transactions
+        count = len(transactions)
+        dates, symbols, types, quantity, price = (list(map(itemgetter(field), transactions))
+                                                  for field in ("date", "symbol", "type", "quantity", "price"))
+        days = epoch_days(dates)
+        self.order = np.argsort(days, kind="stable")  # Row position -> index into transactions
+        self.days = days[self.order]
+        self.types = np.array(types, dtype=np.int8)[self.order]
+        self.quantity = np.array(quantity, dtype=np.float64)[self.order]
+        self.price = np.array(price, dtype=np.float64)[self.order]
+        self.positions = np.arange(count)
+
+        # Dictionary-encode the symbols case-insensitively, with codes in alphabetical order
+        distinct = set(symbols)
+        self.dictionary = sorted({s.lower() for s in distinct})
+        code_of = {s: c for c, s in enumerate(self.dictionary)}
+        code_of = {s: code_of[s.lower()] for s in distinct}
+        self.codes = np.fromiter(map(code_of.__getitem__, symbols), np.int32, count)[self.order]
+        # Symbol code and type in one key, so a broad search is a single table lookup per row
+        self.keys = self.codes * 2 + self.types
+
+        self._type_postings = {code: np.flatnonzero(self.types == code) for code in TYPE_CODES.values()}
+        self._symbol_postings = np.argsort(self.codes, kind="stable")
+        counts = np.bincount(self.codes, minlength=len(self.dictionary))
+        self._symbol_offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._searches = {}
+
+    def __len__(self):
+        return len(self.order)
+
+    def transaction(self, position):
+        """The original transaction dict at a row position"""
+        return self.transactions[self.order[position]]
+
+    def matching_codes(self, search_text):
+        """Codes of the symbols containing `search_text` (case-insensitive)"""
+        search_text = search_text.lower()
+        codes = self._searches.get(search_text)
+        if codes is None:
+            codes = [code for code, symbol in enumerate(self.dictionary) if search_text in symbol]
+            self._searches[search_text] = codes
+        return codes
+
+    def date_range(self, from_date=None, to_date=None):
+        """Row positions [start, stop) of the transactions between two inclusive yyyy-MM-dd dates"""
+        start = int(np.searchsorted(self.days, np.datetime64(from_date, "D").astype(np.int64))) if from_date else 0
+        stop = (int(np.searchsorted(self.days, np.datetime64(to_date, "D").astype(np.int64), side="right"))
+                if to_date else len(self.days))
+        return start, max(start, stop)
+
+    def filter(self, from_date=None, to_date=None, type_filter="All", search_text=""):
+        """
+        Row positions of the transactions matching every criterion, in date order.
+
+        Args:
+            from_date: Start date string in ISO format (yyyy-MM-dd), None for no lower bound
+            to_date: End date string in ISO format (yyyy-MM-dd), None for no upper bound
+            type_filter: Transaction type filter ("All", "Buy", or "Sell")
+            search_text: Text to search in the symbol
+
+        Returns:
+            numpy array of row positions (often a view of an index, so do not modify it)
+        """
+        start, stop = self.date_range(from_date, to_date)
+        type_code = TYPE_CODES.get((type_filter or "All").lower())
+
+        if not search_text:
+            if type_code is None:
+                return self.positions[start:stop]
+            postings = self._type_postings[type_code]
+            return postings[np.searchsorted(postings, start):np.searchsorted(postings, stop)]
+
+        codes = self.matching_codes(search_text)
+        sizes = self._symbol_offsets[np.array(codes, dtype=np.int64) + 1] - self._symbol_offsets[codes]
+        if sizes.sum() > (stop - start) // 4:
+            # Search matches much of the range: one scan over the range beats merging postings
+            wanted = np.zeros((len(self.dictionary), 2), dtype=bool)
+            wanted[codes, type_code if type_code is not None else slice(None)] = True
+            return np.flatnonzero(np.take(wanted.ravel(), self.keys[start:stop])) + start
+
+        parts = []
+        for code in codes:
+            postings = self._symbol_postings[self._symbol_offsets[code]:self._symbol_offsets[code + 1]]
+            part = postings[np.searchsorted(postings, start):np.searchsorted(postings, stop)]
+            if type_code is not None:
+                part = part[self.types[part] == type_code]
+            parts.append(part)
+        if not parts:
+            return self.positions[:0]
+        return np.sort(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+
+    def select(self, positions):
+        """The transactions at some row positions, as a lazy sequence of dicts"""
+        return TransactionSelection(self, positions)
+
+
+class TransactionSelection(Sequence):
+    """
+    Read-only sequence of the transactions at some row positions of an index.
+
+    Transaction dicts are looked up only when accessed, so a selection of a
+    million rows costs no more to create than one of ten.
+    """
+
+    def __init__(self, index, positions):
+        self.index = index
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return TransactionSelection(self.index, self.positions[item])
+        return self.index.transaction(self.positions[item])
@@ -1,9 +1,44 @@
+import json
+
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QDate
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from lightweight_charts.widgets import QtChart
 
+from analytics.bar_pyramid import PyramidCache
+from analytics.indicators import IndicatorEngine
+from analytics.ohlcv import OHLCVSeries
+from components.chart_transfer import ChartTransfer
+from components.downsampling import aggregate_ohlc, bucket_last, target_points
+from config import CHART_SETTINGS
+
+# Indicator overlays the chart can toggle: label, parameters, one color per output column
+# and the price scale. Oscillators get their own scale at the top so the candles keep theirs.
+OVERLAYS = {
+    "sma": {"label": "SMA 50", "params": {"period": 50}, "colors": ("#2962FF",)},
+    "ema": {"label": "EMA 20", "params": {"period": 20}, "colors": ("#FF6D00",)},
+    "bollinger": {"label": "Bollinger", "params": {"period": 20, "width": 2.0},
+                  "colors": ("rgba(123, 31, 162, 0.8)", "rgba(123, 31, 162, 0.4)", "rgba(123, 31, 162, 0.4)")},
+    "vwap": {"label": "VWAP", "params": {}, "colors": ("#00897B",)},
+    "rsi": {"label": "RSI 14", "params": {"period": 14}, "colors": ("#8E24AA",), "scale": "oscillator"},
+    "macd": {"label": "MACD", "params": {"fast": 12, "slow": 26, "signal": 9},
+             "colors": ("#1E88E5", "#FB8C00", "rgba(120, 144, 156, 0.6)"), "scale": "oscillator"},
+    "atr": {"label": "ATR 14", "params": {"period": 14}, "colors": ("#6D4C41",), "scale": "oscillator"},
+}
+
+# Volume bar colors used by lightweight-charts for up and down candles
+VOLUME_UP_COLOR = 'rgba(83,141,131,0.8)'
+VOLUME_DOWN_COLOR = 'rgba(200,127,130,0.8)'
+
+# Backtest trade markers: position relative to the candle, shape and color per side
+# In lightweight-charts' own marker format, as they are passed straight to setMarkers
+TRADE_MARKERS = {
+    "buy": {"position": "belowBar", "shape": "arrowUp", "color": "#16A34A", "text": "Buy"},
+    "sell": {"position": "aboveBar", "shape": "arrowDown", "color": "#DC2626", "text": "Sell"},
+}
+
 
 class StockChartWidget(QWidget):
     def __init__(self, parent=None):
@@ -12,7 +47,18 @@ class StockChartWidget(QWidget):
         """
         super().__init__(parent)
         self.chart = None  # Placeholder for chart
+        self.ticker = None  # Ticker currently drawn
         self.data = None  # Placeholder for stock data
+        self.pyramids = PyramidCache.instance()
+        self.level = None  # Resolution currently drawn ("day", "week", ...)
+        self.level_data = None  # self.data resampled to self.level; indicators are computed on it
+        self.display_data = None  # Bars actually drawn: self.level_data, aggregated further only if needed
+        self.bucket_starts = None  # Start index of each drawn bar in self.level_data, None if not aggregated
+        self.visible_range = None  # (start, end) epoch ms currently in view, None for everything
+        self.indicators = IndicatorEngine.instance()
+        self.active_overlays = ["sma"]  # Overlays drawn on every update, in toggle order
+        self.overlay_lines = {}  # Overlay name -> {output column: Line}, reused across updates
+        self.trade_markers = []  # Backtest trades to mark: {"time" (epoch ms), "side", "price"}
         self.init_ui()
 
     def init_ui(self):
@@ -30,68 +76,302 @@ class StockChartWidget(QWidget):
         # Add the chart widget
         layout.addWidget(self.chart.get_webview(), stretch=1)
 
+        # Large series are streamed to the page in packed chunks instead of one JSON blob
+        self.transfer = ChartTransfer(self.chart, CHART_SETTINGS["stream_chunk_bars"], self)
+
         self.setLayout(layout)
 
+        # Re-aggregate once resizing settles rather than on every resize event
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(150)
+        self.resize_timer.timeout.connect(self.on_resized)
+
+        # Switch resolution once zooming or scrolling settles
+        self.range_timer = QTimer(self)
+        self.range_timer.setSingleShot(True)
+        self.range_timer.setInterval(200)
+        self.range_timer.timeout.connect(self.apply_visible_range)
+        self.chart.events.range_change += self.on_range_change
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_timer.start()
+
+    def max_bars(self):
+        """How many bars fit across the chart at the configured density"""
+        # Before the first layout pass the webview has no real width yet; keep a sane floor
+        return target_points(self.chart.get_webview().width(), CHART_SETTINGS["pixels_per_bar"], minimum=100)
+
+    def on_resized(self):
+        """Redraw only if the new width changes which bars are drawn"""
+        if self.data is None:
+            return
+        level, _, display_data, _ = self.build_display(visible=self.visible_range)
+        if level != self.level or len(display_data) != len(self.display_data):
+            self.display_chart(visible=self.visible_range)
+
+    def on_range_change(self, chart, bars_before, bars_after):
+        """Remember the visible time range as the user zooms or scrolls; acted on once it settles"""
+        bars = self.display_data
+        if bars is None or not len(bars):
+            return
+        first = min(max(0, int(bars_before)), len(bars) - 1)
+        last = max(min(len(bars) - 1, len(bars) - 1 - int(bars_after)), first)
+        self.visible_range = (int(bars.time[first]), int(bars.time[last]))
+        self.range_timer.start()
+
+    def apply_visible_range(self):
+        """Switch to the resolution that best fills the viewport, keeping the same time range in view"""
+        if self.data is None or self.transfer.active:
+            return
+        level, _, _, _ = self.build_display(visible=self.visible_range)
+        if level != self.level:
+            self.display_chart(visible=self.visible_range)
+
+    def build_display(self, level=None, visible=None):
+        """
+        Work out what to draw, without touching the chart.
+
+        Args:
+            level: Resolution to use; chosen from the pyramid for `visible` if None
+            visible: (start, end) epoch ms in view, None for the whole series
+
+        Returns:
+            (level, level_data, display_data, bucket_starts)
+        """
+        max_bars = self.max_bars()
+        pyramid = self.pyramids.get(self.data)
+        start, end = visible or (None, None)
+        if level in pyramid.levels:
+            level_data = pyramid[level]
+        else:
+            level, level_data = pyramid.select(start, end, max_bars)
+
+        lo, hi = level_data.index_range(start, end)
+        if hi - lo <= max_bars:
+            return level, level_data, level_data, None
+        # Even the coarsest level is too dense for the viewport
+        display_data, bucket_starts = aggregate_ohlc(level_data, max_bars)
+        return level, level_data, display_data, bucket_starts
+
     def process_data(self, data):
-        """Process raw stock data into a DataFrame"""
+        """Process raw stock data into a columnar OHLCVSeries"""
+        if isinstance(data, OHLCVSeries):
+            return data
         if isinstance(data, list) and data:
-            df = pd.DataFrame(data)
-
             # Ensure required columns exist
             required_columns = {'t', 'o', 'h', 'l', 'c', 'v'}
-            if not required_columns.issubset(df.columns):
+            if not required_columns.issubset(data[0]):
                 print("⚠️ Error: Missing required columns in stock data!")
                 return None
 
-            df['date'] = pd.to_datetime(df['t'], unit='ms')  # Convert timestamp
-            df = df.rename(columns={'o': 'open', 'h': 'high', 'l': 'low', 'c': 'close', 'v': 'volume'})
-            return df[['date', 'open', 'high', 'low', 'close', 'volume']]
+            return OHLCVSeries.from_polygon(data)
         print("⚠️ Error: Invalid stock data format!", data)
         return None
 
-    def calculate_sma(self, df, period=50):
-        """Calculate Simple Moving Average (SMA)"""
-        if df is not None and 'close' in df:
-            sma = df['close'].rolling(window=period).mean()
-            return pd.DataFrame({'time': df['date'], f'SMA {period}': sma}).dropna()
-        return None
+    def indicator_frame(self, series, column, values):
+        """DataFrame with the defined (non-NaN) values of one indicator column"""
+        defined = ~np.isnan(values)
+        return pd.DataFrame({'time': pd.to_datetime(series.time[defined], unit='ms'), column: values[defined]})
+
+    def set_overlay(self, name, enabled=True):
+        """Toggle an indicator overlay; other overlays are left untouched"""
+        if enabled and name not in self.active_overlays:
+            self.active_overlays.append(name)
+            if self.data is not None:
+                self.draw_overlay(name)
+        elif not enabled and name in self.active_overlays:
+            self.active_overlays.remove(name)
+            for line in self.overlay_lines.pop(name, {}).values():
+                line.delete()
+
+    def overlay_columns(self, name):
+        """Create the overlay's lines if needed and return (line, column, values per drawn bar) for each"""
+        spec = OVERLAYS[name]
+        results = self.indicators.compute(self.level_data, name, **spec["params"])
+        lines = self.overlay_lines.setdefault(name, {})
+        columns = []
+        for (column, values), color in zip(results.items(), spec["colors"]):
+            line = lines.get(column)
+            if line is None:
+                line = lines[column] = self.chart.create_line(
+                    column, color=color, width=1, price_line=False, price_scale_id=spec.get("scale"))
+                if spec.get("scale"):
+                    line.run_script(f"{line.id}.series.priceScale().applyOptions("
+                                    f"{{scaleMargins: {{top: 0.05, bottom: 0.75}}}})")
+            columns.append((line, column, bucket_last(values, self.bucket_starts)))
+        return columns
 
-    def display_chart(self):
-        """Render the chart with existing stock data"""
+    def draw_overlay(self, name):
+        """Compute (or fetch from the indicator cache) one overlay and push it to its lines"""
+        for line, column, values in self.overlay_columns(name):
+            line.set(self.indicator_frame(self.display_data, column, values))
+
+    def display_chart(self, fit=False, visible=None):
+        """
+        Render the chart with existing stock data.
+
+        :param fit: Fit all bars into view once drawn
+        :param visible: (start, end) epoch ms to keep in view; also picks the resolution
+        """
         if self.data is not None:
-            self.chart.set(self.data)  # Set new data
+            self.transfer.cancel()
+            self.level, self.level_data, self.display_data, self.bucket_starts = self.build_display(visible=visible)
+
+            def restore_view():
+                self.draw_trade_markers()
+                if fit:
+                    self.chart.fit()
+                elif visible:
+                    self.chart.run_script(f"{self.chart.id}.chart.timeScale().setVisibleRange("
+                                          f"{{from: {visible[0] // 1000}, to: {visible[1] // 1000}}})")
+
+            if len(self.display_data) > CHART_SETTINGS["stream_threshold"]:
+                # Stream candles and overlays together, newest chunk first
+                lines = [(line, self.display_data.time, values)
+                         for name in self.active_overlays
+                         for line, _, values in self.overlay_columns(name)]
+                self.transfer.send(self.display_data, lines, VOLUME_UP_COLOR, VOLUME_DOWN_COLOR,
+                                   on_finished=restore_view)
+                return
 
-            # Compute and display SMA line
-            sma_data = self.calculate_sma(self.data, period=50)
-            if sma_data is not None:
-                line = self.chart.create_line('SMA 50')
-                line.set(sma_data)
+            self.chart.set(self.display_data.to_frame())  # Set new data
 
+            # Draw the enabled indicator overlays, reusing their lines
+            for name in self.active_overlays:
+                self.draw_overlay(name)
+
+            restore_view()
             self.chart.get_webview().update()
 
+    def set_trade_markers(self, trades):
+        """Mark backtest trades on the candles, replacing earlier markers"""
+        self.trade_markers = list(trades or [])
+        if self.display_data is not None and not self.transfer.active:
+            self.draw_trade_markers()
+
+    def draw_trade_markers(self):
+        """
+        Place each trade marker on the drawn bar that contains its time.
+
+        Markers are set on the series directly with the bar's own epoch seconds:
+        the library's marker_list floors times to the interval of the last data
+        passed to chart.set(), which puts them on the wrong bar at weekly and
+        monthly resolution and is stale after a streamed redraw.
+        """
+        bars = self.display_data
+        markers = []
+        if self.trade_markers and bars is not None and len(bars):
+            times = np.array([trade["time"] for trade in self.trade_markers], dtype=np.int64)
+            index = np.searchsorted(bars.time, times, side="right") - 1
+            for trade, bar in zip(self.trade_markers, index):
+                if bar >= 0:  # Trades before the first drawn bar are off the chart
+                    markers.append({"time": int(bars.time[bar] // 1000), **TRADE_MARKERS[trade["side"]]})
+        markers.sort(key=lambda marker: marker["time"])  # setMarkers expects them in time order
+        self.chart.markers.clear()  # Keep the library from re-sending markers of its own
+        self.chart.run_script(f"{self.chart.id}.series.setMarkers({json.dumps(markers)})")
+
     def update_chart(self, ticker, start_date, end_date, data):
         """
         Update the chart dynamically with new stock data.
 
+        When the new bars extend what is already drawn for the same ticker, only
+        the revised last bar and the appended bars are pushed to the webview, at
+        the resolution already on screen; anything else falls back to a full
+        redraw at the resolution that fits the whole range.
+
         :param ticker: Stock symbol
         :param start_date: Start date as a string in "yyyy-MM-dd" format
         :param end_date: End date as a string in "yyyy-MM-dd" format
-        :param data: Stock data in list format
+        :param data: Stock data as a list of Polygon bars or an OHLCVSeries
         """
+        series = self.process_data(data)  # Convert to columnar series
+        if series is None:
+            print("❌ Error: Unable to process stock data.")
+            return
 
-        # self.clear_chart()  # Clear the chart before updating
-        self.data = self.process_data(data)  # Convert to DataFrame
-        if self.data is not None:
-            self.display_chart()  # Display updated chart
+        self.data = series
+        # Bars still streaming in would overwrite incremental updates, so redraw in that case
+        if ticker == self.ticker and not self.transfer.active and self.display_data is not None:
+            level, level_data, display_data, bucket_starts = self.build_display(self.level, self.visible_range)
+            first_changed = self.first_changed_bar(display_data)
+            if first_changed is not None:
+                self.level_data, self.display_data, self.bucket_starts = level_data, display_data, bucket_starts
+                self.push_bars(first_changed)
+                return
 
-            self.chart.get_webview().page().runJavaScript("chart.timeScale().fitContent();")
+        if ticker != self.ticker:
+            self.trade_markers = []  # Markers belong to the ticker they were backtested on
+        self.ticker = ticker
+        self.visible_range = None
+        self.display_chart(fit=True)  # Display updated chart
 
+    def first_changed_bar(self, display_data):
+        """
+        Index of the first drawn bar that differs from `display_data`, or None if a full redraw is needed.
 
-        else:
-            print("❌ Error: Unable to process stock data.")
+        The webview can only revise its last bar or append newer ones, so every
+        bar before the last drawn one must be unchanged.
+        """
+        rendered = self.display_data
+        if rendered is None or not len(rendered) or len(display_data) < len(rendered):
+            return None
+        last = len(rendered) - 1
+        head = slice(0, last)
+        if display_data.time[last] != rendered.time[last] or not np.array_equal(display_data.time[head],
+                                                                                 rendered.time[head]):
+            return None
+        for new, old in zip(display_data.columns(), rendered.columns()):
+            if not np.array_equal(new[head], old[head]):
+                return None
+        if all(new[last] == old[last] for new, old in zip(display_data.columns(), rendered.columns())):
+            return last + 1
+        return last
+
+    def push_bars(self, start):
+        """Send drawn bars from `start` on, and the overlay points for them, in one script"""
+        bars = self.display_data
+        if start >= len(bars):
+            return
+        seconds = bars.time[start:] // 1000
+        candle_id = self.chart.id
+        with self.chart.win.bulk_run:
+            for offset, index in enumerate(range(start, len(bars))):
+                time = int(seconds[offset])
+                open_, high, low, close, volume = (float(c[index]) for c in bars.columns())
+                candle = {"time": time, "open": open_, "high": high, "low": low, "close": close}
+                color = VOLUME_UP_COLOR if close > open_ else VOLUME_DOWN_COLOR
+                self.chart.run_script(f"{candle_id}.series.update({json.dumps(candle)})")
+                self.chart.run_script(f"{candle_id}.volumeSeries.update("
+                                      f"{json.dumps({'time': time, 'value': volume, 'color': color})})")
+
+            for name in self.active_overlays:
+                for line, _, values in self.overlay_columns(name):
+                    for time, value in zip(seconds, values[start:]):
+                        if not np.isnan(value):
+                            line.run_script(f"{line.id}.series.update("
+                                            f"{json.dumps({'time': int(time), 'value': float(value)})})")
+
+    def apply_tick(self, price, timestamp):
+        """Fold a live trade into the last daily bar (or start the next one) and redraw only that bar"""
+        if self.data is None or self.transfer.active:
+            return
+        series = self.data.with_tick(price, timestamp)
+        if series is not self.data:
+            self.update_chart(self.ticker, None, None, series)
 
     def clear_chart(self):
         """Clears the chart for new data."""
+        self.transfer.cancel()
         self.chart.set(pd.DataFrame())  # Set an empty list to clear the chart data
+        for lines in self.overlay_lines.values():
+            for line in lines.values():
+                line.set(None)
+        self.ticker = None
+        self.display_data = None
+        self.visible_range = None
+        self.trade_markers = []
+        self.chart.clear_markers()
         self.chart.get_webview().update()  # Update the webview to reflect changes
         print("🧹 Chart cleared.")
@@ -0,0 +1,163 @@
+import base64
+import itertools
+
+import numpy as np
+from PySide6.QtCore import QObject, QTimer
+
+# Decoder installed once per page. Chunks arrive newest first; each one is
+# decoded from a base64-packed little-endian Float64Array (column-major: time
+# in seconds, then the value columns), prepended to what the target already
+# received and handed to setData, so recent bars appear before old history.
+DECODER_JS = """
+window.chartTransfer = window.chartTransfer || {
+    targets: {},
+    decode(b64) {
+        const raw = atob(b64);
+        const bytes = new Uint8Array(raw.length);
+        for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+        return new Float64Array(bytes.buffer);
+    },
+    receive(key, series, volumeSeries, kind, generation, b64, count, colors) {
+        let target = this.targets[key];
+        if (!target || target.generation !== generation) {
+            target = this.targets[key] = {generation: generation, bars: [], volume: []};
+        }
+        const data = this.decode(b64);
+        const bars = new Array(count);
+        const volume = volumeSeries ? new Array(count) : null;
+        for (let i = 0; i < count; i++) {
+            const time = data[i];
+            if (kind === 'ohlcv') {
+                const open = data[count + i], close = data[4 * count + i];
+                bars[i] = {time: time, open: open, high: data[2 * count + i], low: data[3 * count + i], close: close};
+                if (volume) volume[i] = {time: time, value: data[5 * count + i], color: close > open ? colors[0] : colors[1]};
+            } else {
+                bars[i] = {time: time, value: data[count + i]};
+            }
+        }
+        target.bars = bars.concat(target.bars);
+        series.setData(target.bars);
+        if (volumeSeries) {
+            target.volume = volume.concat(target.volume);
+            volumeSeries.setData(target.volume);
+        }
+    },
+};
+"""
+
+
+def pack_columns(*columns):
+    """Pack equal-length numeric columns into base64 of a column-major little-endian float64 buffer"""
+    packed = np.concatenate([np.asarray(c, dtype="<f8") for c in columns]) if columns else np.empty(0)
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+class ChartTransfer(QObject):
+    """
+    Streams large series into a lightweight-charts page in compact chunks.
+
+    Instead of JSON with one object per bar, columns are sent as
+    base64-packed float64 arrays that the page decodes into typed arrays.
+    The data is cut into chunks, newest first, and one chunk (for the candles
+    and every line, aligned on the same time window) is encoded and sent per
+    event-loop iteration, so the GUI stays responsive and the most recent
+    bars are on screen after the first chunk.
+    """
+
+    _generations = itertools.count(1)
+
+    def __init__(self, chart, chunk_bars=2000, parent=None):
+        """
+        Args:
+            chart: lightweight_charts chart to send to
+            chunk_bars: Bars per chunk
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.chart = chart
+        self.chunk_bars = chunk_bars
+        self._installed = False
+        self._chunks = []
+        self._pending = None  # (generation, volume colors, candle series JS, lines) of the running transfer
+        self._on_finished = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._send_next)
+
+    @property
+    def active(self):
+        """True while chunks of a transfer are still pending"""
+        return bool(self._chunks)
+
+    def cancel(self):
+        self._timer.stop()
+        self._chunks = []
+        self._on_finished = None
+
+    def send(self, series, lines=(), up_color="", down_color="", on_finished=None):
+        """
+        Start streaming candles (with volume) and line series, replacing their data.
+
+        Args:
+            series: OHLCVSeries for the candlestick and volume series
+            lines: (Line, times_ms, values) tuples; NaN values are skipped
+            up_color: Volume color for up bars
+            down_color: Volume color for down bars
+            on_finished: Called once the last chunk has been sent
+        """
+        self.cancel()
+        if not self._installed:
+            self.chart.run_script(DECODER_JS)
+            self._installed = True
+
+        generation = next(self._generations)
+        colors = f"['{up_color}', '{down_color}']"
+        candles_js = f"{self.chart.id}.series, {self.chart.id}.volumeSeries"
+        seconds = series.time // 1000
+        lines = [(line, np.asarray(times) // 1000, np.asarray(values)) for line, times, values in lines]
+        lines = [(line, times[~np.isnan(values)], values[~np.isnan(values)]) for line, times, values in lines]
+
+        # Chunk boundaries on the candles, newest first; lines are cut on the same time windows
+        stop = len(seconds)
+        while stop > 0:
+            start = max(0, stop - self.chunk_bars)
+            window = (seconds[start], seconds[stop - 1])
+            self._chunks.append((series, seconds, start, stop, window, start == 0))
+            stop = start
+        if not self._chunks:
+            self._chunks.append((series, seconds, 0, 0, None, True))
+
+        self._pending = (generation, colors, candles_js, lines)
+        self._on_finished = on_finished
+        self._send_next()
+        if self._chunks:
+            self._timer.start()
+
+    def _send_next(self):
+        if not self._chunks:
+            self._timer.stop()
+            return
+        series, seconds, start, stop, window, oldest = self._chunks.pop(0)
+        generation, colors, candles_js, lines = self._pending
+        newest = stop == len(seconds)
+
+        count = stop - start
+        scripts = [f"window.chartTransfer.receive('{self.chart.id}', {candles_js}, 'ohlcv', {generation}, "
+                   f"'{pack_columns(seconds[start:stop], *(c[start:stop] for c in series.columns()))}', "
+                   f"{count}, {colors})"]
+        for line, times, values in lines:
+            if window is None:
+                lo, hi = 0, 0
+            else:
+                # Newest chunk takes everything after its first bar, the oldest everything before its last
+                lo = 0 if oldest else int(np.searchsorted(times, window[0], side="left"))
+                hi = len(times) if newest else int(np.searchsorted(times, window[1], side="right"))
+            scripts.append(f"window.chartTransfer.receive('{line.id}', {line.id}.series, null, 'line', "
+                           f"{generation}, '{pack_columns(times[lo:hi], values[lo:hi])}', {hi - lo}, null)")
+        self.chart.run_script("\n".join(scripts))
+
+        if not self._chunks:
+            self._timer.stop()
+            on_finished, self._on_finished = self._on_finished, None
+            if on_finished:
+                on_finished()
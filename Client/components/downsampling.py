@@ -0,0 +1,90 @@
+import numpy as np
+
+
+def target_points(pixel_width, pixels_per_point=1.0, minimum=2):
+    """Number of points worth drawing across a widget `pixel_width` pixels wide"""
+    return max(minimum, int(pixel_width / pixels_per_point))
+
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a line.
+
+    The first and last points are always kept. The points in between are
+    split into threshold - 2 buckets. From each bucket the point kept is the
+    one forming the largest triangle with the previously kept point and the
+    average of the next bucket, so peaks and troughs survive.
+
+    Args:
+        x: Sorted x values (e.g. epoch milliseconds)
+        y: y values, same length as x
+        threshold: Maximum number of points to keep
+
+    Returns:
+        numpy array with the indices of the kept points, in order
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # Bucket boundaries over the interior points [1, count - 1)
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+            avg_x, avg_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Twice the triangle area for every candidate in the bucket, in one vector operation
+        area = np.abs((x[previous] - avg_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (avg_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def bucket_bounds(count, max_buckets):
+    """
+    Start index of each bucket when `count` items are split into at most `max_buckets`.
+
+    Buckets have a fixed size and are anchored at the first item, so appending
+    items only ever changes the last bucket (until the bucket size grows).
+    """
+    size = -(-count // max_buckets)
+    return np.arange(0, count, max(size, 1), dtype=np.int64)
+
+
+def aggregate_ohlc(series, max_bars):
+    """
+    Merge consecutive bars so that at most `max_bars` remain, preserving OHLC semantics.
+
+    Each bucket takes the first open, the highest high, the lowest low, the
+    last close and the summed volume. Its time is the time of its first bar.
+    See bucket_bounds for how bars are assigned to buckets.
+
+    Returns:
+        (series, starts): the aggregated OHLCVSeries and the start index of every
+        bucket in the original series. The original series is returned unchanged,
+        with starts None, when it already fits.
+    """
+    count = len(series)
+    if count <= max_bars:
+        return series, None
+
+    starts = bucket_bounds(count, max_bars)
+    return series.aggregate(starts), starts
+
+
+def bucket_last(values, starts):
+    """Value at the last item of each bucket, to align a per-bar column with aggregated bars"""
+    if starts is None:
+        return values
+    return values[np.append(starts[1:], len(values)) - 1]
@@ -6,6 +6,7 @@ from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QDateT
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Qt, QByteArray, QSize
 from PySide6.QtCore import Qt, QMargins, QPointF, QDate
+from PySide6.QtCore import QEvent, QRectF, QVariantAnimation
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QImage
 from PySide6.QtGui import (
@@ -15,7 +16,7 @@ from PySide6.QtSvgWidgets import QGraphicsSvgItem, QSvgWidget
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QLabel, QFrame, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QComboBox, QGraphicsDropShadowEffect,
+    QTableWidget, QTableWidgetItem, QTableView, QComboBox, QGraphicsDropShadowEffect,
     QHeaderView, QScrollArea, QSizePolicy, QDateEdit, QWidget, QComboBox
 )
 
@@ -427,6 +428,38 @@ class StyledStatsCard(Card):
 
 
 class StyledTable(QTableWidget):
+    STYLESHEET = """
+        #StyledTable {
+            background-color: #FFFFFF;
+            border: 1px solid #E2E8F0;
+            border-radius: 8px;
+            font-family: 'Segoe UI', sans-serif;
+            font-size: 13px;
+        }
+        #StyledTable::item {
+            padding: 10px;
+            border-bottom: 1px solid #EDF2F7;
+            color: #2D3748;
+        }
+        #StyledTable::item:selected {
+            background-color: #E2E8F0;
+            color: #1A202C;
+        }
+        #StyledTable QHeaderView::section {
+            background-color: #F7FAFC;
+            border: none;
+            border-bottom: 2px solid #E2E8F0;
+            padding: 12px;
+            font-weight: bold;
+            color: #4A5568;
+            text-align: left;
+        }
+        QTableView {
+            alternate-background-color: #F9FAFB;
+            background-color: #FFFFFF;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("StyledTable")
@@ -441,37 +474,7 @@ class StyledTable(QTableWidget):
         # Add this line to disable editing for the entire table
         self.setEditTriggers(QTableWidget.NoEditTriggers)
 
-        self.setStyleSheet("""
-            #StyledTable {
-                background-color: #FFFFFF;
-                border: 1px solid #E2E8F0;
-                border-radius: 8px;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 13px;
-            }
-            #StyledTable::item {
-                padding: 10px;
-                border-bottom: 1px solid #EDF2F7;
-                color: #2D3748;
-            }
-            #StyledTable::item:selected {
-                background-color: #E2E8F0;
-                color: #1A202C;
-            }
-            #StyledTable QHeaderView::section {
-                background-color: #F7FAFC;
-                border: none;
-                border-bottom: 2px solid #E2E8F0;
-                padding: 12px;
-                font-weight: bold;
-                color: #4A5568;
-                text-align: left;
-            }
-            QTableView {
-                alternate-background-color: #F9FAFB;
-                background-color: #FFFFFF;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
 
         # Keep the initial column widths for later resizing
         self.initial_widths = {}
@@ -522,6 +525,82 @@ class StyledTable(QTableWidget):
                         self.setColumnWidth(col, new_width)
 
 
+
+class StyledTableView(QTableView):
+    """
+    Model-backed counterpart of StyledTable.
+
+    Rows have one fixed height and are painted from the model on demand, so
+    the cost of a table does not grow with its row count. Columns stretch in
+    proportion to the widths they were given; widths are recomputed only when
+    the viewport width actually changes.
+    """
+
+    def __init__(self, parent=None, row_height=50):
+        super().__init__(parent)
+        self.setObjectName("StyledTable")
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setShowGrid(False)
+        self.setSelectionBehavior(QTableView.SelectRows)
+        self.setSelectionMode(QTableView.SingleSelection)
+        self.setEditTriggers(QTableView.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.setWordWrap(False)
+
+        vertical_header = self.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(row_height)
+        self.horizontalHeader().setHighlightSections(False)
+
+        self.setStyleSheet(StyledTable.STYLESHEET)
+
+        self.initial_widths = {}
+        self.fixed_columns = set()
+        self._laid_out_width = None
+
+        shadow = QGraphicsDropShadowEffect(self)
+        shadow.setBlurRadius(20)
+        shadow.setColor(QColor(0, 0, 0, 30))
+        shadow.setOffset(0, 5)
+        self.setGraphicsEffect(shadow)
+
+    def set_column_widths(self, widths, fixed_columns=()):
+        """
+        Set the initial column widths.
+
+        Args:
+            widths: Column -> width in pixels
+            fixed_columns: Columns that keep their width while the others stretch
+        """
+        self.initial_widths = dict(widths)
+        self.fixed_columns = set(fixed_columns)
+        self._laid_out_width = None
+        self.update_column_widths()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_column_widths()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_column_widths()
+
+    def update_column_widths(self):
+        total_width = self.viewport().width()
+        if not self.initial_widths or total_width == self._laid_out_width:
+            return
+        self._laid_out_width = total_width
+
+        fixed_width = sum(w for c, w in self.initial_widths.items() if c in self.fixed_columns)
+        stretch_width = sum(w for c, w in self.initial_widths.items() if c not in self.fixed_columns)
+        available_width = total_width - fixed_width
+        for column, width in self.initial_widths.items():
+            if column not in self.fixed_columns and stretch_width > 0 and available_width > 0:
+                width = int(available_width * width / stretch_width)
+            self.setColumnWidth(column, width)
+
 # ========== CHARTS ==========
 
 class StyledChartView(QChartView):
@@ -670,6 +749,98 @@ class ScrollableContainer(QScrollArea):
         self.setGraphicsEffect(shadow_effect)
 
 
+# ========== LOADING PLACEHOLDERS ==========
+
+class SkeletonOverlay(QWidget):
+    """
+    Shimmering placeholder drawn over a widget until its data arrives.
+
+    The overlay is a child of the target that follows its size. It covers the
+    target with `fill` and paints rounded bars in its place: one bar, or with
+    `row_height` one per row that fits, like table rows. A lighter band sweeps
+    across the bars; the animation runs only while the overlay is shown.
+    """
+
+    BASE_COLOR = QColor("#ECEEF1")
+    HIGHLIGHT_COLOR = QColor("#F7F8FA")
+    ROW_WIDTHS = (0.92, 0.78, 0.86, 0.64)  # Width of consecutive row bars, as a fraction of the row
+
+    def __init__(self, target, row_height=None, bar_width=0.6, fill="white", radius=6):
+        """
+        Args:
+            target: Widget to cover
+            row_height: Height of a row in pixels; None for a single bar
+            bar_width: Width of the single bar as a fraction of the target
+        """
+        super().__init__(target)
+        self.row_height = row_height
+        self.bar_width = bar_width
+        self.fill = QColor(fill)
+        self.radius = radius
+        self.phase = 0.0  # Position of the highlight band, 0 (left) to 1 (right)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.setDuration(1200)
+        self.animation.setLoopCount(-1)
+        self.animation.valueChanged.connect(self._set_phase)
+
+        target.installEventFilter(self)
+        self.hide()
+
+    def start(self):
+        """Cover the target and start shimmering"""
+        self.setGeometry(self.parentWidget().rect())
+        self.raise_()
+        self.show()
+        self.animation.start()
+
+    def stop(self):
+        """Uncover the target"""
+        if self.isVisible():
+            self.animation.stop()
+            self.hide()
+
+    def eventFilter(self, watched, event):
+        if watched is self.parentWidget() and event.type() == QEvent.Resize:
+            self.setGeometry(watched.rect())
+        return False
+
+    def _set_phase(self, phase):
+        self.phase = phase
+        self.update()
+
+    def bars(self):
+        """Rectangles of the placeholder bars, in overlay coordinates"""
+        width, height = self.width(), self.height()
+        if not self.row_height:
+            return [QRectF(0, height * 0.15, width * self.bar_width, height * 0.7)]
+        margin = 16
+        return [QRectF(margin, top + self.row_height * 0.3,
+                       (width - 2 * margin) * self.ROW_WIDTHS[row % len(self.ROW_WIDTHS)], self.row_height * 0.4)
+                for row, top in enumerate(range(0, height, self.row_height))]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self.fill)
+
+        # A band a third of the width wide, sweeping from just off the left edge to just off the right
+        band = self.width() / 3
+        left = -band + self.phase * (self.width() + band)
+        gradient = QLinearGradient(left, 0, left + band, 0)
+        gradient.setColorAt(0.0, self.BASE_COLOR)
+        gradient.setColorAt(0.5, self.HIGHLIGHT_COLOR)
+        gradient.setColorAt(1.0, self.BASE_COLOR)
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(gradient))
+        for bar in self.bars():
+            painter.drawRoundedRect(bar, self.radius, self.radius)
+
+
 # ========== LAYOUT HELPERS ==========
 
 def create_form_field(label_text, input_field, label_size=14, is_bold=True, color="#334155", margin_bottom=5):
@@ -924,6 +1095,10 @@ class FilterComboBox(QComboBox):
 - `__init__(self, parent=None)`
 - `apply_shadow(self, blur_radius=15, offset=4, opacity=25)`
 
+### StyledTableView(QTableView)
+- `__init__(self, parent=None, row_height=50)`
+- `set_column_widths(self, widths, fixed_columns=())`
+
 ## Text Elements
 ### StyledLabel(QLabel)
 - `__init__(self, text, is_title=False, size=None, color=None, font_weight=None, margin_bottom=0, parent=None)`
@@ -969,6 +1144,12 @@ class FilterComboBox(QComboBox):
 ### StyledDateEdit(QDateEdit)
 - `__init__(self, default_date=None, parent=None)`
 
+## Loading Placeholders
+### SkeletonOverlay(QWidget)
+- `__init__(self, target, row_height=None, bar_width=0.6, fill="white", radius=6)`
+- `start(self)`
+- `stop(self)`
+
 ## Utility Functions
 ### create_form_field(label_text, input_field, label_size=14, is_bold=True, color="#334155", margin_bottom=5)
 
@@ -0,0 +1,454 @@
+import numpy as np
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QAbstractProxyModel, QEvent, QModelIndex, QPersistentModelIndex, QRect, Signal
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+# Badge text -> (background, text color)
+TRANSACTION_TYPE_BADGES = {
+    "Buy": ("#DCFCE7", "#166534"),
+    "Sell": ("#FEE2E2", "#991B1B"),
+}
+
+
+class BadgeDelegate(QStyledItemDelegate):
+    """
+    Paints a cell's text as a colored, rounded badge.
+
+    Replaces a per-row QLabel with its own stylesheet: the badge is drawn
+    straight onto the view whenever the cell becomes visible.
+    """
+
+    def __init__(self, colors, parent=None, radius=4, margins=(5, 8)):
+        """
+        Args:
+            colors: Cell text -> (background color, text color); other texts are painted plainly
+            radius: Corner radius of the badge
+            margins: Horizontal and vertical space between the cell and the badge
+        """
+        super().__init__(parent)
+        self.colors = colors
+        self.radius = radius
+        self.margins = margins
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        colors = self.colors.get(opt.text)
+        if colors is None:
+            super().paint(painter, option, index)
+            return
+
+        text, opt.text = opt.text, ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        font = QFont(opt.font)
+        font.setBold(True)
+        horizontal, vertical = self.margins
+        height = min(QFontMetrics(font).height() + 8, opt.rect.height() - 2 * vertical)
+        rect = QRect(opt.rect.left() + horizontal, opt.rect.center().y() - height // 2,
+                     opt.rect.width() - 2 * horizontal, height)
+
+        background, foreground = colors
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect, self.radius, self.radius)
+        painter.setFont(font)
+        painter.setPen(QColor(foreground))
+        painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a push button in every cell of a column and reports clicks on it.
+
+    Stands in for a QPushButton per row: the button is only drawn, and mouse
+    events on the cell are hit-tested against where it was drawn.
+    """
+
+    clicked = Signal(QModelIndex)
+
+    def __init__(self, view, text, color="#FF4D4D", hover_color="#D43F3F", pressed_color="#B53131",
+                 size=(60, 24), radius=4):
+        """
+        Args:
+            view: Item view the delegate is used in (its parent); mouse tracking is enabled on it
+            text: Button label
+            color, hover_color, pressed_color: Background of the button in each state
+            size: Button width and height in pixels
+        """
+        super().__init__(view)
+        self.view = view
+        self.text = text
+        self.colors = {"normal": color, "hover": hover_color, "pressed": pressed_color}
+        self.size = size
+        self.radius = radius
+        self._hovered = QPersistentModelIndex()
+        self._pressed = QPersistentModelIndex()
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def button_rect(self, cell):
+        """Where the button is drawn within a cell"""
+        width, height = self.size
+        return QRect(cell.center().x() - width // 2 + 1, cell.center().y() - height // 2 + 1, width, height)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        state = "pressed" if self._pressed == index else "hover" if self._hovered == index else "normal"
+        font = QFont(opt.font)
+        font.setPixelSize(12)
+        font.setBold(True)
+        rect = self.button_rect(opt.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.colors[state]))
+        painter.drawRoundedRect(rect, self.radius, self.radius)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignCenter, self.text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        kind = event.type()
+        if kind not in (QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+        inside = self.button_rect(option.rect).contains(event.position().toPoint())
+        self._set_hovered(index if inside else QModelIndex())
+
+        if kind == QEvent.MouseButtonPress and inside and event.button() == Qt.LeftButton:
+            self._set_pressed(index)
+            return True
+        if kind == QEvent.MouseButtonRelease and self._pressed.isValid():
+            clicked = inside and self._pressed == index
+            self._set_pressed(QModelIndex())
+            if clicked:
+                self.clicked.emit(index)
+            return True
+        return False
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Leave:
+            self._set_hovered(QModelIndex())
+            self._set_pressed(QModelIndex())
+        return False
+
+    def _set_hovered(self, index):
+        if self._hovered != index:
+            self._repaint(self._hovered)
+            self._hovered = QPersistentModelIndex(index)
+            self._repaint(self._hovered)
+            if self._hovered.isValid():
+                self.view.viewport().setCursor(Qt.PointingHandCursor)
+            else:
+                self.view.viewport().unsetCursor()
+
+    def _set_pressed(self, index):
+        if self._pressed != index:
+            self._repaint(self._pressed)
+            self._pressed = QPersistentModelIndex(index)
+            self._repaint(self._pressed)
+
+    def _repaint(self, index):
+        if index.isValid():
+            self.view.update(self.view.model().index(index.row(), index.column()))
+
+class TransactionTableModel(QAbstractTableModel):
+    """
+    Table model over a TransactionIndex.
+
+    Cells are formatted only when the view asks for them, so a model of a
+    million transactions costs no more to set up than one of ten. Row numbers
+    are the index's row positions (date order).
+    """
+
+    COLUMNS = ["Date", "Symbol", "Type", "Quantity", "Price", "Total"]
+    TYPE_COLUMN = 2
+
+    def __init__(self, transactions=None, parent=None):
+        """
+        Args:
+            transactions: TransactionIndex to show, or None for an empty table
+        """
+        super().__init__(parent)
+        self.transactions = transactions
+        self._bold = QFont("Arial", 10, QFont.Bold)
+
+    def set_transactions(self, transactions):
+        """Show another TransactionIndex."""
+        self.beginResetModel()
+        self.transactions = transactions
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.transactions is None else len(self.transactions)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            tx = self.transactions.transaction(index.row())
+            column = index.column()
+            if column == 0:
+                return tx["date"].split("T")[0]
+            if column == 1:
+                return tx["symbol"]
+            if column == 2:
+                return "Buy" if tx["type"] == 0 else "Sell"
+            if column == 3:
+                return str(tx["quantity"])
+            if column == 4:
+                return f"${tx['price']:.2f}"
+            return f"${(tx['quantity'] * tx['price']):.2f}"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.FontRole and index.column() == 1:
+            return self._bold
+        return None
+
+    def sort_keys(self, column):
+        """Sort key of every row for a column, as a numpy array"""
+        transactions = self.transactions
+        if column == 0:
+            return transactions.days
+        if column == 1:
+            return transactions.codes
+        if column == 2:
+            return transactions.types
+        if column == 3:
+            return transactions.quantity
+        if column == 4:
+            return transactions.price
+        return transactions.quantity * transactions.price
+
+
+class TransactionProxyModel(QAbstractProxyModel):
+    """
+    Sort/filter proxy over a model with numpy sort keys (see TransactionTableModel.sort_keys).
+
+    QSortFilterProxyModel filters and sorts by calling back into Python once
+    per row and per comparison, which does not scale to a million rows. Here
+    the filter is a precomputed array of source rows (e.g. from
+    TransactionIndex.filter) and sorting is one argsort over it.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = np.empty(0, np.int64)  # Proxy row -> source row
+        self._filter = None  # Source rows shown, in source order; None shows all
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._inverse = None  # Source row -> proxy row, built when first needed
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelAboutToBeReset.disconnect(self.beginResetModel)
+            previous.modelReset.disconnect(self._on_source_reset)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._on_source_reset)
+        self._filter = None
+        self._update_rows()
+        self.endResetModel()
+
+    def set_filter(self, rows):
+        """
+        Show only some source rows.
+
+        Args:
+            rows: Array of source rows in source order, or None to show every row
+        """
+        self.beginResetModel()
+        self._filter = rows
+        self._update_rows()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._update_rows()
+        self.endResetModel()
+
+    def _on_source_reset(self):
+        self._filter = None
+        self._update_rows()
+        self.endResetModel()
+
+    def _update_rows(self):
+        source = self.sourceModel()
+        count = source.rowCount() if source is not None else 0
+        rows = np.arange(count) if self._filter is None else np.asarray(self._filter)
+        if self._sort_column >= 0 and len(rows):
+            keys = source.sort_keys(self._sort_column)[rows]
+            if self._sort_order == Qt.DescendingOrder:
+                keys = -keys.astype(np.float64)
+            # Stable, so rows with equal keys stay in date order
+            rows = rows[np.argsort(keys, kind="stable")]
+        self.rows = rows
+        self._inverse = None
+
+    def source_row(self, row):
+        """Source row shown at a proxy row"""
+        return int(self.rows[row])
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self.rows[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._inverse is None:
+            self._inverse = np.full(self.sourceModel().rowCount(), -1, dtype=np.int64)
+            self._inverse[self.rows] = np.arange(len(self.rows))
+        row = int(self._inverse[source_index.row()])
+        return self.index(row, source_index.column()) if row >= 0 else QModelIndex()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self.rows) and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        return section + 1 if role == Qt.DisplayRole else None
+
+
+class HoldingsTableModel(QAbstractTableModel):
+    """
+    Table model of the dashboard holdings.
+
+    New holdings are diffed against the shown ones: when the same symbols
+    are held, only the cells whose values moved are reported as changed, so
+    a price update repaints those cells and nothing else.
+    """
+
+    COLUMNS = ["ID", "Symbol", "Quantity", "Current Price", "Total Value", "Total Gain", "Gain %", "Actions"]
+    ACTION_COLUMN = 7
+    GAIN_COLUMNS = (5, 6)
+    GAIN_COLORS = {1: QColor("#4CAF50"), -1: QColor("#F44336")}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # Per holding: (id, symbol, quantity, price, value, gain, gain %)
+        self._bold = QFont("Arial", 10, QFont.Bold)
+
+    @staticmethod
+    def _row(holding):
+        return (holding.Id, holding.Symbol, holding.Quantity, holding.CurrentPrice, holding.TotalValue,
+                holding.TotalGain, holding.TotalGainPercentage)
+
+    def set_holdings(self, holdings):
+        """
+        Show new holdings, updating only what changed.
+
+        Args:
+            holdings: Holding objects from the dashboard model
+        """
+        rows = [self._row(h) for h in holdings]
+        if [r[1] for r in rows] != [r[1] for r in self.rows]:
+            # A position was opened or closed
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+            return
+
+        previous, self.rows = self.rows, rows
+        for row, (old, new) in enumerate(zip(previous, rows)):
+            changed = [column for column, (a, b) in enumerate(zip(old, new)) if a != b]
+            if changed:
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]),
+                                      [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def update_holdings(self, holdings):
+        """
+        Update some shown holdings in place, matched by symbol; unknown symbols are ignored.
+
+        Args:
+            holdings: Holding objects that changed
+        """
+        rows = {row[1]: index for index, row in enumerate(self.rows)}
+        for holding in holdings:
+            row = rows.get(holding.Symbol)
+            if row is None:
+                continue
+            old, new = self.rows[row], self._row(holding)
+            changed = [column for column, (a, b) in enumerate(zip(old, new)) if a != b]
+            self.rows[row] = new
+            if changed:
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]),
+                                      [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def symbol(self, row):
+        """Symbol of the holding shown in a row"""
+        return self.rows[row][1]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.ACTION_COLUMN:
+                return "Sell"
+            value = self.rows[index.row()][column]
+            if column in (0, 1, 2):
+                return str(value)
+            if column == 6:
+                return f"{value:.2f}%"
+            return f"${value:.2f}"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.FontRole and column == 1:
+            return self._bold
+        if role == Qt.ForegroundRole and column in self.GAIN_COLUMNS:
+            value = self.rows[index.row()][column]
+            return self.GAIN_COLORS.get((value > 0) - (value < 0))
+        return None
@@ -18,12 +18,120 @@ ENDPOINTS = {
 
 
     "stock_details": "/transaction/query/getDetails",
+    "stock_aggregates": "/transaction/query/getAggregates",
 
     "buy_stock": "/transaction/command/buy/{user_id}",
     "sell_stock": "/transaction/command/sell/{user_id}",
 
     "ai_response": "/ai/query/response",
-    "process_pdf": "/api/query/process-pdf"
+    "ai_document": "/AI/query/document",
+    "process_pdf": "/AI/query/process-pdf?reindex={reindex}"
+}
+
+# HTTP transport settings (one pooled session shared by every ApiService)
+HTTP_SETTINGS = {
+    "pool_connections": 4,  # Number of per-host connection pools to keep
+    "pool_maxsize": 16,  # Keep-alive connections per host
+    "max_retries": 3,  # Retries for idempotent requests
+    "backoff_factor": 0.3,  # Sleeps 0.3s, 0.6s, 1.2s between retries
+    "retry_statuses": (502, 503, 504),
+    "timeout": (5, 300),  # (connect, read) seconds; AI responses can be slow
+}
+
+# AI chatbot settings
+AI_SETTINGS = {
+    # The server fingerprints its RAG source document; it is only re-processed when that fingerprint changes
+    "ingestion_retry_min": 30,  # Seconds before asking the server to ingest again after a failure, doubled per failure
+    "ingestion_retry_max": 900,
+}
+
+# Response cache for read endpoints
+CACHE_SETTINGS = {
+    "max_bytes": 32 * 1024 * 1024,  # LRU eviction once cached bodies exceed this size
+    "stale_while_revalidate": 600,  # Seconds a stale entry is still served while it refreshes in the background
+    # Seconds an entry is fresh; endpoints not listed here are never cached. Stock details and
+    # aggregates are left out on purpose: AggregateCache keeps bars and metadata with its own TTLs.
+    "ttl": {
+        "holdings": 30,
+        "transactions": 60,
+        "cash_balance": 5,
+        "profit": 15,
+    },
+    "invalidates": {  # Successful POSTs drop the cached endpoints they change
+        "deposit_money": ("cash_balance",),
+        "withdraw_money": ("cash_balance",),
+        "buy_stock": ("holdings", "transactions", "cash_balance", "profit"),
+        "sell_stock": ("holdings", "transactions", "cash_balance", "profit"),
+    },
+}
+
+# Per-ticker cache of daily aggregate bars; only missing date ranges are fetched
+AGGREGATE_CACHE_SETTINGS = {
+    "max_tickers": 50,  # Least recently used tickers are dropped beyond this
+    "metadata_ttl": 300,  # Seconds before name, logo and current price are re-requested
+    "refresh_days": 7,  # Trailing window of bars re-fetched along with the metadata
+    "today_ttl": 300,  # Seconds before today's still-forming bar is re-requested
+}
+
+# Portfolio risk metrics on the dashboard
+RISK_SETTINGS = {
+    "benchmark": "SPY",  # Ticker that beta and correlation are measured against
+    "history_days": 5 * 365,  # Calendar days of daily closes fetched for the holdings and the benchmark
+    "rolling_window": 63,  # Trading days per window of the rolling correlation
+    "risk_free_rate": 0.0,  # Annual rate subtracted in Sharpe and Sortino
+}
+
+# Worker processes for CPU-bound analytics (simulations, backtest sweeps)
+PROCESS_POOL_SETTINGS = {
+    "max_workers": None,  # None uses every core
+}
+
+# Monte Carlo VaR / CVaR simulation of the current holdings
+SIMULATION_SETTINGS = {
+    "paths": 1_000_000,
+    "method": "bootstrap",  # "bootstrap" resamples historical days, "normal" draws correlated normal returns
+    "lookback_days": 756,  # Trading days of history the returns are drawn from
+    "horizons": (1, 10),  # Trading days ahead
+    "confidence": (0.95, 0.99),
+    "shards_per_worker": 4,  # More shards than workers give finer progress and balance the load
+    "batch_paths": 50_000,  # Paths simulated at once inside a shard, bounds worker memory
+    "histogram_bins": 50,
+}
+
+# Strategy backtests on the Stocks page
+BACKTEST_SETTINGS = {
+    "cost_bps": 5.0,  # Commission and slippage per unit of turnover, in basis points
+    "runs_per_task": 100,  # Parameter sets simulated together in one worker task
+    "rank_by": "sharpe",  # Statistic sweep results are sorted by, best first
+}
+
+# Live quotes for the dashboard holdings, polled from a quote endpoint (see devtools/quote_server.py)
+QUOTE_SETTINGS = {
+    "url": "http://localhost:5040/api/quotes",  # GET ?symbols=AAPL,MSFT -> [{"symbol", "price", "timestamp"}]
+    "interval": 5.0,  # Seconds between polls while the market is open
+    "closed_interval": 60.0,  # Seconds between polls outside market hours
+    "jitter": 0.2,  # Each interval is randomly stretched or shrunk by up to this fraction
+    "timezone": "America/New_York",
+    "market_open": "09:30",  # Regular session, weekdays, in the timezone above
+    "market_close": "16:00",
+    "timeout": 5,  # Seconds per request
+}
+
+# Quotes pushed over a WebSocket (see devtools/feed_simulator.py); polling is the fallback while it is down
+STREAM_SETTINGS = {
+    "url": "ws://localhost:5041/quotes",
+    "frame_rate": 20,  # Most deliveries per second to the UI; ticks in between are coalesced per symbol
+    "reconnect_min": 0.5,  # Seconds before the first reconnect attempt, doubled after each failure
+    "reconnect_max": 30.0,
+    "open_timeout": 5,  # Seconds to wait for the handshake
+}
+
+# Page presenters are created once per session; revisiting a page refreshes it only once its data is this old
+NAVIGATION_SETTINGS = {
+    "max_age": {  # Seconds a page's data stays fresh; pages not listed never refresh on navigation
+        "dashboard": 60,
+        "history": 300,
+    },
 }
 
 # UI Configuration
@@ -42,4 +150,8 @@ THEME = {
 CHART_SETTINGS = {
     "default_days": 30,
     "theme": "light",
+    "pixels_per_bar": 3,  # Candles narrower than this are merged into wider bars
+    "pixels_per_point": 1,  # Line charts keep at most one point per horizontal pixel
+    "stream_threshold": 1000,  # Bar counts above this are streamed to the chart as packed binary chunks
+    "stream_chunk_bars": 1000,  # Bars per streamed chunk
 }
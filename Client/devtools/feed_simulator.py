@@ -0,0 +1,234 @@
+"""
+Local WebSocket quote feed for QuoteStream, with synthetic or recorded ticks.
+
+Speaks the stream protocol at ws://127.0.0.1:<port>/quotes:
+    -> {"action": "subscribe" | "unsubscribe", "symbols": ["AAPL", ...]}
+    <- [{"symbol": "AAPL", "price": 187.31, "timestamp": 1718900000000}, ...]
+Ticks are sent in batches, one message per client every --batch-interval.
+
+Synthetic mode gives every subscribed symbol --rate ticks a second on
+average, as a random walk starting from the stub API server's last daily
+close. Replay mode plays a JSON-lines recording ({"symbol", "price",
+"timestamp"} per line, e.g. written with --record) at --speed times its
+original pace, with timestamps shifted to the present; only subscribed
+symbols are sent.
+
+Usage (from the Client directory):
+    python devtools/feed_simulator.py --rate 10 --stats 5
+    python devtools/feed_simulator.py --rate 10 --record /tmp/ticks.jsonl
+    python devtools/feed_simulator.py --replay /tmp/ticks.jsonl --speed 4 --loop
+
+Load test: subscribe a client to 1000 symbols (any names) with --rate 10
+for 10,000 ticks a second; --stats reports what was actually sent. Add
+--seeded-prices, since generating each symbol's daily history to find its
+last close takes a noticeable moment per symbol.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import zlib
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+try:
+    from devtools.stub_api_server import MarketData
+except ImportError:  # Run as a script from the Client directory
+    from stub_api_server import MarketData
+
+
+class SyntheticTicks:
+    """Random-walk ticks for any symbol asked for, at a fixed average rate per symbol"""
+
+    def __init__(self, rate=10.0, volatility=0.0005, anchor=True, seed=None):
+        """
+        Args:
+            rate: Average ticks per symbol per second
+            volatility: Standard deviation of the log price change per second
+            anchor: Start from the stub server's last close; otherwise from a price seeded by the symbol,
+                which is much cheaper for thousands of symbols
+        """
+        self.rate = rate
+        self.volatility = volatility
+        self.market = MarketData() if anchor else None
+        self.rng = random.Random(seed)
+        self.prices = {}  # Symbol -> current price
+
+    def _initial_price(self, symbol):
+        try:
+            if self.market is not None:
+                return self.market.last_price(symbol)
+        except IndexError:  # No bars generated (e.g. run on the history start date)
+            pass
+        return random.Random(zlib.crc32(symbol.encode())).uniform(20, 400)
+
+    def ticks(self, symbols, elapsed):
+        """Ticks of some symbols over the last `elapsed` seconds, in time order"""
+        now = time.time()
+        expected = self.rate * elapsed
+        step = self.volatility * math.sqrt(1 / self.rate) if self.rate else 0.0
+        ticks = []
+        for symbol in symbols:
+            price = self.prices.get(symbol)
+            if price is None:
+                price = self._initial_price(symbol)
+            # Whole expected ticks plus one more with the fractional remainder's probability
+            count = int(expected) + (self.rng.random() < expected % 1)
+            for index in range(count):
+                price *= math.exp(self.rng.gauss(0.0, step))
+                timestamp = int((now - elapsed + elapsed * (index + 1) / count) * 1000)
+                ticks.append({"symbol": symbol, "price": round(price, 2), "timestamp": timestamp})
+            self.prices[symbol] = price
+        ticks.sort(key=lambda tick: tick["timestamp"])
+        return ticks
+
+
+class RecordedTicks:
+    """Ticks from a JSON-lines recording, replayed in real time scaled by a speed factor"""
+
+    def __init__(self, path, speed=1.0, loop=False):
+        with open(path, encoding="utf-8") as file:
+            self.recording = sorted((json.loads(line) for line in file if line.strip()),
+                                    key=lambda tick: tick["timestamp"])
+        if not self.recording:
+            raise ValueError(f"No ticks in {path}")
+        self.speed = speed
+        self.loop = loop
+        self.position = 0
+        self.started = time.time()
+        self.offset = self.recording[0]["timestamp"]  # Recording time at self.started
+
+    def ticks(self, symbols, elapsed):
+        ticks = self._due(symbols)
+        if self.position == len(self.recording) and self.loop:
+            # Start over from the current time
+            self.position = 0
+            self.started = time.time()
+            ticks += self._due(symbols)
+        return ticks
+
+    def _due(self, symbols):
+        """Recorded ticks up to the current replay time, with timestamps shifted to the present"""
+        now = time.time()
+        due = self.offset + (now - self.started) * 1000 * self.speed
+        shift = int(now * 1000 - due)
+        ticks = []
+        while self.position < len(self.recording) and self.recording[self.position]["timestamp"] <= due:
+            tick = self.recording[self.position]
+            self.position += 1
+            if tick["symbol"] in symbols:
+                ticks.append({**tick, "timestamp": int(tick["timestamp"] + shift)})
+        return ticks
+
+
+class FeedSimulator:
+    def __init__(self, source, batch_interval=0.05, record=None, verbose=False):
+        self.source = source
+        self.batch_interval = batch_interval
+        self.record = open(record, "a", encoding="utf-8") if record else None
+        self.verbose = verbose
+        self.clients = {}  # Connection -> set of subscribed symbols
+        self.sent = 0  # Ticks sent, summed over clients
+
+    async def handle(self, connection):
+        self.clients[connection] = set()
+        if self.verbose:
+            print(f"Client connected from {connection.remote_address}")
+        try:
+            async for message in connection:
+                try:
+                    request = json.loads(message)
+                    symbols = {str(s).upper() for s in request["symbols"]}
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if request.get("action") == "subscribe":
+                    self.clients[connection] |= symbols
+                elif request.get("action") == "unsubscribe":
+                    self.clients[connection] -= symbols
+                if self.verbose:
+                    print(f"{request.get('action')} {len(symbols)} symbols "
+                          f"({len(self.clients[connection])} subscribed)")
+        except ConnectionClosed:
+            pass
+        finally:
+            del self.clients[connection]
+            if self.verbose:
+                print("Client disconnected")
+
+    async def publish(self):
+        """Every batch interval, send each client the new ticks of its symbols"""
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(self.batch_interval)
+            now = time.monotonic()
+            elapsed, last = now - last, now
+            symbols = set().union(*self.clients.values())
+            ticks = self.source.ticks(symbols, elapsed)
+            if not ticks:
+                continue
+            if self.record:
+                self.record.writelines(json.dumps(tick) + "\n" for tick in ticks)
+            for connection, subscribed in list(self.clients.items()):
+                batch = ticks if subscribed >= symbols else [t for t in ticks if t["symbol"] in subscribed]
+                if batch:
+                    try:
+                        await connection.send(json.dumps(batch, separators=(",", ":")))
+                        self.sent += len(batch)
+                    except ConnectionClosed:
+                        pass
+
+    async def report(self, interval):
+        sent = self.sent
+        while True:
+            await asyncio.sleep(interval)
+            symbols = len(set().union(*self.clients.values()))
+            print(f"{len(self.clients)} clients, {symbols} symbols, {(self.sent - sent) / interval:,.0f} ticks/s sent")
+            sent = self.sent
+
+
+async def run(simulator, port, stats=0.0):
+    """Serve the feed until cancelled"""
+    async with serve(simulator.handle, "127.0.0.1", port):
+        print(f"Feed simulator listening on ws://127.0.0.1:{port}/quotes")
+        tasks = [asyncio.create_task(simulator.publish())]
+        if stats:
+            tasks.append(asyncio.create_task(simulator.report(stats)))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if simulator.record:
+                simulator.record.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local WebSocket quote feed with synthetic or recorded ticks")
+    parser.add_argument("--port", type=int, default=5041)
+    parser.add_argument("--rate", type=float, default=10.0, help="Synthetic ticks per symbol per second")
+    parser.add_argument("--volatility", type=float, default=0.0005, help="Std. dev. of the log price change per second")
+    parser.add_argument("--seeded-prices", action="store_true",
+                        help="Start symbols at a price seeded by the name instead of the stub server's last close")
+    parser.add_argument("--batch-interval", type=float, default=0.05, help="Seconds between messages to a client")
+    parser.add_argument("--replay", help="JSON-lines recording to play instead of synthetic ticks")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor")
+    parser.add_argument("--loop", action="store_true", help="Restart the recording when it ends")
+    parser.add_argument("--record", help="Append every tick generated to this JSON-lines file")
+    parser.add_argument("--stats", type=float, default=0.0, help="Print throughput every this many seconds")
+    parser.add_argument("--verbose", action="store_true", help="Log connections and subscriptions")
+    args = parser.parse_args()
+
+    source = (RecordedTicks(args.replay, args.speed, args.loop) if args.replay
+              else SyntheticTicks(args.rate, args.volatility, anchor=not args.seeded_prices))
+    simulator = FeedSimulator(source, args.batch_interval, args.record, args.verbose)
+    try:
+        asyncio.run(run(simulator, args.port, args.stats))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
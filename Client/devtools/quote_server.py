@@ -0,0 +1,136 @@
+"""
+Local stand-in for a live quote endpoint.
+
+Serves GET /api/quotes?symbols=AAPL,MSFT with the current price of each
+symbol, as the dashboard's QuoteService expects:
+    [{"symbol": "AAPL", "price": 187.31, "timestamp": 1718900000000}, ...]
+
+Prices start from the stub API server's last daily close (so they agree with
+its holdings) and follow a random walk in real time. Between two requests a
+symbol only moves with some probability, so pollers see a mix of changed and
+unchanged quotes.
+
+Usage (from the Client directory):
+    python devtools/quote_server.py --port 5040 --volatility 0.0005 --move-probability 0.6
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+try:
+    from devtools.stub_api_server import MarketData
+except ImportError:  # Run as a script from the Client directory
+    from stub_api_server import MarketData
+
+
+class QuoteBook:
+    """Current price of every symbol asked for so far, moved forward on each request"""
+
+    def __init__(self, volatility=0.0005, move_probability=0.6, seed=None):
+        """
+        Args:
+            volatility: Standard deviation of the log price change per second
+            move_probability: Chance that a symbol's price moved since the previous request
+        """
+        self.volatility = volatility
+        self.move_probability = move_probability
+        self.market = MarketData()
+        self.rng = random.Random(seed)
+        self.quotes = {}  # Symbol -> [price, time of the last move]
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def _initial_price(self, symbol):
+        try:
+            return self.market.last_price(symbol)
+        except IndexError:  # No bars generated (e.g. run on the history start date)
+            return random.Random(zlib.crc32(symbol.encode())).uniform(20, 400)
+
+    def quote(self, symbol, now):
+        entry = self.quotes.get(symbol)
+        if entry is None:
+            entry = self.quotes[symbol] = [self._initial_price(symbol), now]
+        elif self.rng.random() < self.move_probability:
+            elapsed = max(now - entry[1], 1e-3)
+            entry[0] *= math.exp(self.rng.gauss(0.0, self.volatility * math.sqrt(elapsed)))
+            entry[1] = now
+        return {"symbol": symbol, "price": round(entry[0], 2), "timestamp": int(entry[1] * 1000)}
+
+    def quotes_for(self, symbols):
+        now = time.time()
+        with self.lock:
+            self.requests += 1
+            return [self.quote(symbol, now) for symbol in symbols]
+
+
+class QuoteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real backend
+    book = None
+    latency = 0.0
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/api/quotes":
+            return self._send_json(404, {"message": f"No route for {url.path}"})
+        symbols = [s.strip().upper() for s in parse_qs(url.query).get("symbols", [""])[0].split(",") if s.strip()]
+        if not symbols:
+            return self._send_json(400, {"message": "symbols is required"})
+        self._send_json(200, self.book.quotes_for(symbols))
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(port=5040, latency=0.0, volatility=0.0005, move_probability=0.6, verbose=False):
+    """Build (but do not start) a quote server bound to localhost:port"""
+    handler = type("BoundQuoteHandler", (QuoteHandler,), {
+        "book": QuoteBook(volatility, move_probability),
+        "latency": latency,
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for a live quote endpoint")
+    parser.add_argument("--port", type=int, default=5040)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of artificial delay per request")
+    parser.add_argument("--volatility", type=float, default=0.0005, help="Std. dev. of the log price change per second")
+    parser.add_argument("--move-probability", type=float, default=0.6,
+                        help="Chance a symbol moved since the previous request")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.latency, args.volatility, args.move_probability, args.verbose)
+    print(f"Quote server listening on http://127.0.0.1:{args.port}/api/quotes")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Served {server.RequestHandlerClass.book.requests} quote requests")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
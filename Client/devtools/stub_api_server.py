@@ -0,0 +1,386 @@
+"""
+Local stand-in for the ASP.NET backend.
+
+Serves the endpoints listed in config.ENDPOINTS from in-memory state with
+synthetic, deterministic market data, so the client can be run and profiled
+without the real server, SQL Server or Polygon. Read endpoints send ETag and
+Last-Modified headers and honour If-None-Match / If-Modified-Since with 304.
+
+Usage (from the Client directory):
+    python devtools/stub_api_server.py --port 5039 --latency 0.2 --trades 5000
+"""
+import argparse
+import datetime
+import email.utils
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+HISTORY_START = datetime.date(2015, 1, 2)
+try:
+    EASTERN = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:  # Windows without the tzdata package
+    EASTERN = datetime.timezone(datetime.timedelta(hours=-5))
+SYMBOLS = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "NVDA", "META", "NFLX", "AMD", "INTC"]
+
+
+class MarketData:
+    """Deterministic synthetic daily bars per ticker (a seeded random walk over weekdays)"""
+
+    def __init__(self):
+        self._bars = {}
+        self._lock = threading.Lock()
+
+    def bars(self, ticker):
+        with self._lock:
+            if ticker not in self._bars:
+                self._bars[ticker] = self._generate(ticker)
+            return self._bars[ticker]
+
+    @staticmethod
+    def _generate(ticker):
+        rng = random.Random(zlib.crc32(ticker.encode()))
+        price = rng.uniform(20, 400)
+        bars = []
+        day = HISTORY_START
+        today = datetime.date.today()
+        while day <= today:
+            if day.weekday() < 5:
+                open_ = price
+                close = max(1.0, open_ * (1 + rng.gauss(0.0003, 0.018)))
+                high = max(open_, close) * (1 + abs(rng.gauss(0, 0.006)))
+                low = min(open_, close) * (1 - abs(rng.gauss(0, 0.006)))
+                timestamp = _date_ms(day.isoformat())
+                bars.append({
+                    "t": timestamp, "o": round(open_, 4), "h": round(high, 4), "l": round(low, 4),
+                    "c": round(close, 4), "v": float(rng.randint(100_000, 50_000_000)),
+                })
+                price = close
+            day += datetime.timedelta(days=1)
+        return bars
+
+    def last_price(self, ticker):
+        return self.bars(ticker)[-1]["c"]
+
+    def aggregates(self, ticker, start, end):
+        start_ms = _date_ms(start)
+        # Exclusive, as the end day's bar is stamped at its start
+        end_ms = _date_ms((datetime.date.fromisoformat(end[:10]) + datetime.timedelta(days=1)).isoformat())
+        results = [b for b in self.bars(ticker) if start_ms <= b["t"] < end_ms]
+        return {
+            "ticker": ticker, "queryCount": len(results), "resultsCount": len(results),
+            "adjusted": True, "results": results, "status": "OK",
+        }
+
+
+class StubState:
+    """In-memory users, trades and cash balances"""
+
+    def __init__(self, market, seed_trades=0):
+        self.market = market
+        self.lock = threading.Lock()
+        self.users = {1: {"id": 1, "name": "demo", "email": "demo@example.com",
+                          "cash": 100_000.0, "profit": 0.0, "trades": [], "modified": time.time()}}
+        if seed_trades:
+            self._seed(self.users[1], seed_trades)
+
+    def _seed(self, user, count):
+        rng = random.Random(42)
+        bars_by_symbol = {s: self.market.bars(s) for s in SYMBOLS}
+        held = {s: 0.0 for s in SYMBOLS}
+        picks = sorted(rng.randrange(len(bars_by_symbol[SYMBOLS[0]])) for _ in range(count))
+        for index in picks:
+            symbol = rng.choice(SYMBOLS)
+            bar = bars_by_symbol[symbol][min(index, len(bars_by_symbol[symbol]) - 1)]
+            is_sell = held[symbol] > 0 and rng.random() < 0.4
+            quantity = float(rng.randint(1, int(held[symbol])) if is_sell else rng.randint(1, 20))
+            held[symbol] += -quantity if is_sell else quantity
+            date = datetime.datetime.fromtimestamp(bar["t"] / 1000, tz=datetime.timezone.utc)
+            user["trades"].append({
+                "id": len(user["trades"]) + 1, "symbol": symbol, "date": date.replace(tzinfo=None).isoformat(),
+                "type": 1 if is_sell else 0, "quantity": quantity, "price": bar["c"],
+            })
+
+    def user(self, user_id):
+        return self.users.get(int(user_id))
+
+    def holdings(self, user):
+        positions = {}
+        for trade in user["trades"]:
+            quantity, cost = positions.get(trade["symbol"], (0.0, 0.0))
+            sign = 1 if trade["type"] == 0 else -1
+            positions[trade["symbol"]] = (quantity + sign * trade["quantity"],
+                                          cost + sign * trade["quantity"] * trade["price"])
+        result = []
+        for symbol, (quantity, cost) in positions.items():
+            if quantity <= 0:
+                continue
+            buy_price = cost / quantity
+            price = self.market.last_price(symbol)
+            gain = (price - buy_price) * quantity
+            result.append({
+                "id": 0, "symbol": symbol, "quantity": quantity, "currentPrice": price,
+                "totalValue": quantity * price, "totalGain": gain,
+                "totalGainPercentage": gain / (buy_price * quantity) * 100 if buy_price > 0 else 0,
+            })
+        return result
+
+    def trade(self, user, ticker, quantity, is_sell):
+        price = self.market.last_price(ticker)
+        if is_sell:
+            owned = sum(t["quantity"] * (1 if t["type"] == 0 else -1)
+                        for t in user["trades"] if t["symbol"] == ticker)
+            if owned < quantity:
+                return None, "Not enough shares to sell."
+            user["cash"] += quantity * price
+        else:
+            if user["cash"] < quantity * price:
+                return None, "Insufficient funds."
+            user["cash"] -= quantity * price
+        trade = {"id": len(user["trades"]) + 1, "symbol": ticker, "date": datetime.datetime.now().isoformat(),
+                 "type": 1 if is_sell else 0, "quantity": quantity, "price": price}
+        user["trades"].append(trade)
+        user["modified"] = time.time()
+        return trade, None
+
+
+def _date_ms(text):
+    """Midnight US/Eastern of a "yyyy-MM-dd" day, where Polygon stamps daily bars"""
+    day = datetime.date.fromisoformat(text[:10])
+    return int(datetime.datetime(day.year, day.month, day.day, tzinfo=EASTERN).timestamp() * 1000)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state = None
+    latency = 0.0
+    protocol_version = "HTTP/1.1"  # Keep-alive, like Kestrel
+
+    GET_ROUTES = [
+        (re.compile(r"^/api/trading/query/holdings/(\d+)$"), "holdings"),
+        (re.compile(r"^/api/trading/query/trades/(\d+)$"), "trades"),
+        (re.compile(r"^/api/trading/query/cashbalance/(\d+)$"), "cash_balance"),
+        (re.compile(r"^/api/trading/query/profit/(\d+)$"), "profit"),
+        (re.compile(r"^/api/transaction/query/getDetails$"), "details"),
+        (re.compile(r"^/api/transaction/query/getAggregates$"), "aggregates"),
+        (re.compile(r"^/api/ai/query/response$", re.IGNORECASE), "ai_response"),
+        (re.compile(r"^/api/ai/query/document$", re.IGNORECASE), "ai_document"),
+    ]
+    POST_ROUTES = [
+        (re.compile(r"^/api/auth/query/signin$"), "signin"),
+        (re.compile(r"^/api/auth/command/signup$"), "signup"),
+        (re.compile(r"^/api/cashBalance/command/deposit$"), "deposit"),
+        (re.compile(r"^/api/cashBalance/command/withdraw$"), "withdraw"),
+        (re.compile(r"^/api/transaction/command/buy/(\d+)$"), "buy"),
+        (re.compile(r"^/api/transaction/command/sell/(\d+)$"), "sell"),
+        (re.compile(r"^/api/ai/query/process-pdf$", re.IGNORECASE), "process_pdf"),
+    ]
+
+    def do_GET(self):
+        self._dispatch(self.GET_ROUTES, "get_")
+
+    def do_POST(self):
+        self._dispatch(self.POST_ROUTES, "post_")
+
+    def _dispatch(self, routes, prefix):
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        for pattern, name in routes:
+            match = pattern.match(url.path)
+            if match:
+                with self.state.lock:
+                    getattr(self, prefix + name)(query, *match.groups())
+                return
+        self._send_json(404, {"message": f"No stub route for {url.path}"})
+
+    # Read endpoints
+
+    def get_holdings(self, query, user_id):
+        user = self.state.user(user_id)
+        if not user or not user["trades"]:
+            return self._send_json(404, {"message": "No trades found for this user."})
+        self._send_cacheable(self.state.holdings(user), user["modified"])
+
+    def get_trades(self, query, user_id):
+        user = self.state.user(user_id)
+        since = query.get("since")
+        if not user or (not user["trades"] and since is None):
+            return self._send_json(404, {"message": "No trades found for this user."})
+        trades = user["trades"] if since is None else [t for t in user["trades"] if t["date"] >= since]
+        self._send_cacheable(trades, user["modified"])
+
+    def get_cash_balance(self, query, user_id):
+        user = self.state.user(user_id)
+        if not user:
+            return self._send_json(404, {"message": "User not found."})
+        self._send_cacheable(user["cash"], user["modified"])
+
+    def get_profit(self, query, user_id):
+        user = self.state.user(user_id)
+        if not user:
+            return self._send_json(404, {"message": "User not found."})
+        self._send_cacheable(user["profit"], user["modified"])
+
+    def get_details(self, query):
+        ticker = query.get("ticker", "").upper()
+        if not ticker or "startDate" not in query or "endDate" not in query:
+            return self._send_json(400, {"message": "Ticker, startDate, and endDate are required."})
+        aggregates = self.state.market.aggregates(ticker, query["startDate"], query["endDate"])
+        body = {
+            "ticker": ticker, "name": f"{ticker} Inc.",
+            "description": f"Synthetic data for {ticker} served by the local stub server.",
+            "logoBase64": None, "sellPrice": self.state.market.last_price(ticker),
+            # Like the server, whose gateway returns no data for an empty range
+            "aggregateData": json.dumps(aggregates, separators=(",", ":")) if aggregates["queryCount"] else None,
+        }
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+        self._send_cacheable(body, today.timestamp())
+
+    def get_aggregates(self, query):
+        ticker = query.get("ticker", "").upper()
+        if not ticker or "startDate" not in query or "endDate" not in query:
+            return self._send_json(400, {"message": "Ticker, startDate, and endDate are required."})
+        aggregates = self.state.market.aggregates(ticker, query["startDate"], query["endDate"])
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+        self._send_cacheable(aggregates, today.timestamp())
+
+    def get_ai_response(self, query):
+        self._send_json(200, {"response": f"(stub) You asked: {query.get('query', '')}"})
+
+    def get_ai_document(self, query):
+        document = b"Stub RAG document"
+        self._send_json(200, {"fileName": "train_data.pdf", "size": len(document),
+                              "sha256": hashlib.sha256(document).hexdigest()})
+
+    # Write endpoints
+
+    def post_signin(self, query):
+        user = self.state.users[1]
+        self._send_json(200, {"user": {"id": user["id"], "name": user["name"], "email": user["email"]}})
+
+    def post_signup(self, query):
+        self.post_signin(query)
+
+    def post_deposit(self, query):
+        body = self._read_json()
+        user = self.state.user(body.get("userId", 1))
+        user["cash"] += float(body.get("amount", 0))
+        user["modified"] = time.time()
+        self._send_json(200, user["cash"])
+
+    def post_withdraw(self, query):
+        body = self._read_json()
+        user = self.state.user(body.get("userId", 1))
+        amount = float(body.get("amount", 0))
+        if amount > user["cash"]:
+            return self._send_json(400, {"message": "Insufficient funds."})
+        user["cash"] -= amount
+        user["modified"] = time.time()
+        self._send_json(200, user["cash"])
+
+    def post_buy(self, query, user_id):
+        self._post_trade(user_id, is_sell=False)
+
+    def post_sell(self, query, user_id):
+        self._post_trade(user_id, is_sell=True)
+
+    def _post_trade(self, user_id, is_sell):
+        body = self._read_json()
+        user = self.state.user(user_id)
+        trade, error = self.state.trade(user, str(body.get("ticker", "")).upper(),
+                                        float(body.get("quantity", 0)), is_sell)
+        if error:
+            return self._send_json(400, {"message": error})
+        key = "sellTrade" if is_sell else "buyTrade"
+        self._send_json(200, {"message": "Trade completed successfully.", key: trade})
+
+    def post_process_pdf(self, query):
+        self._read_json()  # Drain the body so the keep-alive connection stays usable
+        # Plain text, like AIController.ProcessPdf
+        self._send(200, b"PDF processing complete", content_type="text/plain; charset=utf-8")
+
+    # Helpers
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send_cacheable(self, payload, modified_at):
+        """Send payload with validators, or 304 when the client's copy is still current"""
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        last_modified = email.utils.formatdate(int(modified_at), usegmt=True)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        not_modified = False
+        if if_none_match is not None:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(",")]
+        elif if_modified_since:
+            since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            not_modified = int(modified_at) <= since
+
+        headers = {"ETag": etag, "Last-Modified": last_modified, "Cache-Control": "no-cache"}
+        if not_modified:
+            return self._send(304, b"", headers)
+        self._send(200, body, headers)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, separators=(",", ":")).encode())
+
+    def _send(self, status, body, headers=None, content_type="application/json; charset=utf-8"):
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(port=5039, latency=0.0, seed_trades=0, verbose=False):
+    """Build (but do not start) a stub server bound to localhost:port"""
+    handler = type("BoundStubHandler", (StubHandler,), {
+        "state": StubState(MarketData(), seed_trades),
+        "latency": latency,
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the stock portfolio backend")
+    parser.add_argument("--port", type=int, default=5039)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of artificial delay per request")
+    parser.add_argument("--trades", type=int, default=200, help="Synthetic trades to seed for user 1")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.latency, args.trades, args.verbose)
+    print(f"Stub API listening on http://127.0.0.1:{args.port}/api (user id 1)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from views.main_view import Main_view
 
 
 from services.api_service import ApiService
+from services.async_bridge import AsyncBridge
 
 
 class MainWindow(QMainWindow):
@@ -72,6 +73,10 @@ def main():
     # Create application
     app = QApplication(sys.argv)
 
+    # Start the asyncio loop that presenters await API calls on
+    bridge = AsyncBridge.instance()
+    app.aboutToQuit.connect(bridge.shutdown)
+
     # Create views
     main_window = MainWindow()
 
@@ -1,7 +1,16 @@
+import asyncio
 import datetime
 
 from PySide6.QtCore import Signal
+from analytics.equity_curve import EquityCurve
+from analytics.positions import PositionBook
+from analytics.risk import RiskEngine, TRADING_DAYS
+from config import RISK_SETTINGS, SIMULATION_SETTINGS
+from services.aggregate_cache import AggregateCache
 from services.api_service import ApiService
+from services.async_api_service import AsyncApiService
+from services.local_store import LocalStore
+from services.trade_sync import TradeSyncService
 
 
 class Holding:
@@ -19,52 +28,303 @@ class DashboardModel:
 
     def __init__(self):
         self.api_service = ApiService()
+        self.async_api = AsyncApiService(self.api_service)
+        self.store = LocalStore.instance()
+        self.trade_sync = TradeSyncService(self.api_service, self.store)
+        self.aggregate_cache = AggregateCache.instance()
+        self.equity_curve = EquityCurve()
+        self.positions = PositionBook.instance()
+        self.risk_engine = RiskEngine.instance()
+        self.closes = {}  # Symbol -> daily bars from the last load
+        self.benchmark = None  # Daily bars of RISK_SETTINGS["benchmark"] from the last load
+        self.live_prices = {}  # Symbol -> latest quote, preferred over the last daily close
         self.holdings = []
+        self.trades_loaded = False  # Whether the local trade log could be synced
         self.transactions = []
+        self.cash_balance = 0.0
+        self.total_gain = 0.0
         self.user_id = None  # Store user ID for easy reference
 
     def fetch_holdings(self, user_id):
-        """Fetch holdings from backend"""
+        """Fetch holdings from backend (used only when the trade log is unavailable)"""
         self.user_id = user_id  # Store user_id for future calls
-        status, response = self.api_service.get_holdings(user_id)
+        self._set_holdings(*self.api_service.get_holdings(user_id))
+
+    async def fetch_holdings_async(self, user_id):
+        """Fetch holdings from backend without blocking the caller's event loop"""
+        self.user_id = user_id
+        self._set_holdings(*await self.async_api.get_holdings(user_id))
+
+    def _set_holdings(self, status, response):
         if status and isinstance(response, list):  # Assuming response is a list of holdings
-            self.holdings = [
-                Holding(h["id"], h["symbol"], h["quantity"], h["currentPrice"], h["totalGain"],
-                        h["totalGainPercentage"])
-                for h in response
-            ]
+            self.store.save_holdings(self.user_id, response)
         else:
             print("Error fetching holdings:", response)
+            response = self.store.load_holdings(self.user_id)  # Fall back to the last snapshot
+            if response is None:
+                return
+        self._build_holdings(response)
+
+    def _build_holdings(self, response):
+        self.holdings = [
+            Holding(h["id"], h["symbol"], h["quantity"], h["currentPrice"], h["totalGain"],
+                    h["totalGainPercentage"])
+            for h in response
+        ]
+
+    def update_holdings(self, closes):
+        """
+        Build holdings from the position book, replaying only trades it has not seen.
+
+        Args:
+            closes: Symbol -> OHLCVSeries of daily bars; the last close prices each position
+        """
+        self.positions.sync(self.user_id, self.transactions)
+        prices = {s: series.close[-1] for s, series in closes.items() if len(series)}
+        self.positions.update_prices({**prices, **self.live_prices})
+        self.refresh_holdings()
+
+    def apply_quotes(self, prices):
+        """
+        Reprice the holdings with live quotes, without rebuilding the others.
+
+        Args:
+            prices: Symbol -> latest price, for the symbols whose price changed
+
+        Returns:
+            list: The Holding objects that changed
+        """
+        self.live_prices.update(prices)
+        # Later rebuilds from the position book start from these prices; its listeners are
+        # not notified, as they would rebuild every holding for a price tick
+        self.positions.update_prices(prices, notify=False)
+
+        changed = []
+        for index, holding in enumerate(self.holdings):
+            price = prices.get(holding.Symbol)
+            if price is None or price == holding.CurrentPrice:
+                continue
+            cost = holding.TotalValue - holding.TotalGain
+            gain = holding.TotalGain + (price - holding.CurrentPrice) * holding.Quantity
+            self.holdings[index] = Holding(holding.Id, holding.Symbol, holding.Quantity, price, gain,
+                                           gain / cost * 100 if cost > 0 else 0.0)
+            # The server's total gain includes the open positions at their earlier price
+            self.total_gain += gain - holding.TotalGain
+            changed.append(self.holdings[index])
+        return changed
+
+    def refresh_holdings(self):
+        """Rebuild the holdings list from the position book as it is now"""
+        if self.positions.user_id != self.user_id:
+            return
+        holdings = self.positions.holdings()
+        self.store.save_holdings(self.user_id, holdings)
+        self._build_holdings(holdings)
 
     def fetch_trades(self, user_id):
-        """Fetch transactions from backend"""
+        """Sync new transactions from backend into the local store and load them all"""
         self.user_id = user_id
-        status, response = self.api_service.get_transactions(user_id)
-
-        if status and isinstance(response, list):  # Assuming response is a list of trades
-            self.transactions = [
-                {"TradeDate": t["date"],
-                 "PortfolioValue": t.get("quantity", 0) * t.get("price", 0) * (2 * t.get("type", 0) - 1)}
-                for t in response
-            ]
-            self.transactions.sort(key=lambda x: x["TradeDate"])
+        self._set_trades(*self.trade_sync.sync(user_id))
+
+    async def fetch_trades_async(self, user_id):
+        """Sync and load transactions without blocking the caller's event loop"""
+        self.user_id = user_id
+        self._set_trades(*await self.async_api.run(self.trade_sync.sync, user_id))
+
+    def _set_trades(self, status, response):
+        self.trades_loaded = status and isinstance(response, list)
+        if self.trades_loaded:  # Assuming response is a list of trades
+            self.transactions = sorted(response, key=lambda t: t["date"])
         else:
             print("Error fetching transactions:", response)
 
+    def close_windows(self, start=None):
+        """
+        Date range of daily closes needed for each symbol ever traded.
+
+        Open positions need closes from `start` (or the first trade) until today.
+        A closed position only needs them from its first to its last trade, so
+        its bars are fetched once and then served from the aggregate cache.
+
+        Returns:
+            dict: Symbol -> (first date, last date) as "yyyy-MM-dd" strings
+        """
+        self.positions.sync(self.user_id, self.transactions)
+        held = {position.symbol for position in self.positions.open_positions()}
+        start = start or self.transactions[0]["date"][:10]
+        today = datetime.date.today().isoformat()
+        windows = {}
+        for trade in self.transactions:  # Oldest first
+            symbol, day = trade["symbol"], trade["date"][:10]
+            first = windows[symbol][0] if symbol in windows else day
+            windows[symbol] = (min(first, start) if symbol in held else first,
+                               today if symbol in held else day)
+        return windows
+
+    def fetch_closes(self):
+        """Daily bars of every symbol ever traded, over the window in which it was held"""
+        if not self.transactions:
+            return {}
+        closes = {}
+        for symbol, (start, end) in self.close_windows().items():
+            success, data = self.aggregate_cache.fetch(symbol, start, end, metadata=False)
+            if success:
+                closes[symbol] = data["series"]
+        return closes
+
+    async def fetch_closes_async(self, start=None):
+        """
+        Same as fetch_closes, with the symbols fetched concurrently.
+
+        Args:
+            start: First date to fetch for the open positions; defaults to the date of the first trade
+        """
+        if not self.transactions:
+            return {}
+        windows = self.close_windows(start)
+        symbols = sorted(windows)
+        results = await asyncio.gather(
+            *(self.async_api.run(self.aggregate_cache.fetch, symbol, *windows[symbol], metadata=False)
+              for symbol in symbols))
+        return {symbol: data["series"] for symbol, (success, data) in zip(symbols, results) if success}
+
+    async def fetch_benchmark_async(self, start):
+        """Daily bars of the risk benchmark from `start` until today, or None if unavailable"""
+        success, data = await self.async_api.run(
+            self.aggregate_cache.fetch, RISK_SETTINGS["benchmark"], start, datetime.date.today(), metadata=False)
+        return data["series"] if success else None
+
+    def update_equity_curve(self, closes):
+        """Replay new trades, closes and the cash balance into the equity curve"""
+        self.equity_curve.sync(self.transactions, closes, self.cash_balance)
+
+    def update_risk(self):
+        """Align the holdings' daily returns for the current portfolio version (cached per version)"""
+        values = {h.Symbol: h.TotalValue for h in self.holdings}
+        self.risk_engine.prepare(self.positions.version, values, self.closes, self.benchmark)
+
+    def get_risk_metrics(self, days=None):
+        """
+        Portfolio risk metrics over the last `days` calendar days (None for all the loaded history).
+
+        Returns:
+            dict of portfolio metrics (see analytics.risk.risk_metrics) with the latest rolling
+            correlation under "rolling_correlation", or None before the first load
+        """
+        window = None if days is None else max(2, round(days * TRADING_DAYS / 365))
+        rolling_window = min(RISK_SETTINGS["rolling_window"], window or RISK_SETTINGS["rolling_window"])
+        result = self.risk_engine.metrics(self.positions.version, window, rolling_window,
+                                          RISK_SETTINGS["risk_free_rate"])
+        if result is None:
+            return None
+        rolling = result["rolling_correlation"]
+        return {**result["portfolio"], "rolling_correlation": float(rolling[-1]) if len(rolling) else None}
+
+    def get_simulation_inputs(self):
+        """
+        Historical returns and current values of the holdings, for the Monte Carlo simulation.
+
+        Returns:
+            (returns, values): (days x holdings) daily returns over the last
+            SIMULATION_SETTINGS["lookback_days"] and the market value of each holding,
+            or None if no price history has been loaded for the current holdings
+        """
+        aligned = self.risk_engine.aligned(self.positions.version)
+        if aligned is None:
+            return None
+        symbols, returns = aligned
+        values = {h.Symbol: h.TotalValue for h in self.holdings}
+        return returns[-SIMULATION_SETTINGS["lookback_days"]:], [values.get(s, 0.0) for s in symbols]
+
     def get_holdings(self):
         return self.holdings
 
     def get_transactions(self):
         return self.transactions
 
+    def get_equity_points(self, since=None):
+        """Daily (datetime, portfolio value) pairs, optionally only from a datetime on"""
+        return self.equity_curve.points(since)
+
     def get_cash_balance(self):
-        return self.api_service.get_cash_balance(self.user_id)
+        return self.cash_balance
 
     def get_total_gain(self):
-        return self.api_service.get_profit(self.user_id)
+        return self.total_gain
+
+    async def fetch_cash_balance_async(self, user_id):
+        self.user_id = user_id
+        success, response = await self.async_api.get("cash_balance", user_id=user_id)
+        if success:
+            self.cash_balance = float(response)
+            self.store.save_cash_balance(user_id, self.cash_balance)
+        else:
+            print(f"Failed to fetch cash balance: {response}")
+            stored = self.store.load_cash_balance(user_id)
+            self.cash_balance = stored if stored is not None else 0.0
+
+    async def fetch_total_gain_async(self, user_id):
+        self.user_id = user_id
+        self.total_gain = await self.async_api.get_profit(user_id)
+
+    async def load_positions_async(self, user_id):
+        """
+        Sync the trade log and price the positions with the daily closes.
+
+        Holdings come from the local position book; the server's holdings query is
+        only used when the trade log cannot be loaded.
+        """
+        self.user_id = user_id
+        await self.fetch_trades_async(user_id)
+        if not self.trades_loaded:
+            await self.fetch_holdings_async(user_id)
+            return
+        # Closes reach back far enough for the risk metrics even when trading started recently
+        start = datetime.date.today() - datetime.timedelta(days=RISK_SETTINGS["history_days"])
+        if self.transactions:
+            start = min(start, datetime.date.fromisoformat(self.transactions[0]["date"][:10]))
+        self.closes, self.benchmark = await asyncio.gather(
+            self.fetch_closes_async(start.isoformat()), self.fetch_benchmark_async(start.isoformat()))
+        self.update_holdings(self.closes)
+
+    async def load_history_async(self):
+        """
+        Update the equity curve and risk metrics; needs the positions and the cash balance loaded first.
+        Does nothing when the trade log could not be loaded.
+        """
+        if not self.trades_loaded:
+            return
+        await self.async_api.run(self.update_equity_curve, self.closes)
+        await self.async_api.run(self.update_risk)
+
+    async def load_async(self, user_id):
+        """Load every part of the dashboard: positions, cash balance and profit concurrently, then the history"""
+        self.user_id = user_id
+        await asyncio.gather(
+            self.load_positions_async(user_id),
+            self.fetch_cash_balance_async(user_id),
+            self.fetch_total_gain_async(user_id),
+        )
+        await self.load_history_async()
 
     def add_money(self, user_id, amount):
         return self.api_service.add_money(user_id, amount)
 
     def remove_money(self, user_id, amount):
         return self.api_service.remove_money(user_id, amount)
+
+    async def add_money_async(self, user_id, amount):
+        balance = await self.async_api.add_money(user_id, amount)
+        if balance is not None:
+            self.cash_balance = balance
+            self.store.save_cash_balance(user_id, balance)
+            self.equity_curve.set_cash_balance(balance)
+        return balance
+
+    async def remove_money_async(self, user_id, amount):
+        balance = await self.async_api.remove_money(user_id, amount)
+        if balance is not None:
+            self.cash_balance = balance
+            self.store.save_cash_balance(user_id, balance)
+            self.equity_curve.set_cash_balance(balance)
+        return balance
@@ -1,6 +1,7 @@
-from PySide6.QtCore import QDateTime
-
+from analytics.transactions import TransactionIndex
 from services.api_service import ApiService
+from services.async_api_service import AsyncApiService
+from services.trade_sync import TradeSyncService
 
 
 class HistoryModel:
@@ -15,21 +16,43 @@ class HistoryModel:
             user_id: Current user's ID
         """
         self.api_service = api_service or ApiService()
+        self.async_api = AsyncApiService(self.api_service)
+        self.trade_sync = TradeSyncService(self.api_service)
         self.user_id = None
         self.transactions = []
+        self.index = TransactionIndex([])
 
     def load_transactions(self):
         """
-        Fetch transactions from the API.
+        Sync new transactions from the API into the local store and load them all.
+
+        Returns:
+            tuple: (success, data) where success is a boolean and data is the transactions list or error
+        """
+        success, data = self.trade_sync.sync(self.user_id)
+        if success:
+            self.set_transactions(data)
+        return success, data
+
+    async def load_transactions_async(self):
+        """
+        Sync and load transactions without blocking the caller's event loop.
 
         Returns:
             tuple: (success, data) where success is a boolean and data is the transactions list or error
         """
-        success, data = self.api_service.get_transactions(self.user_id)
+        success, data = await self.async_api.run(self.trade_sync.sync, self.user_id)
         if success:
+            # Index off the event loop too; it is a single pass over the trades
+            self.index = await self.async_api.run(TransactionIndex, data)
             self.transactions = data
         return success, data
 
+    def set_transactions(self, transactions):
+        """Replace the loaded transactions and rebuild their index."""
+        self.index = TransactionIndex(transactions)
+        self.transactions = transactions
+
     def get_filtered_transactions(self, from_date, to_date, type_filter, search_text):
         """
         Filter transactions based on criteria.
@@ -41,42 +64,10 @@ class HistoryModel:
             search_text: Text to search in symbol or name
 
         Returns:
-            list: Filtered transactions
+            TransactionSelection: Filtered transactions in date order, a lazy sequence of dicts
         """
-        filtered = []
-        search_text = search_text.lower() if search_text else ""
-        print(type_filter)
-
-        # Convert filter dates to QDate
-        filter_from_date = QDateTime.fromString(from_date, "yyyy-MM-dd").date() if from_date else None
-        filter_to_date = QDateTime.fromString(to_date, "yyyy-MM-dd").date()
-
-        for tx in self.transactions:
-            # Parse transaction date (taking only the date part)
-            tx_date = QDateTime.fromString(tx["date"].split("T")[0], "yyyy-MM-dd").date()
-
-            # Check date range
-            if filter_from_date and tx_date < filter_from_date:
-                continue
-            if tx_date > filter_to_date:
-                continue
-
-            # Check transaction type
-            if type_filter != "All":
-                # Assuming: 0 represents "Buy" and 1 represents "Sell"
-                if type_filter.lower() == "buy" and tx["type"] != 0:
-                    continue
-                elif type_filter.lower() == "sell" and tx["type"] != 1:
-                    continue
-
-            # Check search text in symbol
-            if search_text and search_text not in tx["symbol"].lower():
-                continue
-
-            filtered.append(tx)
-
-        print(filtered)
-        return filtered
+        positions = self.index.filter(from_date, to_date, type_filter, search_text)
+        return self.index.select(positions)
 
     def set_user(self, user_id):
         """Set the current user ID."""
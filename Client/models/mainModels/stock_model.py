@@ -1,19 +1,30 @@
+import asyncio
 import datetime
 
 from PySide6.QtCore import QDate
+from analytics.backtest import run_backtest
+from analytics.positions import PositionBook
+from services.aggregate_cache import AggregateCache
 from services.api_service import ApiService
+from services.async_api_service import AsyncApiService
+from config import BACKTEST_SETTINGS
 
 
 class StockModel:
     """Model for stock data and trading operations"""
 
-    def __init__(self, api_service=None):
+    def __init__(self, api_service=None, aggregate_cache=None, positions=None):
         """Initialize the model with an API service
         
         Args:
             api_service: Service for API communication, creates a new one if not provided
+            aggregate_cache: Cache of fetched bars, defaults to the shared AggregateCache
+            positions: Book of open positions, defaults to the shared PositionBook
         """
         self.api_service = api_service or ApiService()
+        self.async_api = AsyncApiService(self.api_service)
+        self.aggregate_cache = aggregate_cache or AggregateCache.instance()
+        self.positions = positions or PositionBook.instance()
         self.current_user_id = None
         self.current_stock = None
 
@@ -37,8 +48,40 @@ class StockModel:
             end_date: End date for historical data
             
         Returns:
-            (success, data): Tuple with success flag and stock data or error
+            (success, data): Tuple with success flag and stock data (metadata plus an
+            OHLCVSeries under "series") or error
         """
+        start_str, end_str = self._date_range_strings(start_date, end_date)
+        success, response = self.aggregate_cache.fetch(symbol, start_str, end_str)
+
+        if success:
+            self.current_stock = response
+
+        return success, response
+
+    async def fetch_stock_data_async(self, symbol, start_date, end_date):
+        """Fetch stock data without blocking the caller's event loop
+
+        Args:
+            symbol: Stock symbol (e.g., AAPL)
+            start_date: Start date for historical data
+            end_date: End date for historical data
+
+        Returns:
+            (success, data): Tuple with success flag and stock data (metadata plus an
+            OHLCVSeries under "series") or error
+        """
+        start_str, end_str = self._date_range_strings(start_date, end_date)
+        success, response = await self.async_api.run(self.aggregate_cache.fetch, symbol, start_str, end_str)
+
+        if success:
+            self.current_stock = response
+
+        return success, response
+
+    @staticmethod
+    def _date_range_strings(start_date, end_date):
+        """Convert QDate/datetime.date bounds to "yyyy-MM-dd" strings"""
 
         # Convert QDate to datetime.date if necessary
         def convert_to_date(date_obj):
@@ -51,56 +94,85 @@ class StockModel:
 
         start_str = start_date.strftime("%Y-%m-%d") if isinstance(start_date, datetime.date) else start_date
         end_str = end_date.strftime("%Y-%m-%d") if isinstance(end_date, datetime.date) else end_date
+        return start_str, end_str
 
-        success, response = self.api_service.search_stock(symbol, start_str, end_str)
+    async def execute_sell_order_async(self, symbol, quantity):
+        """Execute a sell order without blocking the caller's event loop"""
+        error = self._validate_order(symbol, quantity)
+        if error:
+            return False, error
+        return await self.async_api.sell_stock(self.current_user_id, symbol, quantity)
 
-        if success:
-            self.current_stock = response
+    async def execute_buy_order_async(self, symbol, quantity):
+        """Execute a buy order without blocking the caller's event loop"""
+        error = self._validate_order(symbol, quantity)
+        if error:
+            return False, error
+        return await self.async_api.buy_stock(self.current_user_id, symbol, quantity)
 
-        return success, response
+    def run_backtest(self, strategy_name, params=None):
+        """Backtest a strategy on the bars of the current stock
 
-    def execute_sell_order(self, symbol, quantity):
-        """Execute a buy order
-        
         Args:
-            symbol: Stock symbol
-            quantity: Number of shares to buy
-            price: Price per share
-            
+            strategy_name: Key of analytics.backtest.STRATEGIES
+            params: Strategy parameters, defaults to the strategy's own
+
         Returns:
-            (success, data): Tuple with success flag and transaction data or error
+            (success, data): Tuple with success flag and the backtest result (see
+            analytics.backtest.run_backtest) or error
         """
-        if not self.current_user_id:
-            return False, {"error": "No user is logged in"}
+        series = (self.current_stock or {}).get("series")
+        if series is None or len(series) < 2:
+            return False, "Search for a stock before running a backtest"
+        return True, run_backtest(series, strategy_name, params, BACKTEST_SETTINGS["cost_bps"])
 
-        if not symbol:
-            return False, {"error": "No stock selected"}
-
-        if quantity <= 0:
-            return False, {"error": "Quantity must be greater than zero"}
+    async def fetch_sweep_series_async(self, tickers):
+        """Daily bars of several tickers over the current stock's date range, fetched concurrently
 
-        return self.api_service.sell_stock(self.current_user_id, symbol, quantity)
+        Returns:
+            dict: Ticker -> OHLCVSeries for every ticker that could be fetched
+        """
+        series = (self.current_stock or {}).get("series")
+        end = datetime.date.today()
+        start = end - datetime.timedelta(days=365)
+        if series is not None and len(series):
+            start = datetime.datetime.fromtimestamp(series.first_time / 1000, datetime.timezone.utc).date()
+            end = datetime.datetime.fromtimestamp(series.last_time / 1000, datetime.timezone.utc).date()
+        results = await asyncio.gather(
+            *(self.async_api.run(self.aggregate_cache.fetch, ticker, start.isoformat(), end.isoformat())
+              for ticker in tickers))
+        return {ticker: data["series"] for ticker, (success, data) in zip(tickers, results) if success}
+
+    def record_trade(self, result):
+        """Show a filled order in the position book until the next trade sync
+
+        The order response is not the server's stored row (its date and price
+        are not in stored form), so it is kept out of the local trade log:
+        writing it there would double-count it and move the sync watermark past
+        trades placed elsewhere. The next sync brings in the stored trade and,
+        as the logs no longer match, the book is replayed without this overlay.
 
-    def execute_buy_order(self, symbol, quantity):
-        """Execute a sell order
-        
         Args:
-            symbol: Stock symbol
-            quantity: Number of shares to sell
-            price: Price per share
-            
-        Returns:
-            (success, data): Tuple with success flag and transaction data or error
+            result: Response of a successful buy/sell order, holding the logged
+                trade under "buyTrade" or "sellTrade"
         """
+        trade = None
+        if isinstance(result, dict):
+            trade = result.get("buyTrade") or result.get("sellTrade")
+        if not trade or self.positions.user_id != self.current_user_id:
+            return  # The dashboard replays the full log on its next load
+        trade = {key: trade[key] for key in ("symbol", "date", "type", "quantity", "price")}
+        self.positions.apply(trade)
+
+    def _validate_order(self, symbol, quantity):
+        """Return an error dict if the order cannot be placed, otherwise None"""
         if not self.current_user_id:
-            return False, {"error": "No user is logged in"}
+            return {"error": "No user is logged in"}
 
         if not symbol:
-            return False, {"error": "No stock selected"}
+            return {"error": "No stock selected"}
 
         if quantity <= 0:
-            return False, {"error": "Quantity must be greater than zero"}
-        
-        print("hi")
+            return {"error": "Quantity must be greater than zero"}
 
-        return self.api_service.buy_stock(self.current_user_id, symbol, quantity)
+        return None
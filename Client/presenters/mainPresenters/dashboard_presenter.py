@@ -1,59 +1,157 @@
 import datetime
 from PySide6.QtCore import Signal, QObject
 
+from services.async_bridge import run_async
+from services.quote_service import QuoteService
+from services.quote_stream import QuoteStream
+from services.simulation_service import SimulationService
+
 class DashboardPresenter(QObject):
     move_to_sell_signal = Signal(str)
+    positions_changed = Signal()  # Re-emitted on the GUI thread whenever the position book changes
     def __init__(self, model, view, user_id=None):
         super().__init__()
         self.view = view
         self.model = model
         self.user_id = user_id
+        self.period_days = None  # Calendar days shown by the period selector; None for all time
+        self.generation = 0  # Incremented per refresh, so results of a superseded refresh are dropped
+        self.loaded = set()  # Parts drawn at least once ("positions", "cash", "gain", "history")
+        self.arrived = set()  # Parts loaded by the current refresh
 
         self.view.add_money_clicked.connect(self.on_add_money)
         self.view.remove_money_clicked.connect(self.on_remove_money)
         self.view.on_period_changed.connect(self.on_period_changed)
         self.view.on_sell_clicked.connect(self.move_to_sell_signal)
 
+        # Monte Carlo VaR runs on a process pool and reports back through signals
+        self.simulation = SimulationService(self)
+        self.simulation.progress.connect(self.view.set_simulation_progress)
+        self.simulation.finished.connect(self.view.set_simulation_result)
+        self.simulation.failed.connect(self.view.set_simulation_error)
+        self.view.run_simulation_clicked.connect(self.on_run_simulation)
+
+        # Live prices of the held symbols, pushed by the quote stream or, while it is down, polled
+        # at a fixed rate; only changed rows are redrawn
+        self.stream = QuoteStream.instance()
+        self.stream.connection_changed.connect(self.on_stream_connection_changed)
+        self.quotes = QuoteService(self)
+        self.quotes.quotes_changed.connect(self.on_quotes_changed)
+
+        # Trades placed elsewhere (e.g. the stock page) update the holdings table right away
+        self.positions_changed.connect(self.on_positions_changed)
+        self.model.positions.subscribe(self._notify_positions_changed)
+
         # If a valid user_id is provided at initialization, fetch initial data.
         if self.user_id is not None:
-            self.model.fetch_holdings(self.user_id)
-            self.model.fetch_trades(self.user_id)
-            self.model_updated()
+            self.refresh()
 
-    def model_updated(self):
-        """Update the View with new data from the Model"""
-        if self.user_id is None:
+    def refresh(self):
+        """
+        Load the dashboard's parts concurrently off the GUI thread, drawing each card as soon as
+        its own data arrives. Cards that were never drawn show a skeleton until then.
+        """
+        self.generation += 1
+        generation = self.generation
+        if not self.loaded:
+            self.view.show_loading()
+        self.arrived = set()
+        for part, coro in (("positions", self.model.load_positions_async(self.user_id)),
+                           ("cash", self.model.fetch_cash_balance_async(self.user_id)),
+                           ("gain", self.model.fetch_total_gain_async(self.user_id))):
+            self._load(generation, part, coro)
+
+    def _load(self, generation, part, coro):
+        run_async(coro,
+                  on_result=lambda _: self._on_part_loaded(generation, part),
+                  on_error=lambda error: self._on_part_failed(generation, part, error))
+
+    def _on_part_failed(self, generation, part, error):
+        print(f"Failed to load the dashboard {part}: {error}")
+        self._on_part_loaded(generation, part)  # Show whatever the model holds (e.g. its stored fallback)
+
+    def _on_part_loaded(self, generation, part):
+        """Draw one part of the dashboard; the history follows once the positions and cash balance are in"""
+        if generation != self.generation or self.user_id is None:
+            return  # A later refresh superseded this one
+        self.loaded.add(part)
+        self.arrived.add(part)
+        if part == "positions":
+            holdings = self.model.get_holdings()
+            self.view.set_holdings_data(holdings)
+            self.view.set_total_value(self.calculate_portfolio_summary(holdings)[1])
+            self.follow_quotes(holdings)
+        elif part == "cash":
+            self.view.set_cash_balance(self.model.get_cash_balance())
+        elif part == "gain":
+            self.view.set_total_gain(self.model.get_total_gain())
+        elif part == "history":
+            self.view.set_chart_data(self.equity_points())
+            self.view.set_risk_metrics(self.model.get_risk_metrics(self.period_days))
+
+        # The equity curve replays the trades and needs the cash balance
+        if part in ("positions", "cash") and {"positions", "cash"} <= self.arrived:
+            self._load(generation, "history", self.model.load_history_async())
+
+    def equity_points(self):
+        """Equity curve points for the selected period"""
+        if self.period_days is None:
+            return self.model.get_equity_points()
+        return self.model.get_equity_points(datetime.datetime.now() - datetime.timedelta(days=self.period_days))
+
+    def follow_quotes(self, holdings):
+        """Track the live prices of the held symbols, streamed if the feed is up and polled otherwise"""
+        symbols = [h.Symbol for h in holdings]
+        self.quotes.set_symbols(symbols)
+        self.stream.subscribe(self.on_stream_quotes, symbols)
+        if not self.stream.connected:
+            self.quotes.start()
+
+    def on_stream_connection_changed(self, connected):
+        """Poll only while the stream is down"""
+        if connected:
+            self.quotes.stop()
+        elif self.quotes.symbols:
+            self.quotes.start()
+
+    def on_stream_quotes(self, quotes):
+        self.on_quotes_changed({symbol: quote.price for symbol, quote in quotes.items()})
+
+    def on_quotes_changed(self, prices):
+        """Reprice the holdings whose quotes moved and update the totals"""
+        changed = self.model.apply_quotes(prices)
+        if not changed:
             return
+        self.view.update_holdings(changed)
+        self.view.set_total_value(self.calculate_portfolio_summary(self.model.get_holdings())[1])
+        self.view.set_total_gain(self.model.get_total_gain())
 
-        holdings = self.model.get_holdings()
-        transactions = self.model.get_transactions()
-        cash_balance, total_value, total_gain = self.calculate_portfolio_summary(holdings)
+    def _notify_positions_changed(self):
+        """Called by the position book, possibly off the GUI thread"""
+        self.positions_changed.emit()
 
+    def on_positions_changed(self):
+        """Show the holdings as the position book has them now"""
+        if self.user_id is None:
+            return
+        self.model.refresh_holdings()
+        holdings = self.model.get_holdings()
         self.view.set_holdings_data(holdings)
-        self.view.set_chart_data(self.get_chart_data(transactions))
-        self.view.set_cash_balance(cash_balance)
-        self.view.set_total_value(total_value)
-        self.view.set_total_gain(total_gain)
+        self.view.set_total_value(self.calculate_portfolio_summary(holdings)[1])
+        self.follow_quotes(holdings)
+        if "history" in self.loaded:  # Otherwise the risk card keeps its skeleton until the closes are in
+            self.model.update_risk()
+            self.view.set_risk_metrics(self.model.get_risk_metrics(self.period_days))
 
     def calculate_portfolio_summary(self, holdings):
+        """Summarize the data already loaded into the model; performs no network calls"""
         cash_balance = self.model.get_cash_balance()
         total_value = sum(h.TotalValue for h in holdings)
         total_gain = self.model.get_total_gain()
         return cash_balance, total_value, total_gain
 
-    def get_chart_data(self, transactions):
-        """Converts raw transaction data into chart-friendly format."""
-        chart_data = []
-        for trade in transactions:
-            trade_date = datetime.datetime.fromisoformat(trade["TradeDate"])
-            portfolio_value = trade["PortfolioValue"]
-            chart_data.append((trade_date, portfolio_value))
-        return chart_data
-
     def on_period_changed(self, period_text):
-        """Handles period change and filters transactions accordingly."""
-        print(f"Period changed to: {period_text}")
-
+        """Shows the equity curve and risk metrics for the selected period"""
         # Map period to days
         period_map = {
             "Last 3 Months": 90,
@@ -61,27 +159,28 @@ class DashboardPresenter(QObject):
             "Last Year": 365
         }
         days = period_map.get(period_text)  # Returns None for "All Time"
+        self.period_days = days
+        if "history" not in self.loaded:
+            return  # Drawn for this period once the history arrives
+        self.view.set_risk_metrics(self.model.get_risk_metrics(days))
+        self.view.set_chart_data(self.equity_points())
 
-        # Fetch transactions and transform them into chart data
-        transactions = self.model.get_transactions()
-        chart_data = self.get_chart_data(transactions)
-
-        if days is not None:
-            # Filter transactions within the selected time range
-            now = datetime.datetime.now()
-            filtered_transactions = [(date, value) for date, value in chart_data if (now - date).days <= days]
-            print(filtered_transactions)
-            self.view.set_chart_data(filtered_transactions)
-        else:
-            # Show all data for "All Time"
-            self.view.set_chart_data(chart_data)
+    def on_run_simulation(self):
+        """Simulate the current holdings' value over the configured horizons"""
+        inputs = self.model.get_simulation_inputs()
+        if inputs is None:
+            self.view.set_simulation_error("Price history is still loading")
+            return
+        self.view.set_simulation_running()
+        self.simulation.start(*inputs)
 
     def on_add_money(self):
-        new_cash_balance = self.model.add_money(self.user_id, 500.0)
-        if new_cash_balance is not None:
-            self.view.set_cash_balance(new_cash_balance)
+        run_async(self.model.add_money_async(self.user_id, 500.0), on_result=self._on_cash_balance_changed)
 
     def on_remove_money(self):
-        new_cash_balance = self.model.remove_money(self.user_id, 500.0)
+        run_async(self.model.remove_money_async(self.user_id, 500.0), on_result=self._on_cash_balance_changed)
+
+    def _on_cash_balance_changed(self, new_cash_balance):
         if new_cash_balance is not None:
             self.view.set_cash_balance(new_cash_balance)
+            self.view.set_chart_data(self.equity_points())
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Slot, QDateTime
 
+from services.async_bridge import run_async
+
 
 class HistoryPresenter(QObject):
     """
@@ -19,6 +21,7 @@ class HistoryPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
+        self.filters = (None, None, "All", "")  # Last applied (from_date, to_date, type_filter, search_text)
 
         if user_id:
             self.model.set_user(user_id)
@@ -29,15 +32,23 @@ class HistoryPresenter(QObject):
         # Load initial data
         self.load_transactions()
 
+    def refresh(self):
+        """Reload the transactions, keeping the applied filters."""
+        self.load_transactions()
+
     @Slot()
     def load_transactions(self):
-        """Load transactions from the model and update the view."""
-        success, data = self.model.load_transactions()
+        """Load transactions from the model in the background and update the view."""
+        run_async(self.model.load_transactions_async(), on_result=self._on_transactions_loaded)
+
+    def _on_transactions_loaded(self, outcome):
+        """Update the view once the transactions have arrived."""
+        success, data = outcome
 
         if success:
-            # Display all transactions initially
-            self.apply_filters()
-            print("Transactions loaded successfully", data)
+            # Display the transactions with the filters applied so far (all of them initially)
+            self.apply_filters(*self.filters)
+            print(f"Transactions loaded successfully: {len(data)}")
         else:
             # Show error message
             self.view.show_error(data.get("error", "Failed to load transactions"))
@@ -66,6 +77,8 @@ class HistoryPresenter(QObject):
             search_text: Search text (default: "")
         """
 
+        self.filters = (from_date, to_date, type_filter, search_text)
+
         # Use default values if not provided
         if to_date is None:
             to_date = QDateTime.currentDateTime().toString("yyyy-MM-dd")
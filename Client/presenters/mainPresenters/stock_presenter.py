@@ -3,6 +3,11 @@ import json
 
 from PySide6.QtCore import QObject, Slot, QDate
 
+from config import BACKTEST_SETTINGS
+from services.async_bridge import run_async
+from services.backtest_service import BacktestService
+from services.quote_stream import QuoteStream
+
 class StockPresenter(QObject):
     """Presenter for stock trading application, connects model and view"""
 
@@ -17,6 +22,11 @@ class StockPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
+        self.backtests = BacktestService(self)
+        self.sweep_strategy = None
+        self.stream = QuoteStream.instance()
+        self.live_symbol = None  # Displayed symbol, whose streamed quotes update the page
+        self.live_chart = False  # Whether the displayed range ends today, so ticks extend the chart
 
         # Connect view signals to presenter slots
         self._connect_signals()
@@ -34,6 +44,13 @@ class StockPresenter(QObject):
         self.view.buy_stock_requested.connect(self.on_buy_stock)
         self.view.sell_stock_requested.connect(self.on_sell_stock)
 
+        # Backtesting
+        self.view.backtest_requested.connect(self.on_backtest)
+        self.view.sweep_requested.connect(self.on_sweep)
+        self.backtests.progress.connect(self.view.set_backtest_progress)
+        self.backtests.finished.connect(self._on_sweep_finished)
+        self.backtests.failed.connect(self._on_sweep_failed)
+
     @Slot(str, QDate, QDate)
     def on_search_stock(self, symbol, start_date, end_date):
         """Handle stock search request from view
@@ -58,8 +75,22 @@ class StockPresenter(QObject):
             end_date = today
             self.view.show_message("End date adjusted to today", False)
 
-        # Fetch stock data from model
-        success, stock_data = self.model.fetch_stock_data(symbol, start_date, end_date)
+        # Fetch stock data from model in the background
+        run_async(
+            self.model.fetch_stock_data_async(symbol, start_date, end_date),
+            on_result=lambda outcome: self._on_stock_data(symbol, start_date, end_date, outcome),
+        )
+
+    def _on_stock_data(self, symbol, start_date, end_date, outcome):
+        """Update the view once the stock data has arrived
+
+        Args:
+            symbol: Stock symbol that was searched
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            outcome: (success, data) tuple returned by the model
+        """
+        success, stock_data = outcome
 
         if success:
             # Format data for view if needed
@@ -77,9 +108,20 @@ class StockPresenter(QObject):
             start_str = start_date.strftime("%Y-%m-%d") if isinstance(start_date, datetime.date) else start_date
             end_str = end_date.strftime("%Y-%m-%d") if isinstance(end_date, datetime.date) else end_date
             self.view.update_stock_data(symbol, start_str, end_str, formatted_data)
+
+            # Follow the displayed stock's live price; ticks only touch the chart if it reaches today
+            self.live_symbol = symbol
+            self.live_chart = end_date >= datetime.date.today()
+            self.stream.subscribe(self.on_stream_quotes, [symbol])
         else:
             self.view.show_message(stock_data, True)
 
+    def on_stream_quotes(self, quotes):
+        """Show the displayed stock's latest streamed quote"""
+        quote = quotes.get(self.live_symbol)
+        if quote is not None:
+            self.view.apply_quote(quote, update_chart=self.live_chart)
+
     @Slot(str, int)
     def on_buy_stock(self, symbol, quantity):
         """Handle buy stock request from view
@@ -89,10 +131,17 @@ class StockPresenter(QObject):
             quantity: Number of shares to buy
             price: Price per share
         """
-        # Execute sell order through model
-        success, result = self.model.execute_buy_order(symbol, quantity)
-        print(success, result)
+        # Execute buy order through model in the background
+        run_async(
+            self.model.execute_buy_order_async(symbol, quantity),
+            on_result=lambda outcome: self._on_buy_result(symbol, quantity, outcome),
+        )
+
+    def _on_buy_result(self, symbol, quantity, outcome):
+        """Record a filled buy order and report the outcome to the user"""
+        success, result = outcome
         if success:
+            self.model.record_trade(result)
             self.view.show_message(f"Successfully bought {quantity} shares of {symbol}!")
         else:
             self.view.show_message(result, True)
@@ -107,14 +156,73 @@ class StockPresenter(QObject):
             price: Price per share
         """
 
-        # Execute sell order through model
-        success, result = self.model.execute_sell_order(symbol, quantity)
+        # Execute sell order through model in the background
+        run_async(
+            self.model.execute_sell_order_async(symbol, quantity),
+            on_result=lambda outcome: self._on_sell_result(symbol, quantity, outcome),
+        )
+
+    def _on_sell_result(self, symbol, quantity, outcome):
+        """Record a filled sell order and report the outcome to the user"""
+        success, result = outcome
 
         if success:
+            self.model.record_trade(result)
             self.view.show_message(f"Successfully sold {quantity} shares of {symbol}!")
         else:
             self.view.show_message(result, True)
 
+    @Slot(str)
+    def on_backtest(self, strategy_name):
+        """Backtest a strategy with its default parameters on the displayed stock
+
+        Args:
+            strategy_name: Key of analytics.backtest.STRATEGIES
+        """
+        success, result = self.model.run_backtest(strategy_name)
+        if success:
+            self.view.show_backtest_result(result)
+        else:
+            self.view.show_message(result, True)
+
+    @Slot(str, list)
+    def on_sweep(self, strategy_name, tickers):
+        """Sweep a strategy's parameter grid over several tickers on the process pool
+
+        Args:
+            strategy_name: Key of analytics.backtest.STRATEGIES
+            tickers: Tickers to backtest on
+        """
+        if not tickers:
+            self.view.show_message("Search for a stock or list tickers to sweep", True)
+            return
+        self.sweep_strategy = strategy_name
+        self.view.set_backtest_running(True)
+        run_async(
+            self.model.fetch_sweep_series_async(tickers),
+            on_result=lambda series: self.backtests.start(series, strategy_name),
+            on_error=lambda error: self._on_sweep_failed(str(error)),
+        )
+
+    def _on_sweep_finished(self, ranked):
+        """Show the best parameters found, with their trades if they are on the displayed stock"""
+        self.view.set_backtest_running(False)
+        best = next((r for r in ranked if r["ticker"] == self.view.current_ticker), None)
+        if best is None:
+            top = ranked[0]
+            metric = BACKTEST_SETTINGS["rank_by"]  # The statistic the results were ranked by
+            self.view.show_backtest_summary(
+                f"Best: {top['ticker']} {top['params']} with {metric.replace('_', ' ').capitalize()} "
+                f"{top[metric]:.2f} ({len(ranked)} runs)")
+            return
+        success, result = self.model.run_backtest(self.sweep_strategy, best["params"])
+        if success:
+            self.view.show_backtest_result(result, label=f"Best of {len(ranked)} runs")
+
+    def _on_sweep_failed(self, message):
+        self.view.set_backtest_running(False)
+        self.view.show_message(message, True)
+
     def _format_stock_data(self, symbol, api_data):
             """Format API data for display in the view
             
@@ -126,13 +234,16 @@ class StockPresenter(QObject):
                 dict: Formatted data for view consumption
             """
             try:
-                print(api_data)
-                aggregate_data = json.loads(api_data.get("aggregateData", "{}"))
+                if "series" in api_data:
+                    # Bars already merged by the aggregate cache
+                    chart_data = api_data["series"]
+                else:
+                    chart_data = json.loads(api_data.get("aggregateData", "{}")).get("results", [])
                 return {
                     "name": api_data.get("name", "Unknown Company"),
                     "symbol": symbol,
                     "description": api_data.get("description", "No description available"),
-                    "chart_data": aggregate_data.get("results", []),  # Default to empty list
+                    "chart_data": chart_data,  # Default to empty list
                     "img": api_data.get("logoBase64", None),
                     "price": float(api_data.get("sellPrice", 0)),
                 }
@@ -0,0 +1,81 @@
+import time
+
+from config import NAVIGATION_SETTINGS
+
+
+class PresenterRegistry:
+    """
+    Creates each page's presenter once per session and keeps it alive.
+
+    The first visit to a page builds its presenter (which loads the page's
+    data). Later visits reuse it, and only ask it to refresh when its data is
+    older than the page's max age or was invalidated, so navigating between
+    fresh pages makes no network calls and never connects a view's signals twice.
+    """
+
+    def __init__(self, max_age=None):
+        """
+        Args:
+            max_age: Page name -> seconds its data stays fresh, defaults to NAVIGATION_SETTINGS["max_age"].
+                Pages not listed never go stale by age.
+        """
+        self.max_age = NAVIGATION_SETTINGS["max_age"] if max_age is None else max_age
+        self.user_id = None
+        self._factories = {}
+        self._entries = {}  # Page name -> {"presenter", "loaded_at", "stale"}
+
+    def register(self, name, factory):
+        """
+        Register how a page's presenter is built.
+
+        Args:
+            name: Page name
+            factory: Callable taking the user ID and returning the presenter
+        """
+        self._factories[name] = factory
+
+    def start_session(self, user_id):
+        """Drop the previous session's presenters; pages are rebuilt for the new user on their next visit"""
+        self.close_session()
+        self.user_id = user_id
+
+    def close_session(self):
+        for entry in self._entries.values():
+            entry["presenter"].deleteLater()
+        self._entries.clear()
+        self.user_id = None
+
+    def get(self, name):
+        """The page's presenter, or None if it was not created yet"""
+        entry = self._entries.get(name)
+        return entry["presenter"] if entry else None
+
+    def show(self, name):
+        """
+        The page's presenter, created on the first visit and refreshed in the background when stale.
+
+        Returns:
+            The presenter
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = {"presenter": self._factories[name](self.user_id), "loaded_at": time.monotonic(), "stale": False}
+            self._entries[name] = entry
+        elif self.is_stale(name):
+            entry["presenter"].refresh()
+            entry["loaded_at"] = time.monotonic()
+            entry["stale"] = False
+        return entry["presenter"]
+
+    def is_stale(self, name):
+        entry = self._entries.get(name)
+        if entry is None:
+            return True
+        max_age = self.max_age.get(name)
+        return entry["stale"] or (max_age is not None and time.monotonic() - entry["loaded_at"] > max_age)
+
+    def invalidate(self, name):
+        """Have the page refresh on its next visit"""
+        entry = self._entries.get(name)
+        if entry is not None:
+            entry["stale"] = True
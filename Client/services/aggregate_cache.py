@@ -0,0 +1,225 @@
+import bisect
+import datetime
+import threading
+import time
+from collections import OrderedDict
+
+from analytics.ohlcv import OHLCVSeries
+from config import AGGREGATE_CACHE_SETTINGS
+from services.api_service import ApiService
+
+
+class DateIntervalSet:
+    """Sorted, non-overlapping set of inclusive date intervals, stored as date ordinals"""
+
+    def __init__(self):
+        self._starts = []
+        self._ends = []
+
+    def __len__(self):
+        return len(self._starts)
+
+    def intervals(self):
+        """Covered intervals as (start_date, end_date) tuples"""
+        return [(datetime.date.fromordinal(s), datetime.date.fromordinal(e))
+                for s, e in zip(self._starts, self._ends)]
+
+    def add(self, start, end):
+        """Mark [start, end] as covered, merging with overlapping or adjacent intervals"""
+        start, end = start.toordinal(), end.toordinal()
+        if start > end:
+            return
+        # First interval that could touch [start, end] (its end reaches start - 1)
+        lo = bisect.bisect_left(self._ends, start - 1)
+        # One past the last interval that could touch it (its start is at most end + 1)
+        hi = bisect.bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def missing(self, start, end):
+        """Sub-ranges of [start, end] that are not covered, as (start_date, end_date) tuples"""
+        start, end = start.toordinal(), end.toordinal()
+        gaps = []
+        cursor = start
+        index = bisect.bisect_left(self._ends, start)
+        while cursor <= end and index < len(self._starts):
+            covered_start, covered_end = self._starts[index], self._ends[index]
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - 1))
+            cursor = max(cursor, covered_end + 1)
+            index += 1
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return [(datetime.date.fromordinal(s), datetime.date.fromordinal(e)) for s, e in gaps]
+
+    def covers(self, start, end):
+        return not self.missing(start, end)
+
+
+class _TickerEntry:
+    def __init__(self, ticker):
+        self.series = OHLCVSeries.empty(ticker, "day")
+        self.covered = DateIntervalSet()
+        self.metadata = None
+        self.metadata_at = 0.0
+        self.today_at = 0.0  # When today's bar was last fetched
+        self.lock = threading.Lock()
+
+
+class AggregateCache:
+    """
+    Per-ticker cache of daily aggregate bars that only fetches missing date ranges.
+
+    For each ticker it keeps the merged bars plus the set of date intervals
+    already fetched. A request for [start, end] fetches just the uncovered
+    gaps and merges them into the stored series. Today is never marked as
+    covered because its bar may still change; it is re-requested at most once
+    per today_ttl. Bars always come from the aggregates-only endpoint, one
+    Polygon call per gap. Ticker metadata and the current price are requested
+    separately, on first use and once they are older than the metadata TTL;
+    callers that only need bars (metadata=False) never request them.
+    Responses bypass the ResponseCache, as this cache keeps its own.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, api_service=None, settings=None):
+        """
+        Args:
+            api_service: Service for API communication, creates a new one if not provided
+            settings: Optional dict overriding values from AGGREGATE_CACHE_SETTINGS
+        """
+        self.api_service = api_service or ApiService()
+        self.settings = {**AGGREGATE_CACHE_SETTINGS, **(settings or {})}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _entry(self, ticker):
+        """Get (or create) a ticker's entry, evicting the least recently used ticker if needed"""
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                entry = self._entries[ticker] = _TickerEntry(ticker)
+                while len(self._entries) > self.settings["max_tickers"]:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(ticker)
+            return entry
+
+    def get_series(self, ticker):
+        """The merged bars currently cached for a ticker (may be empty)"""
+        with self._lock:
+            entry = self._entries.get(ticker)
+        return entry.series if entry else OHLCVSeries.empty(ticker, "day")
+
+    def fetch(self, ticker, start_date, end_date, metadata=True):
+        """
+        Return bars and metadata for [start_date, end_date], fetching only uncovered days.
+
+        Args:
+            ticker: Stock symbol
+            start_date: First day (datetime.date or "yyyy-MM-dd")
+            end_date: Last day (datetime.date or "yyyy-MM-dd"); clipped to today
+            metadata: Also fetch the ticker metadata and current price; without it only
+                bars are requested, and data holds whatever metadata is already cached
+
+        Returns:
+            (success, data): data holds the ticker metadata ("name", "description",
+            "logoBase64", "sellPrice") and "series", an OHLCVSeries view of the range,
+            or an error message on failure
+        """
+        start, end = _as_date(start_date), _as_date(end_date)
+        today = datetime.date.today()
+        end = min(end, today)
+        start = min(start, end)
+
+        entry = self._entry(ticker)
+        with entry.lock:
+            refresh = metadata and (entry.metadata is None
+                                    or time.time() - entry.metadata_at > self.settings["metadata_ttl"])
+            refresh_start = max(start, end - datetime.timedelta(days=self.settings["refresh_days"]))
+            if refresh:
+                # First, so an unknown ticker fails before any bars are requested
+                success, error = self._fetch_metadata(entry, ticker, refresh_start, end)
+                if not success:
+                    return False, error
+
+            for gap_start, gap_end in entry.covered.missing(start, end):
+                if gap_start == today and time.time() - entry.today_at < self.settings["today_ttl"]:
+                    continue  # Only today is missing, and its bar was fetched moments ago
+                success, error = self._fill_gap(entry, ticker, gap_start, gap_end, today)
+                if not success:
+                    return False, error
+
+            if refresh:
+                # Recent bars can still be revised, so re-fetch them along with the metadata
+                success, error = self._fill_gap(entry, ticker, refresh_start, end, today)
+                if not success:
+                    return False, error
+
+            return True, {**(entry.metadata or {}), "series": entry.series.between(start, end)}
+
+    def _fetch_metadata(self, entry, ticker, start, end):
+        """Fetch the ticker metadata and current price over a short range; the bars in the reply are not used"""
+        success, response = self.api_service.get("stock_details", params={
+            "ticker": ticker,
+            "startDate": start.strftime("%Y-%m-%d"),
+            "endDate": end.strftime("%Y-%m-%d"),
+        })
+        if not success:
+            return False, response.get("message") or "Failed to search stock. Please try again."
+        entry.metadata = {k: v for k, v in response.items() if k != "aggregateData"}
+        entry.metadata_at = time.time()
+        return True, None
+
+    def _fill_gap(self, entry, ticker, gap_start, gap_end, today):
+        """
+        Fetch the bars of one range from the aggregates-only endpoint, merge them and mark the range covered.
+
+        The endpoint answers a range without bars (weekends, holidays) with an
+        empty result list and an upstream failure with an error status, so
+        only a successful reply marks the range covered; any failure leaves it
+        uncovered for the next fetch to retry.
+        """
+        success, response = self.api_service.get("stock_aggregates", params={
+            "ticker": ticker,
+            "startDate": gap_start.strftime("%Y-%m-%d"),
+            "endDate": gap_end.strftime("%Y-%m-%d"),
+        })
+        if not success:
+            return False, response.get("message") or "Failed to fetch bars. Please try again."
+
+        bars = response.get("results") or []
+        entry.series = entry.series.merge(OHLCVSeries.from_polygon(bars, ticker, "day"))
+        # Today's bar is still forming, so only days before today count as covered
+        entry.covered.add(gap_start, min(gap_end, today - datetime.timedelta(days=1)))
+        if gap_end >= today:
+            entry.today_at = time.time()
+        return True, None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _as_date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
@@ -1,25 +1,44 @@
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from config import API_BASE_URL, ENDPOINTS
+from config import API_BASE_URL, ENDPOINTS, CACHE_SETTINGS
+from services.http_transport import HttpTransport
+from services.request_coalescer import RequestCoalescer
+from services.response_cache import ResponseCache, CacheEntry
 
 class ApiService:
-    def __init__(self):
+    _revalidation_pool = None
+    _revalidation_lock = threading.Lock()
+
+    def __init__(self, transport=None, coalescer=None, cache=None):
+        """
+        Args:
+            transport: HttpTransport to send requests through, defaults to the process-wide one
+            coalescer: RequestCoalescer shared by concurrent identical GETs, defaults to the process-wide one
+            cache: Response cache for read endpoints (ResponseCache or NullCache), defaults to the process-wide one
+        """
         self.base_url = API_BASE_URL
         self.endpoints = ENDPOINTS
-        self.token = None  # Default to None until set
+        self.transport = transport or HttpTransport.instance()
+        self.coalescer = coalescer or RequestCoalescer.instance()
+        self.cache = cache if cache is not None else ResponseCache.instance()
+        self.cache_ttls = CACHE_SETTINGS["ttl"]
+        self.cache_invalidations = CACHE_SETTINGS["invalidates"]
+        self.stale_while_revalidate = CACHE_SETTINGS["stale_while_revalidate"]
+
+    @property
+    def token(self):
+        return self.transport.token
 
     def set_token(self, token):
         """Set the authentication token for API requests"""
-        self.token = token
+        self.transport.set_token(token)
 
     def get_headers(self):
         """Get headers for API requests, including authentication token if available"""
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
-        return headers
+        return self.transport.get_headers()
 
     def get_url(self, endpoint, **kwargs):
         """Get the full URL for an endpoint, with optional format arguments"""
@@ -51,9 +70,10 @@ class ApiService:
         """Fetch holdings for a user"""
         return self.get("holdings", user_id=user_id)
     
-    def get_transactions(self, user_id):
-        """Fetch transactions for a user"""
-        return self.get("transactions", user_id=user_id)
+    def get_transactions(self, user_id, since=None):
+        """Fetch transactions for a user, optionally only those on or after the ISO date `since`"""
+        params = {"since": since} if since else None
+        return self.get("transactions", params=params, user_id=user_id)
 
     def get_cash_balance(self, user_id):
         """Fetch cash balance for a user"""
@@ -117,11 +137,7 @@ class ApiService:
             return False, self._extract_backend_message(response, "Failed to search stock. Please try again.")
 
     def get_AI_response(self, message):
-
-        # # Process the PDF before querying the model
-        url = "http://localhost:5039/api/AI/query/process-pdf"
-        requests.post(url)
-
+        """Ask the AI a question; document ingestion is handled separately by IngestionTracker"""
         success, response = self.get("ai_response", params={"query": message})
         if success:
             return True, response["response"]
@@ -129,12 +145,83 @@ class ApiService:
             return False, self._extract_backend_message(response, "Failed to get AI response. Please try again.")
 
     def get(self, endpoint, params=None, **kwargs):
-        """Generic GET request handler"""
-        url = self.get_url(endpoint, **kwargs)
+        """
+        Generic GET request handler.
+
+        Endpoints with a TTL in CACHE_SETTINGS are served from the response cache
+        while fresh. Stale entries are still returned within the
+        stale-while-revalidate window and refreshed in the background; older
+        entries are revalidated with If-None-Match/If-Modified-Since.
+        Concurrent identical GETs (same endpoint, params, URL arguments and token)
+        share one in-flight request; the returned data must not be mutated.
+        Responses to requests sent before a POST invalidated their endpoint
+        are not cached, and later GETs do not join them.
+        """
+        key = self.coalescer.make_key(endpoint, params, kwargs, self.token)
+        ttl = self.cache_ttls.get(endpoint)
+        cached = self.cache.get(key) if ttl else None
+        generation = self.cache.generation(endpoint)
+
+        if cached is not None:
+            if cached.is_fresh():
+                return True, cached.data
+            if cached.is_servable_stale(self.stale_while_revalidate):
+                self._revalidate_in_background(key, endpoint, params, kwargs, cached, generation)
+                return True, cached.data
+
+        return self.coalescer.run(key + (generation,),
+                                  lambda: self._fetch(endpoint, params, kwargs, key, cached, generation))
+
+    def _revalidate_in_background(self, key, endpoint, params, url_args, cached, generation=0):
+        """Refresh a stale cache entry on the revalidation pool; duplicates coalesce on key and generation"""
+        self._get_revalidation_pool().submit(
+            self.coalescer.run, key + (generation,),
+            lambda: self._fetch(endpoint, params, url_args, key, cached, generation)
+        )
+
+    @classmethod
+    def _get_revalidation_pool(cls):
+        if cls._revalidation_pool is None:
+            with cls._revalidation_lock:
+                if cls._revalidation_pool is None:
+                    cls._revalidation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
+        return cls._revalidation_pool
+
+    def _fetch(self, endpoint, params, url_args, key=None, cached=None, generation=0):
+        """
+        Perform a GET request over the transport, revalidating and updating the cache entry for key.
+        The entry is tagged with `generation` so the cache drops it if the endpoint was invalidated meanwhile.
+        """
+        url = self.get_url(endpoint, **url_args)
+        headers = cached.validators() if cached is not None else None
         try:
-            response = requests.get(url, params=params, headers=self.get_headers())
+            response = self.transport.request("GET", url, params=params, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                cached.touch()
+                return True, cached.data
             response.raise_for_status()
-            return True, response.json()
+            data = response.json()
+            ttl = self.cache_ttls.get(endpoint)
+            if ttl and key is not None:
+                self.cache.put(key, CacheEntry(
+                    data,
+                    size=len(response.content),
+                    ttl=ttl,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    generation=generation,
+                ))
+            return True, data
+        except requests.exceptions.HTTPError as e:
+            print(f"GET {url} failed: {str(e)}")
+            # Keep the status so callers can tell "no data" (404) from transient failures
+            try:
+                error_data = e.response.json() if e.response.content else {}
+            except json.JSONDecodeError:
+                error_data = {}
+            if not isinstance(error_data, dict):
+                error_data = {}
+            return False, {**error_data, "error": str(e), "status": e.response.status_code}
         except requests.exceptions.RequestException as e:
             print(f"GET {url} failed: {str(e)}")
             return False, {"error": str(e)}
@@ -144,12 +231,21 @@ class ApiService:
             return False, {"error": str(e)}
 
     def post(self, endpoint, data, **kwargs):
-        """Generic POST request handler"""
+        """
+        Generic POST request handler.
+
+        Any 2xx response is a success. A JSON body is returned decoded; other
+        bodies (e.g. the text/plain message of process-pdf) are returned as text.
+        """
         url = self.get_url(endpoint, **kwargs)
         try:
-            response = requests.post(url, json=data, headers=self.get_headers())
+            response = self.transport.request("POST", url, json=data)
             response.raise_for_status()
-            return True, response.json()
+            self.cache.invalidate_endpoints(self.cache_invalidations.get(endpoint, ()))
+            try:
+                return True, response.json()
+            except ValueError:  # Empty or non-JSON body
+                return True, response.text
         except requests.exceptions.HTTPError as http_err:
             try:
                 error_data = response.json() if response.content else {}
@@ -180,9 +276,17 @@ class ApiService:
                     return errors[0]
         return default_message
 
-    def process_pdf(self):
-        """Process the PDF through the API"""
-        success, response = self.post("process_pdf", data={})
+    def get_document_fingerprint(self):
+        """Fingerprint (fileName, size, sha256) of the document the server answers questions from"""
+        success, response = self.get("ai_document")
+        if success:
+            return True, response
+        else:
+            return False, self._extract_backend_message(response, "Failed to fetch the document fingerprint.")
+
+    def process_pdf(self, reindex=False):
+        """Process the PDF through the API, dropping existing embeddings first if reindex is set"""
+        success, response = self.post("process_pdf", data={}, reindex=str(reindex).lower())
         if success:
             return True, response
         else:
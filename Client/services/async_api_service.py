@@ -0,0 +1,84 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import HTTP_SETTINGS
+from services.api_service import ApiService
+
+
+class AsyncApiService:
+    """
+    Asyncio variant of ApiService.
+
+    Every call is awaited on the running event loop while the blocking HTTP
+    work runs on a shared thread pool sized to the transport's connection
+    pool, so several requests can be in flight at once over warm connections.
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, api_service=None):
+        """
+        Args:
+            api_service: Synchronous ApiService to delegate to, creates a new one if not provided
+        """
+        self.api_service = api_service or ApiService()
+
+    @classmethod
+    def _get_executor(cls):
+        """Return the thread pool shared by all async clients"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=HTTP_SETTINGS["pool_maxsize"],
+                        thread_name_prefix="api",
+                    )
+        return cls._executor
+
+    async def run(self, fn, *args, **kwargs):
+        """Run a blocking callable on the API thread pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, *args, **kwargs))
+
+    def set_token(self, token):
+        """Set the authentication token for API requests"""
+        self.api_service.set_token(token)
+
+    async def get(self, endpoint, params=None, **kwargs):
+        return await self.run(self.api_service.get, endpoint, params, **kwargs)
+
+    async def post(self, endpoint, data, **kwargs):
+        return await self.run(self.api_service.post, endpoint, data, **kwargs)
+
+    async def get_holdings(self, user_id):
+        return await self.run(self.api_service.get_holdings, user_id)
+
+    async def get_transactions(self, user_id, since=None):
+        return await self.run(self.api_service.get_transactions, user_id, since)
+
+    async def get_cash_balance(self, user_id):
+        return await self.run(self.api_service.get_cash_balance, user_id)
+
+    async def get_profit(self, user_id):
+        return await self.run(self.api_service.get_profit, user_id)
+
+    async def add_money(self, user_id, amount):
+        return await self.run(self.api_service.add_money, user_id, amount)
+
+    async def remove_money(self, user_id, amount):
+        return await self.run(self.api_service.remove_money, user_id, amount)
+
+    async def buy_stock(self, user_id, symbol, quantity):
+        return await self.run(self.api_service.buy_stock, user_id, symbol, quantity)
+
+    async def sell_stock(self, user_id, symbol, quantity):
+        return await self.run(self.api_service.sell_stock, user_id, symbol, quantity)
+
+    async def search_stock(self, symbol, startDate, endDate):
+        return await self.run(self.api_service.search_stock, symbol, startDate, endDate)
+
+    async def get_AI_response(self, message):
+        return await self.run(self.api_service.get_AI_response, message)
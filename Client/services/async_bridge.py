@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class AsyncBridge(QObject):
+    """
+    Bridge between asyncio and the Qt event loop.
+
+    An asyncio loop runs on a background thread; presenters submit coroutines
+    to it and get their results delivered back on the Qt GUI thread through a
+    queued signal, so `await` never blocks the window.
+    """
+
+    _finished = Signal(object, object, object)  # callback, error callback, (result, error)
+
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="asyncio-bridge", daemon=True)
+        self._thread.start()
+        self._finished.connect(self._dispatch)
+
+    @classmethod
+    def instance(cls):
+        """Return the shared bridge; the first call must happen on the GUI thread"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, on_result=None, on_error=None):
+        """
+        Schedule a coroutine on the asyncio loop.
+
+        Args:
+            coro: Coroutine to run
+            on_result: Called on the GUI thread with the coroutine's return value
+            on_error: Called on the GUI thread with the raised exception
+
+        Returns:
+            concurrent.futures.Future for the running coroutine
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(lambda f: self._on_done(f, on_result, on_error))
+        return future
+
+    def _on_done(self, future, on_result, on_error):
+        """Runs on the loop thread; hands the outcome over to the GUI thread"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = None if error else future.result()
+        self._finished.emit(on_result, on_error, (result, error))
+
+    @Slot(object, object, object)
+    def _dispatch(self, on_result, on_error, outcome):
+        result, error = outcome
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                print(f"Async task failed: {error}")
+        elif on_result:
+            on_result(result)
+
+    def shutdown(self):
+        """Stop the asyncio loop and wait for its thread to exit"""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2)
+
+
+def run_async(coro, on_result=None, on_error=None):
+    """Submit a coroutine to the shared AsyncBridge"""
+    return AsyncBridge.instance().submit(coro, on_result, on_error)
@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from PySide6.QtCore import QObject, Signal
+
+from analytics.backtest import param_grid, sweep_chunk
+from config import BACKTEST_SETTINGS
+from services.process_pool import ProcessPool
+
+
+class BacktestService(QObject):
+    """
+    Sweeps strategy parameter grids over many tickers on the ProcessPool.
+
+    Every (ticker, chunk of parameter sets) pair is one task; within a task
+    the parameter sets are simulated together as matrix columns. Progress and
+    the ranked results are reported through signals on the GUI thread.
+    """
+
+    progress = Signal(int, int)  # Tasks finished, tasks submitted
+    finished = Signal(object)  # List of result dicts, best first
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._run = None
+        self._generation = 0
+
+    @property
+    def running(self):
+        return self._run is not None
+
+    def start(self, series_by_ticker, strategy_name, grid=None, cost_bps=None):
+        """
+        Start a sweep, cancelling any that is still running.
+
+        Args:
+            series_by_ticker: Ticker -> OHLCVSeries of daily bars
+            strategy_name: Key of analytics.backtest.STRATEGIES
+            grid: Parameter name -> values, defaults to the strategy's own grid
+            cost_bps: Trading cost in basis points, defaults to BACKTEST_SETTINGS["cost_bps"]
+        """
+        self.cancel()
+        params = param_grid(strategy_name, grid)
+        cost_bps = BACKTEST_SETTINGS["cost_bps"] if cost_bps is None else cost_bps
+        chunk = BACKTEST_SETTINGS["runs_per_task"]
+        tasks = [(ticker, series, params[i:i + chunk])
+                 for ticker, series in series_by_ticker.items() if len(series) > 1
+                 for i in range(0, len(params), chunk)]
+        if not tasks:
+            self.failed.emit("No price history to backtest")
+            return
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._run = {"generation": generation, "total": len(tasks), "done": 0, "results": [], "futures": []}
+            futures = self._run["futures"]
+        executor = ProcessPool.executor()
+        try:
+            for ticker, series, chunk_params in tasks:
+                futures.append(executor.submit(sweep_chunk, ticker, series, strategy_name, chunk_params, cost_bps))
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._fail(generation, f"Backtest pool unavailable: {e}")
+            ProcessPool.reset()
+            return
+        for future in futures:
+            future.add_done_callback(lambda f: self._on_task_done(generation, f))
+
+    def cancel(self):
+        """Stop the running sweep; tasks already executing finish but are ignored"""
+        with self._lock:
+            run, self._run = self._run, None
+        if run:
+            for future in run["futures"]:
+                future.cancel()
+
+    def _on_task_done(self, generation, future):
+        """Runs on the pool's management thread"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._fail(generation, f"Backtest failed: {error}")
+            if isinstance(error, BrokenProcessPool):
+                ProcessPool.reset()
+            return
+
+        with self._lock:
+            run = self._run
+            if run is None or run["generation"] != generation:
+                return
+            run["results"].extend(future.result())
+            run["done"] += 1
+            done, complete = run["done"], run["done"] >= run["total"]
+            if complete:
+                self._run = None
+        self.progress.emit(done, run["total"])
+        if complete:
+            key = BACKTEST_SETTINGS["rank_by"]
+            ranked = sorted(run["results"], key=lambda r: r[key] if r[key] == r[key] else float("-inf"),
+                            reverse=True)
+            self.finished.emit(ranked)
+
+    def _fail(self, generation, message):
+        with self._lock:
+            run = self._run
+            if run is None or run["generation"] != generation:
+                return
+            self._run = None
+        for future in run["futures"]:
+            future.cancel()
+        print(message)
+        self.failed.emit(message)
@@ -0,0 +1,106 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HTTP_SETTINGS
+
+
+class HttpTransport:
+    """
+    Process-wide HTTP transport shared by every ApiService instance.
+
+    Owns a single pooled requests.Session (keep-alive connections, per-host
+    connection pools, retry and backoff policy) together with the
+    authentication token, so all models reuse the same warm connections.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, settings=None):
+        """
+        Initialize the transport.
+
+        Args:
+            settings: Optional dict overriding values from HTTP_SETTINGS
+        """
+        self.settings = {**HTTP_SETTINGS, **(settings or {})}
+        self.timeout = self.settings["timeout"]
+        self._token = None
+        self._lock = threading.Lock()
+        self.session = self._create_session()
+
+    @classmethod
+    def instance(cls):
+        """Return the shared transport, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _create_session(self):
+        """Build a Session with pooled, retrying adapters mounted for http and https"""
+        retry = Retry(
+            total=self.settings["max_retries"],
+            backoff_factor=self.settings["backoff_factor"],
+            status_forcelist=self.settings["retry_statuses"],
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.settings["pool_connections"],
+            pool_maxsize=self.settings["pool_maxsize"],
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        return session
+
+    @property
+    def token(self):
+        with self._lock:
+            return self._token
+
+    def set_token(self, token):
+        """Set the authentication token shared by all API clients"""
+        with self._lock:
+            self._token = token
+
+    def get_headers(self):
+        """Per-request headers; the token is sent per call so the session itself stays immutable"""
+        headers = {
+            'Content-Type': 'application/json'
+        }
+        token = self.token
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        return headers
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request over the pooled session.
+
+        Args:
+            method: HTTP method name
+            url: Absolute URL
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response
+        """
+        headers = self.get_headers()
+        headers.update(kwargs.pop("headers", None) or {})
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from config import AI_SETTINGS
+from services.api_service import ApiService
+
+
+class IngestionTracker:
+    """
+    Tracks which version of the RAG source document the server has ingested.
+
+    The server fingerprints its own document (the configured PdfFileName) by
+    size and SHA-256. The server is asked to process it only when that
+    fingerprint differs from the one recorded at the last ingestion this
+    client triggered; every ingestion bumps a generation number kept in
+    ~/.stockapp/ingestion.json. Ingestion always drops the existing
+    embeddings first, since the server may still hold those of an older
+    document, even on a client's first run.
+
+    A failed ingestion is not retried on every question: further attempts
+    wait AI_SETTINGS["ingestion_retry_min"] seconds, doubling per failure up
+    to "ingestion_retry_max".
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    HISTORY_LENGTH = 20  # Generations kept in the state file
+
+    def __init__(self, api_service=None, state_file=None):
+        """
+        Args:
+            api_service: Service for API communication, creates a new one if not provided
+            state_file: Where ingestion state is recorded, defaults to ~/.stockapp/ingestion.json
+        """
+        self.api_service = api_service or ApiService()
+        self._state_file = Path(state_file) if state_file else self._get_state_file_path()
+        self._state = self._load_state()
+        self._lock = threading.Lock()
+        self._verified = False  # Fingerprint already checked in this session
+        self._retry_delay = AI_SETTINGS["ingestion_retry_min"]
+        self._retry_at = 0.0  # Monotonic time before which a failed ingestion is not retried
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide tracker, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _get_state_file_path(self):
+        """Get the path to the ingestion state file"""
+        app_data_dir = Path.home() / ".stockapp"
+        if not app_data_dir.exists():
+            app_data_dir.mkdir(exist_ok=True)
+        return app_data_dir / "ingestion.json"
+
+    def _load_state(self):
+        try:
+            with open(self._state_file, 'r') as f:
+                state = json.load(f)
+            if "document" in state:
+                return state
+        except (OSError, json.JSONDecodeError):
+            pass
+        # Missing, unreadable or from a version that fingerprinted files locally
+        return {"generation": 0, "document": None, "history": []}
+
+    def _save_state(self):
+        try:
+            with open(self._state_file, 'w') as f:
+                json.dump(self._state, f, indent=2)
+        except OSError as e:
+            print(f"Error saving ingestion state: {str(e)}")
+
+    @property
+    def generation(self):
+        """Number of successful ingestions recorded so far (0 = never ingested)"""
+        return self._state["generation"]
+
+    def ensure_ingested(self, force=False):
+        """
+        Make sure the server has ingested its current document, triggering processing only if needed.
+
+        Args:
+            force: Re-process even if nothing changed
+
+        Returns:
+            tuple: (success, generation); success is False while backing off after a failure
+        """
+        with self._lock:
+            if self._verified and not force:
+                return True, self.generation
+            if not force and time.monotonic() < self._retry_at:
+                return False, self.generation
+
+            success, document = self.api_service.get_document_fingerprint()
+            if success and not force and document == self._state["document"]:
+                self._verified = True
+                return True, self.generation
+
+            if success:
+                print(f"Ingesting {document.get('fileName')} (generation {self.generation + 1})")
+                # Whatever the server holds may come from an older document, so always start over
+                success, response = self.api_service.process_pdf(reindex=True)
+            else:
+                response = document
+            if not success:
+                print(f"Document ingestion failed, retrying in {self._retry_delay}s: {response}")
+                self._retry_at = time.monotonic() + self._retry_delay
+                self._retry_delay = min(self._retry_delay * 2, AI_SETTINGS["ingestion_retry_max"])
+                return False, self.generation
+
+            self._retry_delay = AI_SETTINGS["ingestion_retry_min"]
+            self._retry_at = 0.0
+            self._state["generation"] += 1
+            self._state["document"] = document
+            self._state["history"] = (self._state["history"] + [{
+                "generation": self._state["generation"],
+                "ingested_at": time.time(),
+                "sha256": document.get("sha256"),
+            }])[-self.HISTORY_LENGTH:]
+            self._save_state()
+            self._verified = True
+            return True, self.generation
@@ -0,0 +1,186 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class LocalStore:
+    """
+    On-disk client-side store (SQLite) for trades, holdings snapshots and cash balances.
+
+    Lives next to the session file in ~/.stockapp. A single connection is shared
+    across threads and serialized with a lock; WAL journaling keeps writes cheap.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    SCHEMA_VERSION = 1  # Bumped when a table changes; older stores drop their trades and sync again
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS trades (
+            user_id INTEGER NOT NULL,
+            id INTEGER NOT NULL,  -- The server's log Id; two trades may be otherwise identical
+            symbol TEXT NOT NULL,
+            date TEXT NOT NULL,
+            type INTEGER NOT NULL,
+            quantity REAL NOT NULL,
+            price REAL NOT NULL,
+            UNIQUE (user_id, id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_trades_user_date ON trades (user_id, date);
+
+        CREATE TABLE IF NOT EXISTS holdings_snapshots (
+            user_id INTEGER PRIMARY KEY,
+            taken_at REAL NOT NULL,
+            payload TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS cash_balances (
+            user_id INTEGER PRIMARY KEY,
+            balance REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS sync_state (
+            user_id INTEGER PRIMARY KEY,
+            last_trade_date TEXT,
+            synced_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Database file, defaults to ~/.stockapp/store.db (":memory:" is accepted)
+        """
+        self._path = str(path or self._get_store_file_path())
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate()
+            self._conn.executescript(self.SCHEMA)
+
+    def _migrate(self):
+        """Drop trades stored under an older schema; the next sync downloads them again"""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < self.SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS trades")
+            self._conn.execute("DROP TABLE IF EXISTS sync_state")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide store, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _get_store_file_path(self):
+        """Get the path to the database file"""
+        app_data_dir = Path.home() / ".stockapp"
+        if not app_data_dir.exists():
+            app_data_dir.mkdir(exist_ok=True)
+        return app_data_dir / "store.db"
+
+    # Trades
+
+    def get_trades(self, user_id):
+        """Return all stored trades for a user, oldest first, in the API's dict format"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, symbol, date, type, quantity, price FROM trades WHERE user_id = ? ORDER BY date, id",
+                (user_id,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def merge_trades(self, user_id, trades):
+        """
+        Insert trades that are not stored yet (by their server Id) and advance the sync watermark.
+
+        Args:
+            user_id: Owner of the trades
+            trades: Trades in the API's dict format (id, symbol, date, type, quantity, price)
+
+        Returns:
+            int: Number of trades that were new
+        """
+        rows = [
+            (user_id, int(t["id"]), t["symbol"], t["date"], int(t["type"]), float(t["quantity"]), float(t["price"]))
+            for t in trades
+        ]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO trades (user_id, id, symbol, date, type, quantity, price) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            inserted = self._conn.total_changes - before
+            last_date = self._conn.execute(
+                "SELECT MAX(date) FROM trades WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (user_id, last_trade_date, synced_at) VALUES (?, ?, ?)",
+                (user_id, last_date, time.time()),
+            )
+        return inserted
+
+    def last_trade_date(self, user_id):
+        """Date of the newest synced trade, or None before the first sync"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_trade_date FROM sync_state WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    # Holdings snapshots
+
+    def save_holdings(self, user_id, holdings):
+        """Replace the user's holdings snapshot with the raw API payload"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO holdings_snapshots (user_id, taken_at, payload) VALUES (?, ?, ?)",
+                (user_id, time.time(), json.dumps(holdings)),
+            )
+
+    def load_holdings(self, user_id):
+        """Return the last holdings snapshot payload, or None if there is none"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM holdings_snapshots WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # Cash balance
+
+    def save_cash_balance(self, user_id, balance):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cash_balances (user_id, balance, updated_at) VALUES (?, ?, ?)",
+                (user_id, float(balance), time.time()),
+            )
+
+    def load_cash_balance(self, user_id):
+        """Return the last known cash balance, or None if there is none"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT balance FROM cash_balances WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def clear_user(self, user_id):
+        """Forget everything stored for a user (forces a full resync)"""
+        with self._lock, self._conn:
+            for table in ("trades", "holdings_snapshots", "cash_balances", "sync_state"):
+                self._conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,39 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from config import PROCESS_POOL_SETTINGS
+
+
+class ProcessPool:
+    """
+    Worker processes shared by the CPU-bound analytics jobs (Monte Carlo
+    simulations, backtest sweeps), created on first use.
+
+    Work submitted here must be a module-level function with picklable
+    arguments, importable from the Client root by the spawned workers.
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def worker_count():
+        return PROCESS_POOL_SETTINGS["max_workers"] or os.cpu_count() or 1
+
+    @classmethod
+    def executor(cls):
+        """Return the shared pool, creating it on first use"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ProcessPoolExecutor(max_workers=cls.worker_count())
+        return cls._executor
+
+    @classmethod
+    def reset(cls):
+        """Drop a broken pool; the next job starts a fresh one"""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
@@ -0,0 +1,132 @@
+import datetime
+import random
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from config import QUOTE_SETTINGS
+from services.async_api_service import AsyncApiService
+from services.async_bridge import run_async
+from services.http_transport import HttpTransport
+
+
+def market_timezone():
+    """The exchange timezone from QUOTE_SETTINGS, or a fixed UTC-5 if no time zone database is installed"""
+    try:
+        return ZoneInfo(QUOTE_SETTINGS["timezone"])
+    except ZoneInfoNotFoundError:  # Windows without the tzdata package
+        return datetime.timezone(datetime.timedelta(hours=-5))
+
+
+def market_is_open(now=None):
+    """Whether `now` (an aware datetime, default the current time) falls in the regular weekday session"""
+    now = (now or datetime.datetime.now(datetime.timezone.utc)).astimezone(market_timezone())
+    if now.weekday() >= 5:
+        return False
+    opens = datetime.time.fromisoformat(QUOTE_SETTINGS["market_open"])
+    closes = datetime.time.fromisoformat(QUOTE_SETTINGS["market_close"])
+    return opens <= now.time() < closes
+
+
+class QuoteService(QObject):
+    """
+    Polls current prices of a set of symbols and reports only the ones that moved.
+
+    One request fetches every symbol. Polls are spaced by QUOTE_SETTINGS
+    ["interval"] while the market is open and ["closed_interval"] otherwise,
+    each stretched by a random jitter so many clients do not poll in step;
+    failures back off up to the closed interval. At most one request is in
+    flight at a time, so the request rate stays fixed however often the
+    dashboard is shown or refreshed.
+    """
+
+    quotes_changed = Signal(object)  # Symbol -> new price, only for symbols whose price changed
+    failed = Signal(str)
+
+    def __init__(self, parent=None, url=None, transport=None):
+        """
+        Args:
+            url: Quote endpoint, defaults to QUOTE_SETTINGS["url"]
+            transport: HttpTransport to send requests over, defaults to the shared one
+        """
+        super().__init__(parent)
+        self.url = url or QUOTE_SETTINGS["url"]
+        self.transport = transport or HttpTransport.instance()
+        self.async_api = AsyncApiService()
+        self.symbols = ()
+        self.prices = {}  # Symbol -> last price received
+        self.failures = 0  # Consecutive failed polls
+        self.running = False
+        self._in_flight = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._poll)
+
+    def set_symbols(self, symbols):
+        """Poll these symbols from the next request on"""
+        self.symbols = tuple(sorted(set(symbols)))
+        self.prices = {s: p for s, p in self.prices.items() if s in self.symbols}
+
+    def start(self):
+        """Start polling right away; does nothing if already polling"""
+        if self.running:
+            return
+        self.running = True
+        if not self._in_flight:
+            self._timer.start(0)
+
+    def stop(self):
+        self.running = False
+        self._timer.stop()
+
+    def next_interval(self, now=None):
+        """Seconds until the next poll"""
+        if market_is_open(now):
+            interval = QUOTE_SETTINGS["interval"] * 2 ** self.failures
+        else:
+            interval = QUOTE_SETTINGS["closed_interval"]
+        interval = min(interval, QUOTE_SETTINGS["closed_interval"])
+        jitter = QUOTE_SETTINGS["jitter"]
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    def fetch(self, symbols):
+        """
+        Request the current price of some symbols (blocking).
+
+        Returns:
+            dict: Symbol -> price
+        """
+        response = self.transport.request("GET", self.url, params={"symbols": ",".join(symbols)},
+                                          timeout=QUOTE_SETTINGS["timeout"])
+        response.raise_for_status()
+        return {quote["symbol"]: float(quote["price"]) for quote in response.json()}
+
+    def _poll(self):
+        if not self.running:
+            return
+        if not self.symbols:
+            self._schedule()
+            return
+        self._in_flight = True
+        run_async(self.async_api.run(self.fetch, self.symbols), on_result=self._on_quotes, on_error=self._on_error)
+
+    def _schedule(self):
+        if self.running:
+            self._timer.start(int(self.next_interval() * 1000))
+
+    def _on_quotes(self, prices):
+        self._in_flight = False
+        self.failures = 0
+        changed = {s: p for s, p in prices.items() if s in self.symbols and self.prices.get(s) != p}
+        self.prices.update(changed)
+        if changed:
+            self.quotes_changed.emit(changed)
+        self._schedule()
+
+    def _on_error(self, error):
+        self._in_flight = False
+        self.failures += 1
+        message = f"Quote update failed: {error}"
+        print(message)
+        self.failed.emit(message)
+        self._schedule()
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import random
+import threading
+import weakref
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+from config import STREAM_SETTINGS
+from services.async_bridge import AsyncBridge
+
+
+@dataclass(frozen=True)
+class Quote:
+    symbol: str
+    price: float
+    timestamp: int  # Epoch milliseconds of the trade
+
+
+class QuoteStream(QObject):
+    """
+    Push-based quotes over one WebSocket shared by every page.
+
+    The connection runs on the AsyncBridge loop and asks the feed for the
+    union of the symbols subscribed to:
+        -> {"action": "subscribe" | "unsubscribe", "symbols": ["AAPL", ...]}
+        <- [{"symbol": "AAPL", "price": 187.31, "timestamp": 1718900000000}, ...]
+    Ticks are decoded off the GUI thread and coalesced per symbol; a frame
+    timer on the GUI thread hands each subscriber its latest quotes at most
+    STREAM_SETTINGS["frame_rate"] times a second, however fast the feed is.
+    The last quote of every symbol is kept, so new subscribers start from it.
+    A dropped connection is retried with exponential backoff and resubscribed.
+    """
+
+    connection_changed = Signal(bool)  # Emitted on the GUI thread when the feed connects or drops
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, url=None, frame_rate=None):
+        """
+        Args:
+            url: Feed URL, defaults to STREAM_SETTINGS["url"]
+            frame_rate: Most deliveries per second, defaults to STREAM_SETTINGS["frame_rate"]
+        """
+        super().__init__()
+        self.url = url or STREAM_SETTINGS["url"]
+        self.loop = AsyncBridge.instance().loop
+        self.last = {}  # Symbol -> last Quote received
+        self.connected = False
+        self.received = 0  # Ticks received since start, for load testing
+        self._subscribers = []  # [weak callback, frozenset of symbols]
+        self._symbols = frozenset()  # Union of the subscribed symbols; sent to the feed from the loop thread
+        self._sent = set()  # Symbols the feed was asked for on the current connection (loop thread only)
+        self._socket = None
+        self._task = None
+        self._pending = {}  # Symbol -> newest Quote not delivered yet
+        self._pending_lock = threading.Lock()
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(max(1, int(1000 / (frame_rate or STREAM_SETTINGS["frame_rate"]))))
+        self._frame_timer.timeout.connect(self._deliver)
+
+    @classmethod
+    def instance(cls):
+        """Return the shared stream; the first call must happen on the GUI thread"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------ subscriptions
+
+    def subscribe(self, callback, symbols):
+        """
+        Deliver quotes of some symbols to `callback(quotes)` on the GUI thread, where quotes maps
+        each symbol that moved since the last frame to its Quote. Replaces the symbols the callback
+        was subscribed to before; bound methods are held weakly. Connects on first use.
+
+        Cached quotes of the symbols are delivered right away.
+        """
+        symbols = frozenset(symbols)
+        self._subscribers = [entry for entry in self._subscribers
+                             if entry[0]() is not None and entry[0]() != callback]
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        self._subscribers.append([ref, symbols])
+        self._update_symbols()
+        self.start()
+
+        cached = {s: self.last[s] for s in symbols if s in self.last}
+        if cached:
+            callback(cached)
+
+    def unsubscribe(self, callback):
+        self._subscribers = [entry for entry in self._subscribers
+                             if entry[0]() is not None and entry[0]() != callback]
+        self._update_symbols()
+
+    def quote(self, symbol):
+        """Last Quote received for a symbol, or None"""
+        return self.last.get(symbol)
+
+    def _update_symbols(self):
+        symbols = frozenset().union(*(entry[1] for entry in self._subscribers))
+        if symbols != self._symbols:
+            self._symbols = symbols
+            self.loop.call_soon_threadsafe(self._sync_symbols)
+
+    # ------------------------------------------------------------------ connection
+
+    def start(self):
+        """Connect to the feed and keep reconnecting until stopped; does nothing if already running"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.run_coroutine_threadsafe(self._run(), self.loop)
+        self._frame_timer.start()
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._frame_timer.stop()
+
+    async def _run(self):
+        delay = STREAM_SETTINGS["reconnect_min"]
+        reported = False  # Only the first failure of a streak is printed
+        while True:
+            try:
+                async with connect(self.url, open_timeout=STREAM_SETTINGS["open_timeout"]) as socket:
+                    self._socket = socket
+                    self._sent = set()
+                    self._set_connected(True)
+                    delay = STREAM_SETTINGS["reconnect_min"]
+                    reported = False
+                    self._sync_symbols()
+                    async for message in socket:
+                        self._receive(message)
+            except (OSError, TimeoutError, WebSocketException) as error:
+                if not reported:
+                    print(f"Quote stream unavailable ({error}), retrying in the background")
+                    reported = True
+            finally:
+                self._socket = None
+                if self.connected:
+                    self._set_connected(False)
+            # Randomized, so clients dropped together do not reconnect together
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, STREAM_SETTINGS["reconnect_max"])
+
+    def _set_connected(self, connected):
+        self.connected = connected
+        self.connection_changed.emit(connected)
+
+    def _sync_symbols(self):
+        """Runs on the loop thread; tells the feed which symbols were added or dropped"""
+        if self._socket is None:
+            return
+        wanted = self._symbols
+        added, removed = sorted(wanted - self._sent), sorted(self._sent - wanted)
+        self._sent = set(wanted)
+        for action, symbols in (("subscribe", added), ("unsubscribe", removed)):
+            if symbols:
+                self.loop.create_task(self._send({"action": action, "symbols": symbols}))
+
+    async def _send(self, message):
+        socket = self._socket
+        if socket is None:
+            return
+        try:
+            await socket.send(json.dumps(message))
+        except WebSocketException:
+            pass  # The receive loop notices the drop and resubscribes after reconnecting
+
+    def _receive(self, message):
+        """Runs on the loop thread; decodes a message and keeps the newest tick of each symbol"""
+        try:
+            ticks = json.loads(message)
+            if isinstance(ticks, dict):
+                ticks = [ticks]
+            quotes = [Quote(t["symbol"], float(t["price"]), int(t.get("timestamp", 0))) for t in ticks]
+        except (ValueError, TypeError, KeyError) as error:
+            print(f"Ignoring malformed quote message: {error}")
+            return
+        with self._pending_lock:
+            pending = self._pending
+            for quote in quotes:
+                previous = pending.get(quote.symbol)
+                if previous is None or quote.timestamp >= previous.timestamp:
+                    pending[quote.symbol] = quote
+        self.received += len(quotes)
+
+    # ------------------------------------------------------------------ delivery
+
+    def _deliver(self):
+        """Frame timer tick on the GUI thread: hand each subscriber the quotes that moved"""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+        self.last.update(batch)
+
+        for entry in list(self._subscribers):
+            callback = entry[0]()
+            if callback is None:
+                continue
+            symbols = entry[1]
+            if len(symbols) < len(batch):
+                quotes = {s: batch[s] for s in symbols if s in batch}
+            else:
+                quotes = {s: q for s, q in batch.items() if s in symbols}
+            if quotes:
+                callback(quotes)
+        self._subscribers = [entry for entry in self._subscribers if entry[0]() is not None]
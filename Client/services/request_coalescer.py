@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import Future
+
+
+class RequestCoalescer:
+    """
+    Collapses concurrent identical requests into a single backend round-trip.
+
+    The first caller for a key performs the request; callers arriving while it
+    is still in flight wait for and share its result. Shared results must be
+    treated as read-only by the callers.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide coalescer, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def make_key(*parts):
+        """Build a hashable key from request parts (dicts and lists are frozen recursively)"""
+        return tuple(_freeze(part) for part in parts)
+
+    def run(self, key, fn):
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Hashable request identity, see make_key
+            fn: Zero-argument callable performing the request
+
+        Returns:
+            The value returned by fn, shared with every coalesced caller
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def in_flight(self):
+        """Number of distinct requests currently in flight"""
+        with self._lock:
+            return len(self._in_flight)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import CACHE_SETTINGS
+
+
+class CacheEntry:
+    """A cached response body together with its validators and freshness window"""
+
+    __slots__ = ("data", "size", "etag", "last_modified", "stored_at", "ttl", "generation")
+
+    def __init__(self, data, size, ttl, etag=None, last_modified=None, generation=0):
+        """
+        Args:
+            generation: Invalidation generation of the endpoint when the request was sent,
+                see ResponseCache.generation
+        """
+        self.data = data
+        self.size = size
+        self.ttl = ttl
+        self.etag = etag
+        self.last_modified = last_modified
+        self.generation = generation
+        self.stored_at = time.monotonic()
+
+    def age(self):
+        return time.monotonic() - self.stored_at
+
+    def is_fresh(self):
+        return self.age() < self.ttl
+
+    def is_servable_stale(self, stale_while_revalidate):
+        """True while the entry is stale but may still be served during a background refresh"""
+        return self.age() < self.ttl + stale_while_revalidate
+
+    def touch(self):
+        """Mark the entry fresh again after a successful revalidation (304)"""
+        self.stored_at = time.monotonic()
+
+    def validators(self):
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU response cache bounded by the total size of stored bodies.
+
+    Keys are the request keys built by ApiService; the first element of every
+    key is the endpoint name, which is what invalidate_endpoints matches on.
+
+    Every invalidation bumps the generation of the endpoints it drops. An
+    entry fetched before that (e.g. by a background refresh still in flight
+    when a write went through) carries an older generation and is discarded
+    by put instead of bringing the invalidated data back.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_bytes):
+        """
+        Args:
+            max_bytes: Upper bound on the summed size of cached response bodies
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped by every invalidation
+        self._invalidated_at = {}  # Endpoint -> generation of its last invalidation
+        self._cleared_at = 0  # Generation of the last clear
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(CACHE_SETTINGS["max_bytes"])
+        return cls._instance
+
+    def get(self, key):
+        """Return the entry for key (marking it most recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def generation(self, endpoint):
+        """Invalidation generation of an endpoint; capture it before a request and tag the entry with it"""
+        return max(self._invalidated_at.get(endpoint, 0), self._cleared_at)
+
+    def put(self, key, entry):
+        """
+        Store an entry, evicting least recently used entries to stay within max_bytes.
+
+        Entries tagged with a generation older than their endpoint's current one
+        were fetched before an invalidation and are dropped.
+        """
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if entry.generation < self.generation(key[0]):
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size
+
+    def invalidate_endpoints(self, endpoints):
+        """Drop every entry whose endpoint is in endpoints"""
+        endpoints = set(endpoints)
+        with self._lock:
+            self._generation += 1
+            for endpoint in endpoints:
+                self._invalidated_at[endpoint] = self._generation
+            for key in [k for k in self._entries if k[0] in endpoints]:
+                self._total_bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class NullCache:
+    """Cache that stores nothing; plug it into ApiService to disable response caching"""
+
+    def get(self, key):
+        return None
+
+    def generation(self, endpoint):
+        return 0
+
+    def put(self, key, entry):
+        pass
+
+    def invalidate_endpoints(self, endpoints):
+        pass
+
+    def clear(self):
+        pass
@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from analytics.monte_carlo import simulate_shard, simulation_inputs, summarize
+from config import SIMULATION_SETTINGS
+from services.process_pool import ProcessPool
+
+
+class SimulationService(QObject):
+    """
+    Runs Monte Carlo portfolio simulations on a process pool.
+
+    The paths are split into shards with independent random streams and
+    spread over the application's ProcessPool, so a run scales with
+    the number of cores and never blocks the GUI. Progress and the final
+    summary are reported through signals, which Qt delivers on the GUI thread.
+    """
+
+    progress = Signal(int, int)  # Paths finished, paths requested
+    finished = Signal(object)  # Summary from analytics.monte_carlo.summarize
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._run = None  # State of the running simulation
+        self._generation = 0
+
+    @property
+    def running(self):
+        return self._run is not None
+
+    def start(self, returns, values, paths=None, method=None, horizons=None, seed=None):
+        """
+        Start a simulation, cancelling any that is still running.
+
+        Args:
+            returns: (days x holdings) historical daily returns of the holdings
+            values: Current market value of each holding
+            paths: Number of paths, defaults to SIMULATION_SETTINGS["paths"]
+            method: "bootstrap" or "normal", defaults to SIMULATION_SETTINGS["method"]
+            horizons: Trading-day horizons, defaults to SIMULATION_SETTINGS["horizons"]
+            seed: Seed for reproducible runs; None draws a fresh one
+        """
+        self.cancel()
+        paths = paths or SIMULATION_SETTINGS["paths"]
+        horizons = tuple(horizons or SIMULATION_SETTINGS["horizons"])
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values) or len(returns) < 2:
+            self.failed.emit("Not enough holdings or price history to simulate")
+            return
+        inputs = simulation_inputs(returns, method or SIMULATION_SETTINGS["method"])
+
+        executor = ProcessPool.executor()
+        shard_count = min(paths, SIMULATION_SETTINGS["shards_per_worker"] * ProcessPool.worker_count())
+        sizes = [len(s) for s in np.array_split(np.arange(paths), shard_count)]
+        seeds = np.random.SeedSequence(seed).spawn(shard_count)
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._run = {"generation": generation, "initial": float(values.sum()), "paths": paths,
+                         "done": 0, "results": [], "futures": []}
+            futures = self._run["futures"]
+        try:
+            for size, shard_seed in zip(sizes, seeds):
+                futures.append(executor.submit(simulate_shard, inputs, values, horizons, size, shard_seed,
+                                               SIMULATION_SETTINGS["batch_paths"]))
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._fail(generation, f"Simulation pool unavailable: {e}")
+            ProcessPool.reset()
+            return
+        for future, size in zip(futures, sizes):
+            future.add_done_callback(lambda f, size=size: self._on_shard_done(generation, size, f))
+
+    def cancel(self):
+        """Stop the running simulation; shards already executing finish but are ignored"""
+        with self._lock:
+            run, self._run = self._run, None
+        if run:
+            for future in run["futures"]:
+                future.cancel()
+
+    def _on_shard_done(self, generation, size, future):
+        """Runs on the pool's management thread"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._fail(generation, f"Simulation failed: {error}")
+            if isinstance(error, BrokenProcessPool):
+                ProcessPool.reset()
+            return
+
+        with self._lock:
+            run = self._run
+            if run is None or run["generation"] != generation:
+                return
+            run["results"].append(future.result())
+            run["done"] += size
+            done, complete = run["done"], run["done"] >= run["paths"]
+            if complete:
+                self._run = None
+        self.progress.emit(done, run["paths"])
+        if complete:
+            self._finish(run)
+
+    def _finish(self, run):
+        horizons = run["results"][0].keys()
+        terminal = {h: np.concatenate([r[h] for r in run["results"]]) for h in horizons}
+        self.finished.emit(summarize(run["initial"], terminal, SIMULATION_SETTINGS["confidence"],
+                                     SIMULATION_SETTINGS["histogram_bins"]))
+
+    def _fail(self, generation, message):
+        with self._lock:
+            run = self._run
+            if run is None or run["generation"] != generation:
+                return
+            self._run = None
+        for future in run["futures"]:
+            future.cancel()
+        print(message)
+        self.failed.emit(message)
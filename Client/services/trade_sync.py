@@ -0,0 +1,43 @@
+from services.api_service import ApiService
+from services.local_store import LocalStore
+
+
+class TradeSyncService:
+    """
+    Keeps the local trade store in step with the server.
+
+    The first sync downloads the full trade list; later syncs ask only for
+    trades on or after the newest stored trade date and merge them, so only
+    new trades cross the wire. Duplicates at the watermark are dropped by the
+    store's uniqueness constraint.
+    """
+
+    def __init__(self, api_service=None, store=None):
+        """
+        Args:
+            api_service: Service for API communication, creates a new one if not provided
+            store: LocalStore to sync into, defaults to the process-wide one
+        """
+        self.api_service = api_service or ApiService()
+        self.store = store or LocalStore.instance()
+
+    def sync(self, user_id):
+        """
+        Fetch new trades for a user and return the full merged trade list.
+
+        Returns:
+            tuple: (success, data) where data is the trade list (oldest first) or an error.
+            If the server is unreachable but trades are stored locally, those are returned.
+        """
+        since = self.store.last_trade_date(user_id)
+        success, response = self.api_service.get_transactions(user_id, since=since)
+
+        if success and isinstance(response, list):
+            self.store.merge_trades(user_id, response)
+            return True, self.store.get_trades(user_id)
+
+        local_trades = self.store.get_trades(user_id)
+        if local_trades:
+            print(f"Trade sync failed, using local trades: {response}")
+            return True, local_trades
+        return False, response
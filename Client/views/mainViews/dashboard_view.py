@@ -1,16 +1,16 @@
 import datetime
 import sys
 
+import numpy as np
 from PySide6.QtCharts import QAreaSeries
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QPointF, QTimer
 from PySide6.QtGui import QBrush, QColor, QPen
-from functools import partial
 
 sys.path.append('..')
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
-    QHeaderView, QTableWidgetItem, QTableWidget
+    QGridLayout, QLabel, QProgressBar
 )
 
 from PySide6.QtGui import QColor, QFont
@@ -19,11 +19,13 @@ from PySide6.QtCore import Qt, QDateTime
 # Import custom components
 from PySide6.QtCharts import QLineSeries, QDateTimeAxis, QValueAxis
 
+from components.downsampling import lttb, target_points
+from config import CHART_SETTINGS, RISK_SETTINGS, SIMULATION_SETTINGS
 from components.styled_widgets import (
-    FilterComboBox, ScrollableContainer, StyledLineSeriesChart, StyledStatsCard, StyledTable,
-    PageTitleLabel, SectionTitleLabel, StyledLabel, PrimaryButton, DangerButton,
-    SellButton
+    FilterComboBox, ScrollableContainer, StyledLineSeriesChart, StyledStatsCard, StyledTableView,
+    PageTitleLabel, SectionTitleLabel, StyledLabel, PrimaryButton, DangerButton, SkeletonOverlay
 )
+from components.table_models import ButtonDelegate, HoldingsTableModel
 
 
 class CashBalanceCard(StyledStatsCard):
@@ -39,89 +41,160 @@ class CashBalanceCard(StyledStatsCard):
         self.layout.addLayout(button_layout)
 
 
-# Ensure SellButton and StyledTable are imported or defined elsewhere
+class RiskMetricsCard(StyledStatsCard):
+    """Sharpe ratio as the headline value, with the other risk metrics listed below it"""
 
-class HoldingsTable(StyledTable):
-    # Create a custom signal that emits an integer (the holding ID)
+    ROWS = [
+        ("volatility", "Volatility", "{:.1%}"),
+        ("sortino", "Sortino", "{:.2f}"),
+        ("max_drawdown", "Max Drawdown", "{:.1%}"),
+        ("beta", "Beta vs {benchmark}", "{:.2f}"),
+        ("rolling_correlation", "Rolling Correlation", "{:.2f}"),
+    ]
+
+    def __init__(self, title, value, subtitle=None, icon=None, color="#5851DB", parent=None):
+        super().__init__(title, value, subtitle, icon, color, parent)
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(12)
+        grid.setVerticalSpacing(2)
+        self.metric_labels = {}
+        for row, (key, name, _) in enumerate(self.ROWS):
+            name_label = QLabel(name.format(benchmark=RISK_SETTINGS["benchmark"]))
+            name_label.setStyleSheet("color: #666; font-size: 13px; background: none; border: none;")
+            value_label = QLabel("-")
+            value_label.setStyleSheet("color: #000; font-size: 13px; font-weight: bold; background: none; border: none;")
+            value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            grid.addWidget(name_label, row, 0)
+            grid.addWidget(value_label, row, 1)
+            self.metric_labels[key] = value_label
+        self.layout.addLayout(grid)
+
+    def set_metrics(self, metrics):
+        """
+        Args:
+            metrics: Portfolio metrics (see analytics.risk.risk_metrics) plus the latest
+                rolling correlation, or None to clear the card
+        """
+        metrics = metrics or {}
+        self.value_label.setText(self._format(metrics.get("sharpe"), "{:.2f}"))
+        for key, _, fmt in self.ROWS:
+            self.metric_labels[key].setText(self._format(metrics.get(key), fmt))
+
+    @staticmethod
+    def _format(value, fmt):
+        return "-" if value is None or np.isnan(value) else fmt.format(value)
+
+
+class SimulationCard(StyledStatsCard):
+    """Monte Carlo VaR / CVaR per horizon, with a button to start a run and its progress"""
+
+    run_clicked = Signal()
+
+    def __init__(self, title, value, subtitle=None, icon=None, color="#5851DB", parent=None):
+        super().__init__(title, value, subtitle, icon, color, parent)
+        self.status_label = QLabel(f"{SIMULATION_SETTINGS['paths']:,} paths, {SIMULATION_SETTINGS['method']}")
+        self.status_label.setStyleSheet("color: #666; font-size: 13px; background: none; border: none;")
+        self.layout.addWidget(self.status_label)
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(12)
+        grid.setVerticalSpacing(2)
+        self.metric_labels = {}
+        levels = SIMULATION_SETTINGS["confidence"]
+        for column, level in enumerate(levels):
+            for offset, name in enumerate(("VaR", "CVaR")):
+                header = QLabel(f"{name} {level:.0%}")
+                header.setStyleSheet("color: #666; font-size: 13px; background: none; border: none;")
+                header.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                grid.addWidget(header, 0, 1 + 2 * column + offset)
+        for row, horizon in enumerate(SIMULATION_SETTINGS["horizons"], start=1):
+            name_label = QLabel(f"{horizon}-day")
+            name_label.setStyleSheet("color: #666; font-size: 13px; background: none; border: none;")
+            grid.addWidget(name_label, row, 0)
+            for column, level in enumerate(levels):
+                for offset, kind in enumerate(("var", "cvar")):
+                    value_label = QLabel("-")
+                    value_label.setStyleSheet(
+                        "color: #000; font-size: 13px; font-weight: bold; background: none; border: none;")
+                    value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    grid.addWidget(value_label, row, 1 + 2 * column + offset)
+                    self.metric_labels[(horizon, kind, level)] = value_label
+        self.layout.addLayout(grid)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(6)
+        self.progress_bar.hide()
+        self.layout.addWidget(self.progress_bar)
+
+        self.run_button = PrimaryButton("Run Simulation")
+        self.run_button.clicked.connect(self.run_clicked)
+        self.layout.addWidget(self.run_button)
+
+    def set_running(self):
+        self.progress_bar.setRange(0, 0)  # Busy until the first shard reports
+        self.progress_bar.show()
+        self.run_button.setEnabled(False)
+        self.status_label.setText("Simulating...")
+
+    def set_progress(self, done, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"Simulating... {done:,} / {total:,} paths")
+
+    def set_result(self, summary):
+        """
+        Args:
+            summary: horizon -> VaR / CVaR summary (see analytics.monte_carlo.summarize)
+        """
+        self.progress_bar.hide()
+        self.run_button.setEnabled(True)
+        for (horizon, kind, level), label in self.metric_labels.items():
+            value = summary.get(horizon, {}).get(kind, {}).get(level)
+            label.setText("-" if value is None else f"${value:,.0f}")
+        first = summary.get(min(summary)) if summary else None
+        if first:
+            level = min(first["var"])
+            self.value_label.setText(f"${first['var'][level]:,.0f}")
+            self.status_label.setText(f"{first['paths']:,} paths, {min(summary)}-day VaR {level:.0%} shown above")
+
+    def set_error(self, message):
+        self.progress_bar.hide()
+        self.run_button.setEnabled(True)
+        self.status_label.setText(message)
+
+
+class HoldingsTable(StyledTableView):
+    # Create a custom signal that emits the symbol of the holding to sell
     sellClicked = Signal(str)
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.setColumnCount(8)
-        self.setHorizontalHeaderLabels([
-            "ID", "Symbol", "Quantity", "Current Price",
-            "Total Value", "Total Gain", "Gain %", "Actions"
-        ])
-
-        self.setColumnWidth(0, 30)  # ID
-        self.setColumnWidth(1, 150)  # Symbol
-        self.setColumnWidth(2, 100)  # Quantity
-        self.setColumnWidth(3, 140)  # Current Price
-        self.setColumnWidth(4, 140)  # Total Value
-        self.setColumnWidth(5, 140)  # Total Gain
-        self.setColumnWidth(6, 120)  # Gain %
-        self.setColumnWidth(7, 80)  # Actions
-
-        header = self.horizontalHeader()
-        for i in range(7):
-            header.setSectionResizeMode(i, QHeaderView.Stretch)
-        header.setSectionResizeMode(7, QHeaderView.Fixed)
+        self.holdings_model = HoldingsTableModel(self)
+        self.setModel(self.holdings_model)
+
+        # The Sell button is painted and hit-tested by the delegate, not a widget per row
+        self.sell_delegate = ButtonDelegate(self, "Sell")
+        self.sell_delegate.clicked.connect(self._on_sell_clicked)
+        self.setItemDelegateForColumn(HoldingsTableModel.ACTION_COLUMN, self.sell_delegate)
+
+        # ID, Symbol, Quantity, Current Price, Total Value, Total Gain and Gain % share the width; Actions is fixed
+        widths = {column: 120 for column in range(HoldingsTableModel.ACTION_COLUMN)}
+        widths[HoldingsTableModel.ACTION_COLUMN] = 80
+        self.set_column_widths(widths, fixed_columns={HoldingsTableModel.ACTION_COLUMN})
 
         self.setMinimumHeight(400)
 
     def load_data(self, holdings):
-        self.setRowCount(len(holdings))
-        for row, holding in enumerate(holdings):
-            # ID
-            id_item = QTableWidgetItem(str(holding.Id))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.setItem(row, 0, id_item)
-
-            # Symbol
-            symbol_item = QTableWidgetItem(holding.Symbol)
-            symbol_item.setFont(QFont("Arial", 10, QFont.Bold))
-            symbol_item.setTextAlignment(Qt.AlignCenter)
-            self.setItem(row, 1, symbol_item)
-
-            # Quantity
-            quantity_item = QTableWidgetItem(str(holding.Quantity))
-            quantity_item.setTextAlignment(Qt.AlignCenter)
-            self.setItem(row, 2, quantity_item)
-
-            # Current Price
-            price_item = QTableWidgetItem(f"${holding.CurrentPrice:.2f}")
-            price_item.setTextAlignment(Qt.AlignCenter)
-            self.setItem(row, 3, price_item)
-
-            # Total Value
-            value_item = QTableWidgetItem(f"${holding.TotalValue:.2f}")
-            value_item.setTextAlignment(Qt.AlignCenter)
-            self.setItem(row, 4, value_item)
-
-            # Total Gain
-            gain_item = QTableWidgetItem(f"${holding.TotalGain:.2f}")
-            gain_item.setTextAlignment(Qt.AlignCenter)
-            if holding.TotalGain > 0:
-                gain_item.setForeground(QColor("#4CAF50"))
-            elif holding.TotalGain < 0:
-                gain_item.setForeground(QColor("#F44336"))
-            self.setItem(row, 5, gain_item)
-
-            # Gain %
-            gain_pct_item = QTableWidgetItem(f"{holding.TotalGainPercentage:.2f}%")
-            gain_pct_item.setTextAlignment(Qt.AlignCenter)
-            if holding.TotalGainPercentage > 0:
-                gain_pct_item.setForeground(QColor("#4CAF50"))
-            elif holding.TotalGainPercentage < 0:
-                gain_pct_item.setForeground(QColor("#F44336"))
-            self.setItem(row, 6, gain_pct_item)
-
-            # Sell button - connect using a lambda that captures the current holding's ID.
-            sell_button = SellButton("Sell")
-
-            sell_button.clicked.connect(partial(self.sellClicked.emit, holding.Symbol))
-            self.setCellWidget(row, 7, sell_button)
+        self.holdings_model.set_holdings(holdings)
+
+    def update_rows(self, holdings):
+        """Update only the rows of these holdings"""
+        self.holdings_model.update_holdings(holdings)
+
+    def _on_sell_clicked(self, index):
+        self.sellClicked.emit(self.holdings_model.symbol(index.row()))
 
 
 class PortfolioChart(StyledLineSeriesChart):
@@ -166,31 +239,34 @@ class PortfolioChart(StyledLineSeriesChart):
         self.baseline_series.setPen(QPen(QColor("#AAAAAA"), 1, Qt.DashLine))  # Dashed line
         self.chart.addSeries(self.baseline_series)
 
+        # Full-resolution points; only an LTTB-reduced subset is handed to the series
+        self.timestamps = np.empty(0)
+        self.values = np.empty(0)
+
+        # Re-sample once resizing settles rather than on every resize event
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(150)
+        self.resize_timer.timeout.connect(self.render_series)
+
     def load_data(self, data):
-        print(data)
         self.series.clear()
         self.baseline_series.clear()
 
         if not data or len(data) < 2:
+            self.timestamps, self.values = np.empty(0), np.empty(0)
             return
 
-        min_value = float('inf')
-        max_value = float('-inf')
-
         first_date = data[0][0]
-        last_value = data[-1][1]
         timestamp_now = datetime.datetime.now().timestamp() * 1000
 
-        # Populate the series with data points
-        for current_date, current_value in data:
-            timestamp = int(current_date.timestamp() * 1000)
-            self.series.append(timestamp, current_value)
-
-            min_value = min(min_value, current_value)
-            max_value = max(max_value, current_value)
+        # Extend the line to the current date with the last value
+        self.timestamps = np.fromiter((d.timestamp() * 1000 for d, _ in data), dtype=np.float64, count=len(data))
+        self.timestamps = np.append(self.timestamps, timestamp_now)
+        self.values = np.fromiter((v for _, v in data), dtype=np.float64, count=len(data))
+        self.values = np.append(self.values, self.values[-1])
 
-        # Extend the line to the current date
-        self.series.append(timestamp_now, last_value)
+        self.render_series()
 
         # Draw baseline at the starting value
         start_value = data[0][1]
@@ -198,16 +274,32 @@ class PortfolioChart(StyledLineSeriesChart):
         self.baseline_series.append(timestamp_now, start_value)
 
         # Set axis ranges with padding
+        min_value, max_value = float(self.values.min()), float(self.values.max())
         padding = (max_value - min_value) * 0.1
         self.axisX.setRange(first_date, datetime.datetime.now())
         self.axisY.setRange(min_value - padding, max_value + padding)
 
+    def render_series(self):
+        """Replace the series with at most one point per pixel of plot width"""
+        if not len(self.timestamps):
+            return
+        width = self.chart.plotArea().width() or self.width()
+        keep = lttb(self.timestamps, self.values,
+                    target_points(width, CHART_SETTINGS["pixels_per_point"], minimum=100))
+        # One replace() call instead of an append() (and repaint) per point
+        self.series.replace([QPointF(x, y) for x, y in zip(self.timestamps[keep], self.values[keep])])
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_timer.start()
+
 
 class DashboardView(QWidget):
     add_money_clicked = Signal()
     remove_money_clicked = Signal()
     on_period_changed = Signal(str)
     on_sell_clicked = Signal(str)
+    run_simulation_clicked = Signal()
 
     def __init__(self):
         super().__init__()
@@ -264,13 +356,21 @@ class DashboardView(QWidget):
         self.cash_balance_card = CashBalanceCard("Cash Balance", "$0", "+0%", color="#5851DB")
         self.total_gain_card = StyledStatsCard("Total Gain", "0%", "-3%", color="#4CAF50")
         self.portfolio_value_card = StyledStatsCard("Portfolio Value", "$0", "+5%", color="#4CAF50")
+        self.risk_card = RiskMetricsCard("Sharpe Ratio", "-", color="#5851DB")
 
         stats_layout.addWidget(self.cash_balance_card)
         stats_layout.addWidget(self.portfolio_value_card)
         stats_layout.addWidget(self.total_gain_card)
+        stats_layout.addWidget(self.risk_card)
 
         self.container_layout.addLayout(stats_layout)
 
+        # Monte Carlo VaR
+        self.container_layout.addSpacing(20)
+        self.simulation_card = SimulationCard("Value at Risk", "-", color="#5851DB")
+        self.simulation_card.run_clicked.connect(self.run_simulation_clicked)
+        self.container_layout.addWidget(self.simulation_card)
+
         self.cash_balance_card.add_money_btn.clicked.connect(self.add_money_clicked)
         self.cash_balance_card.remove_money_btn.clicked.connect(self.remove_money_clicked)
 
@@ -283,20 +383,62 @@ class DashboardView(QWidget):
 
         self.container_layout.addSpacing(40)
 
+        # Placeholders shown while loading, each removed as soon as its card gets its data
+        self.skeletons = {
+            "chart": SkeletonOverlay(self.chart, bar_width=1.0, fill="#FFFFFF", radius=12),
+            "cash": SkeletonOverlay(self.cash_balance_card.value_label),
+            "value": SkeletonOverlay(self.portfolio_value_card.value_label),
+            "gain": SkeletonOverlay(self.total_gain_card.value_label),
+            "risk": SkeletonOverlay(self.risk_card.value_label),
+            "holdings": SkeletonOverlay(self.holdings_table.viewport(),
+                                        row_height=self.holdings_table.verticalHeader().defaultSectionSize()),
+        }
+
+    def show_loading(self, parts=None):
+        """Show skeletons over some cards ("chart", "cash", "value", "gain", "risk", "holdings"), default all"""
+        for part in parts or self.skeletons:
+            self.skeletons[part].start()
+
     def set_holdings_data(self, holdings):
+        self.skeletons["holdings"].stop()
         self.holdings_table.load_data(holdings)
 
+    def update_holdings(self, holdings):
+        """Update the rows of the holdings that changed, leaving the others untouched"""
+        self.holdings_table.update_rows(holdings)
+
     def set_chart_data(self, data):
+        self.skeletons["chart"].stop()
         self.chart.load_data(data)
 
     def set_cash_balance(self, cash_balance):
         """Set the Cash Balance value in the UI"""
+        self.skeletons["cash"].stop()
         self.cash_balance_card.value_label.setText(f"${cash_balance:,.2f}")
 
     def set_total_value(self, total_value):
         """Set the Portfolio Value in the UI"""
+        self.skeletons["value"].stop()
         self.portfolio_value_card.value_label.setText(f"${total_value:,.2f}")
 
+    def set_risk_metrics(self, metrics):
+        """Set the risk metrics card in the UI"""
+        self.skeletons["risk"].stop()
+        self.risk_card.set_metrics(metrics)
+
+    def set_simulation_running(self):
+        self.simulation_card.set_running()
+
+    def set_simulation_progress(self, done, total):
+        self.simulation_card.set_progress(done, total)
+
+    def set_simulation_result(self, summary):
+        self.simulation_card.set_result(summary)
+
+    def set_simulation_error(self, message):
+        self.simulation_card.set_error(message)
+
     def set_total_gain(self, total_gain):
         """Set the Total Gain in the UI"""
+        self.skeletons["gain"].stop()
         self.total_gain_card.value_label.setText(f"${total_gain:.2f}")
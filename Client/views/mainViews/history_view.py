@@ -2,16 +2,18 @@ import sys
 
 sys.path.append('..')
 
+from analytics.transactions import TransactionIndex, TransactionSelection
 from components.styled_widgets import (
-    PageTitleLabel, StyledTable, ScrollableContainer,
+    PageTitleLabel, StyledTableView, ScrollableContainer,
     StyledLineEdit, StyledLabel, StyledDateEdit,
     PrimaryButton, Card, SectionTitleLabel, create_form_field,
     RoundedCard, FilterComboBox
 )
+from components.table_models import (
+    BadgeDelegate, TransactionProxyModel, TransactionTableModel, TRANSACTION_TYPE_BADGES
+)
 from PySide6.QtCore import Qt, QDateTime, Signal, QDate
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QTableWidgetItem, QSizePolicy, \
-    QScrollArea
-from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QScrollArea
 
 
 class HistoryView(QWidget):
@@ -76,20 +78,20 @@ class HistoryView(QWidget):
 
         main_layout.addWidget(self.filter_section)
 
-        # Transactions table
-        self.transactions_table = StyledTable()
-        self.transactions_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.transactions_table.setColumnCount(6)  # Date, Symbol, Type, Quantity, Price, Total
-        self.transactions_table.setHorizontalHeaderLabels(
-            ["Date", "Symbol", "Type", "Quantity", "Price", "Total"])
+        # Transactions table, served lazily from the model (Date, Symbol, Type, Quantity, Price, Total)
+        self.table_model = TransactionTableModel(parent=self)
+        self.proxy_model = TransactionProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+
+        self.transactions_table = StyledTableView()
+        self.transactions_table.setModel(self.proxy_model)
+        self.transactions_table.setItemDelegateForColumn(
+            TransactionTableModel.TYPE_COLUMN, BadgeDelegate(TRANSACTION_TYPE_BADGES, self.transactions_table))
+        self.transactions_table.setSortingEnabled(True)
+        self.transactions_table.sortByColumn(-1, Qt.AscendingOrder)  # Date order until a header is clicked
 
         # Set column widths
-        self.transactions_table.setColumnWidth(0, 100)  # Date
-        self.transactions_table.setColumnWidth(1, 100)  # Symbol
-        self.transactions_table.setColumnWidth(2, 50)  # Type
-        self.transactions_table.setColumnWidth(3, 80)  # Quantity
-        self.transactions_table.setColumnWidth(4, 80)  # Price
-        self.transactions_table.setColumnWidth(5, 100)  # Total
+        self.transactions_table.set_column_widths({0: 100, 1: 100, 2: 50, 3: 80, 4: 80, 5: 100})
 
         table_container = ScrollableContainer(self)
         table_container.layout.addWidget(self.transactions_table)
@@ -113,55 +115,15 @@ class HistoryView(QWidget):
         Display transactions in the table.
 
         Args:
-            transactions: List of transaction dictionaries
+            transactions: TransactionSelection from the model, or a list of transaction dictionaries
         """
-        print("history view data:", transactions)
-
-        self.transactions_table.setRowCount(0)  # Clear table
-
-        for i, tx in enumerate(transactions):
-            self.transactions_table.insertRow(i)
-
-            date_str = tx["date"]
-            if "T" in date_str:
-                parts = date_str.split("T")
-                date_part = parts[0]
-                # time_part = parts[1].split(".")[0] if "." in parts[1] else parts[1]
-                # tx_date_str = f"{date_part} {time_part}"
-                tx_date_str = date_part
-            else:
-                tx_date_str = date_str
-
-            self.transactions_table.setItem(i, 0, CustomTableItem(tx_date_str))
-
-            # Symbol in bold
-            self.transactions_table.setItem(i, 1, CustomTableItem(tx["symbol"]))
-            self.transactions_table.item(i, 1).setFont(QFont("Arial", 10, QFont.Bold))
-
-            # Create custom widget for transaction type (with color)
-            type_widget = QWidget()
-            type_layout = QHBoxLayout(type_widget)
-            type_layout.setContentsMargins(5, 2, 5, 2)
-
-            type_label = QLabel("Buy" if tx["type"] == 0 else "Sell")
-            type_label.setAlignment(Qt.AlignCenter)
-            type_label.setStyleSheet(f"""
-                background-color: {'#DCFCE7' if tx["type"] == 0 else '#FEE2E2'};
-                color: {'#166534' if tx["type"] == 0 else '#991B1B'};
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-weight: bold;
-            """)
-            type_layout.addWidget(type_label)
-
-            self.transactions_table.setCellWidget(i, 2, type_widget)
-            self.transactions_table.setItem(i, 3, CustomTableItem(str(tx["quantity"])))
-            self.transactions_table.setItem(i, 4, CustomTableItem(f"${tx['price']:.2f}"))
-            self.transactions_table.setItem(i, 5, CustomTableItem(f"${(tx['quantity'] * tx['price']):.2f}"))
-
-            print("history view", tx)
-
-        # self.transactions_table.resizeColumnsToContents()
+        if not isinstance(transactions, TransactionSelection):
+            index = TransactionIndex(list(transactions))
+            transactions = index.select(index.positions)
+
+        if transactions.index is not self.table_model.transactions:
+            self.table_model.set_transactions(transactions.index)
+        self.proxy_model.set_filter(transactions.positions)
 
     def show_error(self, message):
         """Display error message to user."""
@@ -169,14 +131,6 @@ class HistoryView(QWidget):
         print(f"Error: {message}")
 
 
-class CustomTableItem(QTableWidgetItem):
-    """Custom QTableWidgetItem with text alignment"""
-
-    def __init__(self, text):
-        super().__init__(text)
-        self.setTextAlignment(Qt.AlignCenter)
-
-
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication
 
@@ -3,13 +3,14 @@ import sys
 from PySide6.QtCore import Qt, Signal, QDate, QPropertyAnimation, QEasingCurve, QSize
 from PySide6.QtGui import QColor, QFont, QIcon, QDoubleValidator, QPalette, QLinearGradient, QGradient
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QDateEdit, QFrame, QSplitter, QScrollArea, QGridLayout,
-    QGraphicsDropShadowEffect, QSizePolicy, QSpacerItem, QMainWindow
+    QGraphicsDropShadowEffect, QSizePolicy, QSpacerItem, QMainWindow, QCheckBox, QProgressBar
 )
-from components.chart import StockChartWidget
+from analytics.backtest import STRATEGIES
+from components.chart import StockChartWidget, OVERLAYS
 from components.styled_widgets import (
-    StyledLabel, StyledButton, StyledLineEdit, StyledDateEdit,
+    StyledLabel, StyledButton, StyledLineEdit, StyledDateEdit, StyledComboBox,
     PrimaryButton, Card, RoundedCard, GradientCard, ScrollableContainer,
     BuyToggleButton, SellToggleButton, PageTitleLabel, SectionTitleLabel,
     apply_shadow_effect, create_form_field, StyledChartView, StyledLineSeriesChart,
@@ -44,23 +45,35 @@ class StockChart(RoundedCard):
         
         # Add to layout
         chart_layout.addWidget(self.stock_chart_widget)
+        layout.addLayout(self.create_overlay_toggles())
         layout.addWidget(self.chart_container)
 
+    def create_overlay_toggles(self):
+        """Row of checkboxes that switch indicator overlays on and off"""
+        toggles = QHBoxLayout()
+        toggles.setSpacing(12)
+        for name, spec in OVERLAYS.items():
+            checkbox = QCheckBox(spec["label"])
+            checkbox.setStyleSheet("QCheckBox { color: #64748B; font-size: 12px; }")
+            checkbox.setChecked(name in self.stock_chart_widget.active_overlays)
+            checkbox.toggled.connect(lambda checked, n=name: self.stock_chart_widget.set_overlay(n, checked))
+            toggles.addWidget(checkbox)
+        toggles.addStretch()
+        return toggles
+
     def update_chart(self, ticker, start_date, end_date, data):
         """Update chart with new stock data"""
-        # Clear any existing chart first
-        self.stock_chart_widget.clear_chart()
-        
-        # Delay slightly to ensure the chart is properly cleared
-        QApplication.processEvents()
-        
-        # Now update with new data
+        # The chart widget diffs against what it already shows, so no clear is needed
         self.stock_chart_widget.update_chart(ticker, start_date, end_date, data)
         
         # Force a layout update
         self.chart_container.layout().activate()
         self.layout().activate()
 
+    def apply_tick(self, price, timestamp):
+        """Update the last bar with a live trade"""
+        self.stock_chart_widget.apply_tick(price, timestamp)
+
     def clear_chart(self):
         """Clear chart data"""
         self.stock_chart_widget.clear_chart()
@@ -72,6 +85,8 @@ class StockView(QWidget):
     search_stock_requested = Signal(str, QDate, QDate)
     buy_stock_requested = Signal(str, float)
     sell_stock_requested = Signal(str, float)
+    backtest_requested = Signal(str)  # Strategy name
+    sweep_requested = Signal(str, list)  # Strategy name, tickers
     current_ticker=None
 
     def __init__(self, parent=None):
@@ -181,6 +196,7 @@ class StockView(QWidget):
         content_layout.addLayout(right_content, 2)
 
         stock_info_layout.addLayout(content_layout)
+        stock_info_layout.addWidget(self._create_backtest_panel())
 
         # Add stock info section to content layout
         self.content_layout.addWidget(self.stock_info_section)
@@ -217,6 +233,49 @@ class StockView(QWidget):
 
         return stock_header_card
 
+    def _create_backtest_panel(self):
+        """Create the panel that backtests a strategy on the chart or sweeps its parameters"""
+        backtest_panel = RoundedCard(parent=None, border_radius=16, shadow_enabled=True)
+
+        backtest_layout = QVBoxLayout(backtest_panel)
+        backtest_layout.setContentsMargins(25, 20, 25, 20)
+        backtest_layout.setSpacing(12)
+
+        backtest_header = SectionTitleLabel("Backtest", parent=backtest_panel)
+
+        controls = QHBoxLayout()
+        controls.setSpacing(10)
+
+        self.strategy_selector = StyledComboBox(parent=backtest_panel)
+        for name, strategy in STRATEGIES.items():
+            self.strategy_selector.addItem(strategy.label, name)
+
+        self.sweep_tickers_input = StyledLineEdit(placeholder="Sweep tickers, e.g. AAPL, MSFT (default: current)",
+                                                  parent=backtest_panel)
+
+        self.backtest_button = PrimaryButton("Backtest", parent=backtest_panel)
+        self.sweep_button = PrimaryButton("Sweep Parameters", parent=backtest_panel)
+
+        controls.addWidget(self.strategy_selector, 2)
+        controls.addWidget(self.sweep_tickers_input, 3)
+        controls.addWidget(self.backtest_button, 1)
+        controls.addWidget(self.sweep_button, 1)
+
+        self.backtest_progress = QProgressBar(backtest_panel)
+        self.backtest_progress.setTextVisible(False)
+        self.backtest_progress.setFixedHeight(6)
+        self.backtest_progress.hide()
+
+        self.backtest_result = DescriptionLabel("Run a strategy to mark its trades on the chart", size=13,
+                                                parent=backtest_panel)
+
+        backtest_layout.addWidget(backtest_header)
+        backtest_layout.addLayout(controls)
+        backtest_layout.addWidget(self.backtest_progress)
+        backtest_layout.addWidget(self.backtest_result)
+
+        return backtest_panel
+
     def _create_order_panel(self):
         """Create the order panel for buying/selling stocks"""
         order_panel = RoundedCard(parent=None, border_radius=16, shadow_enabled=True)
@@ -374,6 +433,10 @@ class StockView(QWidget):
         # Action button
         self.action_button.clicked.connect(self.on_action_button_clicked)
 
+        # Backtesting
+        self.backtest_button.clicked.connect(self.on_backtest)
+        self.sweep_button.clicked.connect(self.on_sweep)
+
     def on_search(self):
         """Handle search button click"""
         self.current_ticker = self.symbol_input.text().strip().upper()
@@ -417,6 +480,44 @@ class StockView(QWidget):
         except (ValueError, AttributeError):
             pass  # Handle error in presenter
 
+    def on_backtest(self):
+        """Handle backtest button click"""
+        self.backtest_requested.emit(self.strategy_selector.currentData())
+
+    def on_sweep(self):
+        """Handle sweep button click; sweeps the listed tickers, or the current one"""
+        tickers = [t.strip().upper() for t in self.sweep_tickers_input.text().split(",") if t.strip()]
+        if not tickers and self.current_ticker:
+            tickers = [self.current_ticker]
+        self.sweep_requested.emit(self.strategy_selector.currentData(), tickers)
+
+    def show_backtest_result(self, result, label=None):
+        """Mark a backtest's trades on the chart and summarize its statistics"""
+        self.chart.stock_chart_widget.set_trade_markers(result["trades"])
+        stats = result["stats"]
+        params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+        self.backtest_result.setText(
+            f"{label or STRATEGIES[result['strategy']].label} ({params}): "
+            f"return {stats['total_return']:.1%}, CAGR {stats['cagr']:.1%}, Sharpe {stats['sharpe']:.2f}, "
+            f"max drawdown {stats['max_drawdown']:.1%}, {stats['trades']:.0f} trades, "
+            f"win rate {stats['win_rate']:.0%}")
+
+    def show_backtest_summary(self, text):
+        self.backtest_result.setText(text)
+
+    def set_backtest_running(self, running):
+        self.backtest_button.setEnabled(not running)
+        self.sweep_button.setEnabled(not running)
+        self.backtest_progress.setVisible(running)
+        if running:
+            self.backtest_progress.setRange(0, 0)
+            self.backtest_result.setText("Sweeping parameters...")
+
+    def set_backtest_progress(self, done, total):
+        self.backtest_progress.setRange(0, total)
+        self.backtest_progress.setValue(done)
+        self.backtest_result.setText(f"Sweeping parameters... {done} / {total} tasks")
+
     def update_stock_data(self, symbol, start_date, end_date, stock_data):
         """Update stock information in the UI"""
         # Update stock header
@@ -443,6 +544,13 @@ class StockView(QWidget):
             self.price_value.setText(f"${stock_data['price']:.2f}")
             self.update_total_value()
 
+    def apply_quote(self, quote, update_chart=True):
+        """Show a live quote of the displayed stock as its market price, and on the chart's last bar"""
+        self.price_value.setText(f"${quote.price:.2f}")
+        self.update_total_value()
+        if update_chart:
+            self.chart.apply_tick(quote.price, quote.timestamp)
+
     def show_message(self, message, is_error=False):
         """Display a message to the user"""
         from PySide6.QtWidgets import QMessageBox
@@ -16,6 +16,8 @@ from presenters.mainPresenters.dashboard_presenter import DashboardPresenter
 from presenters.mainPresenters.history_presenter import HistoryPresenter
 from presenters.mainPresenters.stock_presenter import StockPresenter
 from presenters.mainPresenters.chatbot_presenter import ChatbotPresenter
+from presenters.presenter_registry import PresenterRegistry
+from analytics.positions import PositionBook
 
 from views.mainViews.dashboard_view import DashboardView
 from views.mainViews.history_view import HistoryView
@@ -199,6 +201,18 @@ class Main_view(QMainWindow):
 
         self.sell_requested.connect(self.open_sell_window)
 
+        # Each page's presenter is created on its first visit and reused for the rest of the session
+        self.presenters = PresenterRegistry()
+        self.presenters.register("dashboard", self._create_dashboard_presenter)
+        self.presenters.register("stocks", lambda user_id: StockPresenter(StockModel(), self.stock_widget, user_id))
+        self.presenters.register("history",
+                                 lambda user_id: HistoryPresenter(HistoryModel(), self.history_widget, user_id))
+        self.presenters.register("chatbot",
+                                 lambda user_id: ChatbotPresenter(ChatbotModel(), self.chatbot_widget, user_id))
+
+        # A trade changes the transaction history; reload it on the next visit
+        PositionBook.instance().subscribe(self._on_positions_changed)
+
         # Add widgets to stack
         self.content_stack.addWidget(self.dashboard_widget)
         self.content_stack.addWidget(self.stock_widget)
@@ -232,30 +246,39 @@ class Main_view(QMainWindow):
     def set_user(self, user_id):
         """Initialize the dashboard only when user_id is available"""
         self.user_id = user_id
+        self.presenters.start_session(user_id)
         self.show_dashboard()  # Now that the user is set, show dashboard
 
+    def _create_dashboard_presenter(self, user_id):
+        presenter = DashboardPresenter(DashboardModel(), self.dashboard_widget, user_id)
+        presenter.move_to_sell_signal.connect(self.sell_requested)
+        return presenter
+
+    def _on_positions_changed(self):
+        """Called by the position book, possibly off the GUI thread"""
+        self.presenters.invalidate("history")
+
     def show_dashboard(self):
         """Show the dashboard screen"""
-        self.dashboard_presenter = DashboardPresenter(DashboardModel(), self.dashboard_widget, self.user_id)
+        self.dashboard_presenter = self.presenters.show("dashboard")
         self.content_stack.setCurrentWidget(self.dashboard_widget)
         self.sidebar.set_active_button("dashboard")
-        self.dashboard_presenter.move_to_sell_signal.connect(self.sell_requested)
 
     def show_stocks(self):
         """Show the stocks screen"""
-        self.stock_presenter = StockPresenter(StockModel(), self.stock_widget, self.user_id)
+        self.stock_presenter = self.presenters.show("stocks")
         self.content_stack.setCurrentWidget(self.stock_widget)
         self.sidebar.set_active_button("stocks")
 
     def show_history(self):
         """Show the history screen"""
-        self.history_presenter = HistoryPresenter(HistoryModel(), self.history_widget, self.user_id)
+        self.history_presenter = self.presenters.show("history")
         self.content_stack.setCurrentWidget(self.history_widget)
         self.sidebar.set_active_button("history")
 
     def show_chatbot(self):
         """Show the chatbot screen"""
-        self.chatbot_presenter = ChatbotPresenter(ChatbotModel(), self.chatbot_widget, self.user_id)
+        self.chatbot_presenter = self.presenters.show("chatbot")
         self.content_stack.setCurrentWidget(self.chatbot_widget)
         self.chatbot_widget.wellcome_message()
         self.sidebar.set_active_button("chatbot")
@@ -6,6 +6,7 @@ using Server.Models;
 using Server.Models.DTOs.Queries;
 using System;
 using System.IO;
+using System.Security.Cryptography;
 using System.Threading.Tasks;
 
 namespace Server.Controllers.Queries;
@@ -37,8 +38,12 @@ public class AIController : ControllerBase
         _llmService = llmService;
     }
 
+    /// <summary>
+    /// Embeds the configured PDF into the vector database if it has not been embedded yet.
+    /// </summary>
+    /// <param name="reindex">Drop the existing embeddings first, for when the document changed</param>
     [HttpPost("process-pdf")]
-    public async Task<IActionResult> ProcessPdf()
+    public async Task<IActionResult> ProcessPdf([FromQuery] bool reindex = false)
     {
         try
         {
@@ -55,6 +60,13 @@ public class AIController : ControllerBase
             // Check if collection exists
             bool collectionExists = await _vectorDbService.CollectionExistsAsync();
 
+            if (reindex && collectionExists)
+            {
+                _logger.LogInformation("Reindex requested. Dropping existing embeddings.");
+                await _vectorDbService.DeleteCollectionAsync();
+                collectionExists = false;
+            }
+
             if (!collectionExists)
             {
                 await _vectorDbService.CreateCollectionAsync();
@@ -88,6 +100,39 @@ public class AIController : ControllerBase
         }
     }
 
+    /// <summary>
+    /// Fingerprint of the configured PDF (PdfEmbedding:PdfFileName), so clients can tell
+    /// whether it changed since they last asked for it to be processed.
+    /// </summary>
+    [HttpGet("document")]
+    public async Task<IActionResult> GetDocumentFingerprint()
+    {
+        try
+        {
+            string pdfPath = GetPdfFilePath();
+
+            if (!System.IO.File.Exists(pdfPath))
+            {
+                return NotFound(new { message = $"PDF file not found at: {pdfPath}" });
+            }
+
+            await using var stream = System.IO.File.OpenRead(pdfPath);
+            byte[] hash = await SHA256.HashDataAsync(stream);
+
+            return Ok(new
+            {
+                fileName = _options.PdfFileName,
+                size = stream.Length,
+                sha256 = Convert.ToHexString(hash).ToLowerInvariant()
+            });
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error fingerprinting PDF");
+            return StatusCode(500, new { message = $"Error fingerprinting PDF: {ex.Message}" });
+        }
+    }
+
     private async Task ProcessAndStoreEmbeddings(string pdfPath)
     {
         string text = _pdfProcessor.ExtractTextFromPdf(pdfPath);
@@ -104,14 +104,25 @@ public class TradingQueryController : ControllerBase
 
     /// <summary>
     /// Get all trade history for a specific user.
+    /// When <paramref name="since"/> is given, only trades on or after that date are returned
+    /// (an empty list is a valid answer), so clients can sync incrementally.
+    /// Each trade carries its log Id, which clients use to tell identical trades apart.
     /// </summary>
     [HttpGet("trades/{userId}")]
-    public async Task<ActionResult<List<TradingDto>>> GetUserTrades(int userId)
+    public async Task<ActionResult<List<TradingDto>>> GetUserTrades(int userId, [FromQuery] DateTime? since = null)
     {
-        var trades = await _context.Logs
-            .Where(t => t.UserId == userId)
+        var query = _context.Logs.Where(t => t.UserId == userId);
+        if (since.HasValue)
+        {
+            query = query.Where(t => t.Date >= since.Value);
+        }
+
+        var trades = await query
+            .OrderBy(t => t.Date)
+            .ThenBy(t => t.Id)
             .Select(t => new TradingDto
             {
+                Id = t.Id,
                 Symbol = t.Symbol,
                 Date = t.Date,
                 Type = t.Type,
@@ -120,7 +131,7 @@ public class TradingQueryController : ControllerBase
             })
             .ToListAsync();
 
-        if (!trades.Any())
+        if (!trades.Any() && !since.HasValue)
         {
             return NotFound(new { message = "No trades found for this user." });
         }
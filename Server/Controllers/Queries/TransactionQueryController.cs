@@ -87,5 +87,39 @@ namespace Server.Controllers.Queries
                 return StatusCode(500, new { message = "An internal error occurred.", error = ex.Message });
             }
         }
+
+        /// <summary>
+        /// Gets only the daily bars for a given ticker symbol and date range, without metadata, logo or current price.
+        /// A range without bars (weekends, holidays) returns an empty results list; a failed upstream request returns 502.
+        /// </summary>
+        /// <param name="ticker">The ticker symbol</param>
+        /// <param name="startDate">The start date of the date range</param>
+        /// <param name="endDate">The end date of the date range</param>
+        /// <returns>The aggregate data for the given ticker symbol and date range</returns>
+        [HttpGet("getAggregates")]
+        public async Task<IActionResult> GetAggregates([FromQuery] string ticker, [FromQuery] string startDate, [FromQuery] string endDate)
+        {
+            if (string.IsNullOrWhiteSpace(ticker) || string.IsNullOrWhiteSpace(startDate) || string.IsNullOrWhiteSpace(endDate))
+            {
+                return BadRequest(new { message = "Ticker, startDate, and endDate are required." });
+            }
+
+            try
+            {
+                var aggregateData = await _polygonGateway.GetDailyBarsAsync(ticker, startDate, endDate);
+
+                if (aggregateData == null)
+                {
+                    return StatusCode(502, new { message = $"Failed to fetch bars for ticker '{ticker}'." });
+                }
+
+                return Content(aggregateData.ToString(Newtonsoft.Json.Formatting.None), "application/json");
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error in GetAggregates for ticker: {Ticker}", ticker);
+                return StatusCode(500, new { message = "An internal error occurred.", error = ex.Message });
+            }
+        }
     }
 }
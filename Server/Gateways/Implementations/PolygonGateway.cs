@@ -38,6 +38,16 @@ namespace Server.Gateways.Implementations
             return json;
         }
 
+        public async Task<JObject?> GetDailyBarsAsync(string ticker, string startDate, string endDate)
+        {
+            var endpoint = $"/v2/aggs/ticker/{ticker}/range/1/day/{startDate}/{endDate}?apiKey={_polygonApiKey}";
+            var response = await SendRequestAsync(endpoint);
+
+            if (string.IsNullOrEmpty(response)) return null;
+
+            return JObject.Parse(response);
+        }
+
         public async Task<decimal?> GetSellPriceAsync(string ticker)
         {
             var endpoint = $"/v2/aggs/ticker/{ticker}/prev?adjusted=true&apiKey={_polygonApiKey}";
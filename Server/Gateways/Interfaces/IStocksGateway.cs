@@ -14,6 +14,16 @@ namespace Server.Gateways.Interfaces
         /// <returns>A JSON string containing the aggregate data for the given ticker symbol</returns>
         Task<JObject> GetAggregateDataAsync(string ticker, string startDate, string endDate);
 
+        /// <summary>
+        /// This method fetches the daily bars for the given ticker symbol from the Polygon API.
+        /// Unlike GetAggregateDataAsync, a range without bars is not treated as a failure.
+        /// </summary>
+        /// <param name="ticker">The stock ticker symbol</param>
+        /// <param name="startDate">The start date for the data range</param>
+        /// <param name="endDate">The end date for the data range</param>
+        /// <returns>The aggregate data (with no results when the range has no bars), or null if the request failed</returns>
+        Task<JObject?> GetDailyBarsAsync(string ticker, string startDate, string endDate);
+
         /// <summary>
         /// This method fetches the closing price for the given ticker symbol on a specific date.
         /// </summary>
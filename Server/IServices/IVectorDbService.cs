@@ -7,6 +7,7 @@ public interface IVectorDbService
 {
     Task<bool> CollectionExistsAsync();
     Task CreateCollectionAsync();
+    Task DeleteCollectionAsync();
     Task StoreEmbeddingsAsync(List<string> chunks);
     Task<List<string>> SearchSimilarTextAsync(string query);
     Task<bool> HasEmbeddingsAsync();
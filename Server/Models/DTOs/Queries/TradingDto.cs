@@ -5,6 +5,7 @@ namespace Server.Models.DTOs.Queries;
 
 public class TradingDto
 {
+    public int Id { get; set; }
     public required string Symbol { get; set; }
     public required DateTime Date { get; set; }
     public Enums.historyType Type { get; set; }
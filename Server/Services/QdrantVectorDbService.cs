@@ -67,6 +67,17 @@ public class QdrantVectorDbService : IVectorDbService
         _logger.LogInformation("Collection created successfully");
     }
 
+    public async Task DeleteCollectionAsync()
+    {
+        _logger.LogInformation("Deleting Qdrant collection...");
+
+        var response = await _httpClient.DeleteAsync(
+            $"http://{_options.QdrantHost}:{_options.QdrantPort}/collections/{_options.CollectionName}");
+
+        response.EnsureSuccessStatusCode();
+        _logger.LogInformation("Collection deleted successfully");
+    }
+
     public async Task<bool> HasEmbeddingsAsync()
     {
         try